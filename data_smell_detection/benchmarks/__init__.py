@@ -0,0 +1,5 @@
+"""
+Benchmarks for the data smell detection library. This package is not
+installed with the library. Run the benchmarks from the data_smell_detection
+directory (e.g. ``python -m benchmarks.micro``).
+"""
@@ -0,0 +1,180 @@
+"""
+Generators for synthetic columns which contain a data smell at a controlled
+rate.
+
+Each generator returns the column and a boolean mask which marks the rows in
+which a faulty value was injected. Clean and faulty values are drawn from
+pools of at most `cardinality` distinct values each.
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from datasmelldetection.core.datasmells import DataSmellType
+
+ColumnGenerator = Callable[[int, float, int, np.random.Generator], Tuple[pd.Series, np.ndarray]]
+
+
+# Draw `rows` values from the clean pool and replace a `smell_rate` fraction
+# of them by values of the faulty pool.
+def _inject(
+        clean_pool: np.ndarray,
+        faulty_pool: np.ndarray,
+        rows: int,
+        smell_rate: float,
+        rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    mask: np.ndarray = rng.random(rows) < smell_rate
+    values: np.ndarray = clean_pool[rng.integers(0, len(clean_pool), rows)]
+    faulty_count = int(mask.sum())
+    if faulty_count > 0:
+        values[mask] = faulty_pool[rng.integers(0, len(faulty_pool), faulty_count)]
+    return values, mask
+
+
+@dataclass(frozen=True)
+class SmellValues:
+    """
+    The clean and faulty values of a data smell as functions of integer
+    identifiers (e.g. row numbers). Distinct identifiers yield distinct
+    values. The definitions are shared by the column generators and the
+    dataset generator (see :mod:`benchmarks.generate`).
+    """
+
+    clean: Callable[[np.ndarray], np.ndarray]
+    """Returns a clean value for each identifier."""  # pylint: disable=W0105
+
+    faulty: Callable[[np.ndarray], np.ndarray]
+    """Returns a faulty value for each identifier."""  # pylint: disable=W0105
+
+
+def _format(template: str) -> Callable[[np.ndarray], np.ndarray]:
+    def format_values(identifiers: np.ndarray) -> np.ndarray:
+        return np.array([template.format(x) for x in identifiers.tolist()], dtype=object)
+    return format_values
+
+
+def _add_quarter(identifiers: np.ndarray) -> np.ndarray:
+    return identifiers + 0.25
+
+
+def _to_float(identifiers: np.ndarray) -> np.ndarray:
+    return identifiers.astype(np.float64)
+
+
+SMELL_VALUES: Dict[DataSmellType, SmellValues] = {
+    # "Value 1" contains a single capitalized word which is not flagged while
+    # "vALUE 1" is in mixed case.
+    DataSmellType.CASING_SMELL: SmellValues(_format("Value {}"), _format("vALUE {}")),
+    DataSmellType.INTEGER_AS_STRING_SMELL: SmellValues(_format("item{}"), _format("{}")),
+    DataSmellType.FLOATING_POINT_NUMBER_AS_STRING_SMELL: SmellValues(_format("item{}"), _format("{}.5")),
+    # Faulty values contain a word which exceeds the default length threshold
+    # of 30 characters.
+    DataSmellType.LONG_DATA_VALUE_SMELL: SmellValues(_format("word{}"), _format("x" * 40 + "{}")),
+    DataSmellType.INTEGER_AS_FLOATING_POINT_NUMBER_SMELL: SmellValues(_add_quarter, _to_float),
+}
+"""The values of the data smells whose values are derived from identifiers."""  # pylint: disable=W0105
+
+
+# Inject the values of a data smell using `cardinality` identifiers.
+def _inject_smell_values(
+        data_smell_type: DataSmellType,
+        rows: int,
+        smell_rate: float,
+        cardinality: int,
+        rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    identifiers = np.arange(max(1, cardinality), dtype=np.int64)
+    values = SMELL_VALUES[data_smell_type]
+    return _inject(values.clean(identifiers), values.faulty(identifiers), rows, smell_rate, rng)
+
+
+def generate_casing_column(rows, smell_rate, cardinality, rng):
+    return _inject_smell_values(DataSmellType.CASING_SMELL, rows, smell_rate, cardinality, rng)
+
+
+def generate_suspect_sign_column(rows, smell_rate, cardinality, rng):
+    # The majority of the values is positive. The rate should be lower than
+    # the percentile threshold (0.25 by default) to detect the negative
+    # values.
+    pool = np.round(rng.uniform(1.0, 1000.0, max(1, cardinality)), 2)
+    return _inject(pool, -pool, rows, smell_rate, rng)
+
+
+def generate_integer_as_string_column(rows, smell_rate, cardinality, rng):
+    return _inject_smell_values(DataSmellType.INTEGER_AS_STRING_SMELL, rows, smell_rate, cardinality, rng)
+
+
+def generate_floating_point_number_as_string_column(rows, smell_rate, cardinality, rng):
+    return _inject_smell_values(
+        DataSmellType.FLOATING_POINT_NUMBER_AS_STRING_SMELL, rows, smell_rate, cardinality, rng
+    )
+
+
+def generate_integer_as_floating_point_number_column(rows, smell_rate, cardinality, rng):
+    return _inject_smell_values(
+        DataSmellType.INTEGER_AS_FLOATING_POINT_NUMBER_SMELL, rows, smell_rate, cardinality, rng
+    )
+
+
+def generate_long_data_value_column(rows, smell_rate, cardinality, rng):
+    return _inject_smell_values(DataSmellType.LONG_DATA_VALUE_SMELL, rows, smell_rate, cardinality, rng)
+
+
+def generate_extreme_value_column(rows, smell_rate, cardinality, rng):
+    # Values far outside of a standard normal distribution. The z-scores of
+    # the faulty values only exceed the default threshold of 3 for small
+    # rates.
+    pool = rng.standard_normal(max(1, cardinality))
+    return _inject(pool, pool + 100.0, rows, smell_rate, rng)
+
+
+def generate_duplicated_value_column(rows, smell_rate, cardinality, rng):
+    # Clean values are unique. Faulty rows share `cardinality` values and are
+    # therefore duplicated if more rows than values are drawn.
+    values = np.arange(rows, dtype=np.int64) + max(1, cardinality)
+    mask = rng.random(rows) < smell_rate
+    faulty_count = int(mask.sum())
+    values[mask] = rng.integers(0, max(1, cardinality), faulty_count)
+    return pd.Series(values), pd.Series(values).duplicated(keep=False).to_numpy()
+
+
+def generate_missing_value_column(rows, smell_rate, cardinality, rng):
+    pool = rng.standard_normal(max(1, cardinality))
+    return _inject(pool, np.array([np.nan]), rows, smell_rate, rng)
+
+
+COLUMN_GENERATORS: Dict[DataSmellType, ColumnGenerator] = {
+    DataSmellType.CASING_SMELL: generate_casing_column,
+    DataSmellType.SUSPECT_SIGN_SMELL: generate_suspect_sign_column,
+    DataSmellType.INTEGER_AS_STRING_SMELL: generate_integer_as_string_column,
+    DataSmellType.FLOATING_POINT_NUMBER_AS_STRING_SMELL: generate_floating_point_number_as_string_column,
+    DataSmellType.INTEGER_AS_FLOATING_POINT_NUMBER_SMELL: generate_integer_as_floating_point_number_column,
+    DataSmellType.LONG_DATA_VALUE_SMELL: generate_long_data_value_column,
+    DataSmellType.EXTREME_VALUE_SMELL: generate_extreme_value_column,
+    DataSmellType.DUPLICATED_VALUE_SMELL: generate_duplicated_value_column,
+    DataSmellType.MISSING_VALUE_SMELL: generate_missing_value_column,
+}
+"""The column generator for each data smell type which can be benchmarked."""
+
+
+def generate_column(
+        data_smell_type: DataSmellType,
+        rows: int,
+        smell_rate: float,
+        cardinality: int,
+        seed: int = 0
+) -> Tuple[pd.Series, np.ndarray]:
+    """
+    :param data_smell_type: The data smell to inject.
+    :param rows: The number of rows of the column.
+    :param smell_rate: The probability of a row to contain a faulty value.
+    :param cardinality: The maximum number of distinct clean and faulty
+        values.
+    :param seed: The seed of the random number generator.
+    :return: The column and the mask of rows with injected faulty values.
+    """
+    values, mask = COLUMN_GENERATORS[data_smell_type](rows, smell_rate, cardinality, np.random.default_rng(seed))
+    return pd.Series(values), np.asarray(mask)
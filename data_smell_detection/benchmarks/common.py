@@ -0,0 +1,147 @@
+"""Utilities which are shared by the benchmarks."""
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.validator import Validator
+
+# Re-exported for the benchmarks
+from datasmelldetection.detectors.great_expectations.report import get_peak_rss  # noqa: F401
+
+
+def build_validator(dataframe: pd.DataFrame) -> Validator:
+    """
+    :param dataframe: The data to validate.
+    :return: A validator which validates the in-memory data frame without a
+        data context.
+    """
+    return Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=dataframe)]
+    )
+
+
+def measure_wall_time(function: Callable[[], Any], repeat: int) -> List[float]:
+    """
+    :param function: The function to measure.
+    :param repeat: The number of calls.
+    :return: The wall clock time in seconds of each call.
+    """
+    wall_times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        wall_times.append(time.perf_counter() - start)
+    return wall_times
+
+
+def measure_peak_memory(function: Callable[[], Any]) -> int:
+    """
+    Call a function once while tracing memory allocations. Tracing slows down
+    the function, so timings should be measured separately.
+
+    :param function: The function to measure.
+    :return: The peak size in bytes of the memory blocks allocated by the
+        function.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.clear_traces()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return peak
+
+
+def get_environment() -> Dict[str, Any]:
+    """
+    :return: Information about the machine and the library versions which
+        is stored along with benchmark results.
+    """
+    import great_expectations
+    import numpy
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "numpy": numpy.__version__,
+        "pandas": pd.__version__,
+        "great_expectations": great_expectations.__version__
+    }
+
+
+def save_results(path: str, results: List[Dict[str, Any]]):
+    """
+    :param path: The JSON file to write.
+    :param results: The benchmark results (one dictionary per case).
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"environment": get_environment(), "results": results}, file, indent=2)
+
+
+def load_results(path: str) -> List[Dict[str, Any]]:
+    """
+    :param path: A JSON file which was written by :func:`save_results`.
+    :return: The stored benchmark results.
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+@dataclass
+class Comparison:
+    """The comparison of a benchmark case with its baseline."""
+
+    key: Tuple[Any, ...]
+    """The values which identify the benchmark case."""
+
+    baseline: float
+    """The metric value of the baseline."""
+
+    current: float
+    """The metric value of the current run."""
+
+    @property
+    def ratio(self) -> float:
+        """The current value relative to the baseline value."""
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+
+def compare_results(
+        results: List[Dict[str, Any]],
+        baseline: List[Dict[str, Any]],
+        key_fields: Tuple[str, ...],
+        metric: str
+) -> List[Comparison]:
+    """
+    :param results: The current benchmark results.
+    :param baseline: The stored benchmark results.
+    :param key_fields: The fields which identify a benchmark case.
+    :param metric: The field to compare.
+    :return: A comparison for each case which is present in both results.
+    """
+    baseline_by_key: Dict[Tuple[Any, ...], Dict[str, Any]] = {
+        tuple(x[field] for field in key_fields): x for x in baseline
+    }
+    comparisons: List[Comparison] = []
+    for result in results:
+        key = tuple(result[field] for field in key_fields)
+        baseline_result: Optional[Dict[str, Any]] = baseline_by_key.get(key)
+        if baseline_result is not None:
+            comparisons.append(Comparison(key, baseline_result[metric], result[metric]))
+    return comparisons
+
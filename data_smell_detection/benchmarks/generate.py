@@ -0,0 +1,488 @@
+"""
+Generator for large synthetic datasets with injected data smells.
+
+Each column contains one data smell type which is injected at a known rate.
+The values are chosen such that no other data smell which the default
+registry checks for the column type is present. The expected
+:attr:`~datasmelldetection.core.detector.DetectionStatistics.faulty_element_count`
+of each column is therefore known exactly and stored in a manifest next to
+the dataset. The counts assume that detection uses
+:data:`DATA_SMELL_CONFIGURATION`, i.e. the default parameters of the
+expectations apart from mostly=1. With the default `mostly` values, the
+expectations succeed for low smell rates and no detection results are
+reported. The dataset is written chunk by chunk so that the memory usage
+does not depend on the number of rows.
+
+Usage (from the data_smell_detection directory)::
+
+    python -m benchmarks.generate dataset.csv --rows 1000000 --columns 18
+"""
+import argparse
+import json
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Type
+
+import numpy as np
+import pandas as pd
+
+from datasmelldetection.core.datasmells import DataSmellType
+
+from .columns import SMELL_VALUES
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover (Parquet output is optional)
+    pyarrow = None  # type: ignore
+
+# The number of faulty rows and values which are stored in the manifest.
+_FIRST_INJECTED_COUNT = 20
+# Keep a distance to the default thresholds of the expectations to ensure
+# that rounding cannot change the detection results.
+_SAFETY_MARGIN = 0.01
+# The default z-score threshold of the Extreme Value Smell
+_Z_SCORE_THRESHOLD = 3.0
+
+
+class ColumnInjector(ABC):
+    """
+    Generates the values of a column chunk by chunk and counts the injected
+    faulty values. Subclasses define the clean and faulty values.
+    """
+
+    data_smell_type: DataSmellType
+
+    def __init__(self, name: str, smell_rate: float, rng: np.random.Generator):
+        """
+        :param name: The column name.
+        :param smell_rate: The probability of a row to contain a faulty value.
+        :param rng: The random number generator of the column.
+        """
+        self.name = name
+        self.smell_rate = smell_rate
+        self.rng = rng
+        # The mask is drawn from a separate stream. Otherwise, the values
+        # would depend on the chunk size since the draws of the mask and of
+        # the values would interleave differently.
+        self._mask_rng = np.random.default_rng(rng.integers(0, 2 ** 63))
+        self.row_count = 0
+        self.injected_count = 0
+        self.first_injected_rows: List[int] = []
+        self.first_injected_values: List[Any] = []
+
+    def next_chunk(self, rows: int) -> np.ndarray:
+        """
+        :param rows: The number of rows of the chunk.
+        :return: The values of the chunk.
+        """
+        mask: np.ndarray = self._mask_rng.random(rows) < self.smell_rate
+        # Row 0 must be clean for subclasses which derive faulty values from
+        # previous rows.
+        if self.row_count == 0 and rows > 0:
+            mask[0] = False
+        row_numbers = np.arange(self.row_count, self.row_count + rows, dtype=np.int64)
+        values = self._generate(row_numbers, mask)
+
+        missing = _FIRST_INJECTED_COUNT - len(self.first_injected_rows)
+        if missing > 0:
+            positions = np.flatnonzero(mask)[:missing]
+            self.first_injected_rows.extend(int(x) for x in row_numbers[positions])
+            self.first_injected_values.extend(_to_json_value(x) for x in values[positions])
+
+        self._update(values, mask)
+        self.injected_count += int(mask.sum())
+        self.row_count += rows
+        return values
+
+    def get_faulty_count(self) -> int:
+        """
+        :return: The number of values which the expectation of the data smell
+            reports as faulty. Raises a ValueError if the count cannot be
+            guaranteed for the generated data (e.g. if the smell rate is too
+            high).
+        """
+        return self.injected_count
+
+    @abstractmethod
+    def _generate(self, row_numbers: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        :param row_numbers: The row numbers of the chunk.
+        :param mask: True for the rows which must contain a faulty value.
+        :return: The values of the chunk.
+        """
+        pass
+
+    # Update statistics which are required by get_faulty_count().
+    def _update(self, values: np.ndarray, mask: np.ndarray):
+        pass
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, (np.floating, float)):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+# Streaming statistics of the non-missing values of a numeric column.
+class _ValueStatistics:
+    def __init__(self):
+        self.count = 0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self._sum = 0.0
+        self._sum_of_squares = 0.0
+
+    def update(self, values: np.ndarray):
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        self._sum += float(values.sum())
+        self._sum_of_squares += float(np.square(values).sum())
+
+    # Return the absolute z-score of a value. Like the Extreme Value Smell,
+    # the sample standard deviation is used.
+    def get_z_score(self, name: str, value: float) -> float:
+        n = self.count
+        if n < 2:
+            raise ValueError(f"{name} contains too few values to compute z-scores.")
+        mean = self._sum / n
+        variance = (self._sum_of_squares - n * mean * mean) / (n - 1)
+        if variance <= 0:
+            raise ValueError(f"The values of {name} are constant.")
+        return abs(value - mean) / variance ** 0.5
+
+
+# Raise a ValueError if the Extreme Value Smell would report a value of a
+# column.
+def _verify_no_extreme_values(name: str, statistics: _ValueStatistics):
+    max_z_score = max(
+        statistics.get_z_score(name, statistics.minimum),
+        statistics.get_z_score(name, statistics.maximum)
+    )
+    if max_z_score >= _Z_SCORE_THRESHOLD * (1 - _SAFETY_MARGIN):
+        raise ValueError(f"The values of {name} contain extreme values.")
+
+
+# Return normally distributed values which are clipped to [-2.5, 2.5]. The
+# values keep a distance of at least 0.05 to integers to avoid the Integer As
+# Floating Point Number Smell.
+def _get_normal_values(rng: np.random.Generator, count: int) -> np.ndarray:
+    values = np.clip(rng.standard_normal(count), -2.5, 2.5)
+    return np.floor(values * 10) / 10 + 0.05
+
+
+# Injects the values of the data smell which are defined by SMELL_VALUES
+# (see benchmarks.columns). The row numbers are used as identifiers, so that
+# each value is unique. This avoids duplicated values and, since clean string
+# values consist of a single word, casing smells.
+class _SmellValuesInjector(ColumnInjector):
+    def _generate(self, row_numbers, mask):
+        values = SMELL_VALUES[self.data_smell_type]
+        return np.where(mask, values.faulty(row_numbers), values.clean(row_numbers))
+
+
+class CasingInjector(_SmellValuesInjector):
+    data_smell_type = DataSmellType.CASING_SMELL
+
+
+class IntegerAsStringInjector(_SmellValuesInjector):
+    data_smell_type = DataSmellType.INTEGER_AS_STRING_SMELL
+
+
+class FloatingPointNumberAsStringInjector(_SmellValuesInjector):
+    data_smell_type = DataSmellType.FLOATING_POINT_NUMBER_AS_STRING_SMELL
+
+
+class LongDataValueInjector(_SmellValuesInjector):
+    data_smell_type = DataSmellType.LONG_DATA_VALUE_SMELL
+
+
+# Numeric columns: Clean values are not integral, non-negative or bounded to
+# avoid integer as floating point number, suspect sign and extreme value
+# smells. The values of this column are (shifted) row numbers which are
+# uniformly distributed, so their z-scores stay below sqrt(3).
+class IntegerAsFloatingPointNumberInjector(_SmellValuesInjector):
+    data_smell_type = DataSmellType.INTEGER_AS_FLOATING_POINT_NUMBER_SMELL
+
+
+class MissingValueInjector(ColumnInjector):
+    data_smell_type = DataSmellType.MISSING_VALUE_SMELL
+
+    def __init__(self, name: str, smell_rate: float, rng: np.random.Generator):
+        super(MissingValueInjector, self).__init__(name, smell_rate, rng)
+        self._statistics = _ValueStatistics()
+
+    def _generate(self, row_numbers, mask):
+        values = _get_normal_values(self.rng, len(row_numbers))
+        values[mask] = np.nan
+        return values
+
+    def _update(self, values, mask):
+        self._statistics.update(values)
+
+    def get_faulty_count(self) -> int:
+        _verify_no_extreme_values(self.name, self._statistics)
+        return self.injected_count
+
+
+class SuspectSignInjector(ColumnInjector):
+    data_smell_type = DataSmellType.SUSPECT_SIGN_SMELL
+
+    def __init__(self, name: str, smell_rate: float, rng: np.random.Generator):
+        super(SuspectSignInjector, self).__init__(name, smell_rate, rng)
+        self._statistics = _ValueStatistics()
+
+    def _generate(self, row_numbers, mask):
+        # Clean values are in [1.5, 999.5] and faulty values in [-9.5, -1.5].
+        # The negative values are close to the positive values to avoid
+        # extreme values. All values end with ".5" to avoid integer as
+        # floating point number smells.
+        values = np.floor(self.rng.uniform(1.0, 1000.0, len(row_numbers)))
+        values[mask] = -(values[mask] % 9 + 1)
+        return values + np.where(mask, -0.5, 0.5)
+
+    def _update(self, values, mask):
+        self._statistics.update(values)
+
+    def get_faulty_count(self) -> int:
+        # The negative values are only flagged if the lower quantile
+        # (percentile_threshold = 0.25 by default) is positive.
+        if self.injected_count >= (0.25 - _SAFETY_MARGIN) * (self.row_count - 1):
+            raise ValueError(f"The smell rate of {self.name} is too high to detect the suspect sign smell.")
+        _verify_no_extreme_values(self.name, self._statistics)
+        return self.injected_count
+
+
+class ExtremeValueInjector(ColumnInjector):
+    data_smell_type = DataSmellType.EXTREME_VALUE_SMELL
+
+    faulty_value = 1000.5
+    """The value of the injected outliers."""
+
+    def __init__(self, name: str, smell_rate: float, rng: np.random.Generator):
+        super(ExtremeValueInjector, self).__init__(name, smell_rate, rng)
+        self._statistics = _ValueStatistics()
+        self._clean_statistics = _ValueStatistics()
+
+    def _generate(self, row_numbers, mask):
+        values = _get_normal_values(self.rng, len(row_numbers))
+        values[mask] = self.faulty_value
+        return values
+
+    def _update(self, values, mask):
+        self._statistics.update(values)
+        self._clean_statistics.update(values[~mask])
+
+    def get_faulty_count(self) -> int:
+        # The faulty values must exceed the threshold and the clean values
+        # must stay below it.
+        statistics = self._statistics
+        max_clean_z = max(
+            statistics.get_z_score(self.name, self._clean_statistics.minimum),
+            statistics.get_z_score(self.name, self._clean_statistics.maximum)
+        )
+        faulty_z = statistics.get_z_score(self.name, self.faulty_value)
+        if self.injected_count > 0 and faulty_z <= _Z_SCORE_THRESHOLD * (1 + _SAFETY_MARGIN):
+            raise ValueError(f"The smell rate of {self.name} is too high to detect the extreme value smell.")
+        if max_clean_z >= _Z_SCORE_THRESHOLD * (1 - _SAFETY_MARGIN):
+            raise ValueError(f"The clean values of {self.name} contain extreme values.")
+        return self.injected_count
+
+
+class DuplicatedValueInjector(ColumnInjector):
+    data_smell_type = DataSmellType.DUPLICATED_VALUE_SMELL
+
+    def __init__(self, name: str, smell_rate: float, rng: np.random.Generator):
+        super(DuplicatedValueInjector, self).__init__(name, smell_rate, rng)
+        self._last_value = 0
+        self._last_row_clean = False
+        self._head_count = 0
+
+    def _generate(self, row_numbers, mask):
+        # Clean rows contain their (unique) row number. Faulty rows repeat the
+        # value of the previous row, i.e. of the last clean row.
+        clean_positions = np.where(mask, -1, np.arange(len(row_numbers)))
+        last_clean_positions = np.maximum.accumulate(clean_positions)
+        return np.where(
+            last_clean_positions >= 0,
+            row_numbers[np.maximum(last_clean_positions, 0)],
+            self._last_value
+        ).astype(np.int64)
+
+    def _update(self, values, mask):
+        if len(mask) == 0:
+            return
+        # All rows of a duplicated group are faulty, i.e. the faulty rows and
+        # the clean row which they repeat.
+        self._head_count += int(np.count_nonzero(~mask[:-1] & mask[1:]))
+        if self._last_row_clean and mask[0]:
+            self._head_count += 1
+        self._last_value = int(values[-1])
+        self._last_row_clean = not mask[-1]
+
+    def get_faulty_count(self) -> int:
+        return self.injected_count + self._head_count
+
+
+INJECTORS: Dict[DataSmellType, Type[ColumnInjector]] = {
+    x.data_smell_type: x for x in [
+        CasingInjector,
+        SuspectSignInjector,
+        IntegerAsStringInjector,
+        FloatingPointNumberAsStringInjector,
+        IntegerAsFloatingPointNumberInjector,
+        LongDataValueInjector,
+        ExtremeValueInjector,
+        DuplicatedValueInjector,
+        MissingValueInjector
+    ]
+}
+"""The column injector of each data smell type which is detected by the library."""
+
+DATA_SMELL_CONFIGURATION: Dict[DataSmellType, Dict[str, Any]] = {
+    x: {"mostly": 1} for x in INJECTORS.keys()
+}
+"""
+The data smell configuration (see
+:attr:`~datasmelldetection.detectors.great_expectations.detector.DataSmellAwareConfiguration.data_smell_configuration`)
+which the faulty counts of the manifest assume. Each expectation fails if
+any faulty value is present.
+"""  # pylint: disable=W0105
+
+
+def _create_injectors(
+        columns: int,
+        smell_rates: Dict[DataSmellType, float],
+        seed: int
+) -> List[ColumnInjector]:
+    data_smell_types = list(smell_rates.keys())
+    injectors: List[ColumnInjector] = []
+    for index in range(columns):
+        data_smell_type = data_smell_types[index % len(data_smell_types)]
+        name = data_smell_type.name.lower() + f"_{index}"
+        # Each column has its own random stream. The generated values don't
+        # depend on the chunk size.
+        rng = np.random.default_rng([seed, index])
+        injectors.append(INJECTORS[data_smell_type](name, smell_rates[data_smell_type], rng))
+    return injectors
+
+
+def generate_dataset(
+        path: str,
+        rows: int,
+        columns: Optional[int] = None,
+        smell_rates: Optional[Dict[DataSmellType, float]] = None,
+        seed: int = 0,
+        chunk_size: int = 100000,
+        file_format: str = "csv",
+        manifest_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Write a synthetic dataset and its manifest.
+
+    :param path: The file to write.
+    :param rows: The number of rows.
+    :param columns: The number of columns (one column per data smell type
+        if None). The data smell types are assigned to the columns in turn.
+    :param smell_rates: The rate of each data smell type to inject (0.01 for
+        all data smell types if None).
+    :param seed: The seed of the random number generators.
+    :param chunk_size: The number of rows which are generated and written
+        at once.
+    :param file_format: "csv" or "parquet" (requires pyarrow).
+    :param manifest_path: The JSON file which stores the manifest (the
+        dataset path with a ".manifest.json" suffix if None).
+    :return: The manifest. Its "data_smell_configuration" stores the kwargs
+        of the expectations (see :data:`DATA_SMELL_CONFIGURATION`) for which
+        the "faulty_count" of each column holds.
+    """
+    if smell_rates is None:
+        smell_rates = {x: 0.01 for x in INJECTORS.keys()}
+    if columns is None:
+        columns = len(smell_rates)
+    if manifest_path is None:
+        manifest_path = path + ".manifest.json"
+    assert rows > 1, "At least two rows are required."
+    assert file_format in ("csv", "parquet"), "Unsupported file format."
+    if file_format == "parquet" and pyarrow is None:
+        raise ImportError("pyarrow is required to write Parquet files.")
+
+    injectors = _create_injectors(columns, smell_rates, seed)
+    parquet_writer = None
+    try:
+        for start in range(0, rows, chunk_size):
+            chunk_rows = min(chunk_size, rows - start)
+            chunk = pd.DataFrame({x.name: x.next_chunk(chunk_rows) for x in injectors})
+            if file_format == "csv":
+                chunk.to_csv(path, mode="w" if start == 0 else "a", header=start == 0, index=False)
+            else:
+                table = pyarrow.Table.from_pandas(chunk, preserve_index=False)
+                if parquet_writer is None:
+                    parquet_writer = pyarrow.parquet.ParquetWriter(path, table.schema)
+                parquet_writer.write_table(table)
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+    manifest: Dict[str, Any] = {
+        "path": path,
+        "format": file_format,
+        "rows": rows,
+        "seed": seed,
+        # The faulty counts are only reported if detection uses this
+        # configuration.
+        "data_smell_configuration": {x.value: y for x, y in DATA_SMELL_CONFIGURATION.items()},
+        "columns": [
+            {
+                "name": x.name,
+                "data_smell_type": x.data_smell_type.value,
+                "smell_rate": x.smell_rate,
+                "injected_count": x.injected_count,
+                "faulty_count": x.get_faulty_count(),
+                "first_injected_rows": x.first_injected_rows,
+                "first_injected_values": x.first_injected_values
+            }
+            for x in injectors
+        ]
+    }
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+    return manifest
+
+
+def _parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="The file to write.")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--columns", type=int, help="The number of columns (one per data smell type by default).")
+    parser.add_argument("--smell-rate", type=float, default=0.01, help="The rate of each injected data smell.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = _parse_arguments(argv)
+    manifest = generate_dataset(
+        arguments.path,
+        rows=arguments.rows,
+        columns=arguments.columns,
+        smell_rates={x: arguments.smell_rate for x in INJECTORS.keys()},
+        seed=arguments.seed,
+        chunk_size=arguments.chunk_size,
+        file_format=arguments.format
+    )
+    for column in manifest["columns"]:
+        print(f"{column['name']:<50} {column['faulty_count']:>12} faulty values")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
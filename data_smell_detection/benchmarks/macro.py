@@ -0,0 +1,241 @@
+"""
+End-to-end scaling benchmark for the GreatExpectationsDetector.
+
+The full path (importing the dataset, ``DetectorBuilder(...).build().detect()``)
+is run on synthetic datasets (see :mod:`benchmarks.generate`) which grow in
+rows and in columns. Each case runs in a fresh process so that the peak
+resident set size is measured per case. The wall clock time of each stage is
+plotted against the dataset size and stages which scale super-linearly are
+highlighted in the report.
+
+Usage (from the data_smell_detection directory)::
+
+    python -m benchmarks.macro --rows 10000 100000 1000000 --columns 10 100
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DEFAULT_GREAT_EXPECTATIONS_DIRECTORY = os.path.join(_PACKAGE_ROOT, "..", "great_expectations")
+
+DEFAULT_ROWS = [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8]
+DEFAULT_COLUMNS = [10, 100, 1000]
+
+
+def run_case(data_directory: str, filename: str, great_expectations_directory: str) -> Dict[str, Any]:
+    """
+    Run detection on a dataset in the current process.
+
+    :param data_directory: The directory which contains the dataset.
+    :param filename: The file name of the dataset.
+    :param great_expectations_directory: The Great Expectations directory.
+    :return: The wall clock time of each stage, the peak resident set size
+        and the detected faulty element counts.
+    """
+    # Import here to include the import in the process but not in the
+    # measured time.
+    from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+    from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+    from datasmelldetection.detectors.great_expectations.detector import (
+        DataSmellAwareConfiguration,
+        DetectorBuilder
+    )
+    from .common import get_peak_rss
+    from .generate import DATA_SMELL_CONFIGURATION
+
+    context = GreatExpectationsContextBuilder(great_expectations_directory, data_directory).build()
+
+    start = time.perf_counter()
+    dataset = FileBasedDatasetManager(context).get_dataset(filename)
+    stages: Dict[str, float] = {"dataset_import": time.perf_counter() - start}
+
+    start = time.perf_counter()
+    # The faulty counts of the manifest assume mostly=1.
+    configuration = DataSmellAwareConfiguration(
+        column_names=None,
+        data_smell_configuration=DATA_SMELL_CONFIGURATION
+    )
+    detector = DetectorBuilder(context=context, dataset=dataset).set_configuration(configuration).build()
+    detection_results = detector.detect()
+    wall_time = time.perf_counter() - start + stages["dataset_import"]
+
+    for stage in detector.run_report.stages:
+        stages[stage.name] = stage.wall_time
+
+    return {
+        "wall_time": wall_time,
+        "stages": stages,
+        "peak_rss": get_peak_rss(),
+        "faulty_counts": {
+            f"{x.column_name}|{x.data_smell_type.value}": x.statistics.faulty_element_count
+            for x in detection_results
+        }
+    }
+
+
+def _run_case_in_subprocess(
+        data_directory: str,
+        filename: str,
+        great_expectations_directory: str
+) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [
+            sys.executable, "-m", "benchmarks.macro",
+            "--run-case", data_directory, filename,
+            "--great-expectations-directory", great_expectations_directory
+        ],
+        cwd=_PACKAGE_ROOT,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    # Great Expectations might print to stdout. The result is the last line.
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _get_dataset(data_directory: str, rows: int, columns: int, seed: int) -> Tuple[str, Dict[str, Any]]:
+    from .generate import DATA_SMELL_CONFIGURATION, generate_dataset
+
+    filename = f"macro_{rows}x{columns}_{seed}.csv"
+    path = os.path.join(data_directory, filename)
+    manifest_path = path + ".manifest.json"
+    if os.path.exists(path) and os.path.exists(manifest_path):
+        # Reuse datasets of previous runs since generating them takes long.
+        # Datasets whose faulty counts assume another configuration are
+        # generated again.
+        with open(manifest_path, encoding="utf-8") as file:
+            manifest = json.load(file)
+        if manifest.get("data_smell_configuration") == \
+                {x.value: y for x, y in DATA_SMELL_CONFIGURATION.items()}:
+            return filename, manifest
+    return filename, generate_dataset(path, rows=rows, columns=columns, seed=seed)
+
+
+def run_benchmark(
+        cases: List[Tuple[int, int]],
+        data_directory: str,
+        great_expectations_directory: str,
+        seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    :param cases: The (rows, columns) pairs to benchmark.
+    :param data_directory: The directory which stores the generated datasets.
+    :param great_expectations_directory: The Great Expectations directory.
+    :param seed: The seed for generating the datasets.
+    :return: The result of each case.
+    """
+    os.makedirs(data_directory, exist_ok=True)
+    results: List[Dict[str, Any]] = []
+    for rows, columns in cases:
+        filename, manifest = _get_dataset(data_directory, rows, columns, seed)
+        result = _run_case_in_subprocess(data_directory, filename, great_expectations_directory)
+
+        # Verify the detection results to ensure that the benchmark measures
+        # correct detection.
+        expected = {f"{x['name']}|{x['data_smell_type']}": x["faulty_count"] for x in manifest["columns"]}
+        verified = all(result["faulty_counts"].get(key) == value for key, value in expected.items())
+
+        results.append({
+            "rows": rows,
+            "columns": columns,
+            "wall_time": result["wall_time"],
+            "stages": result["stages"],
+            "peak_rss": result["peak_rss"],
+            "verified": verified
+        })
+        print(
+            f"rows={rows:<10} columns={columns:<6} {result['wall_time']:>10.2f} s "
+            f"{(result['peak_rss'] or 0) / 2 ** 20:>10.1f} MiB peak RSS "
+            f"{'ok' if verified else 'MISMATCH'}"
+        )
+    return results
+
+
+def _build_charts(
+        results: List[Dict[str, Any]],
+        fixed_columns: int,
+        fixed_rows: int
+) -> List[Tuple[str, str, str, Dict[str, List[Tuple[float, float]]]]]:
+    charts = []
+    for title, x_field, fixed_field, fixed_value in [
+        (f"Scaling in rows ({fixed_columns} columns)", "rows", "columns", fixed_columns),
+        (f"Scaling in columns ({fixed_rows} rows)", "columns", "rows", fixed_rows)
+    ]:
+        sweep = sorted((x for x in results if x[fixed_field] == fixed_value), key=lambda x: x[x_field])
+        if len(sweep) < 2:
+            continue
+        series: Dict[str, List[Tuple[float, float]]] = {"total": [(x[x_field], x["wall_time"]) for x in sweep]}
+        for stage in sweep[0]["stages"].keys():
+            series[stage] = [(x[x_field], x["stages"].get(stage, 0.0)) for x in sweep]
+        charts.append((title + " - wall clock time", x_field, "seconds", series))
+        if all(x["peak_rss"] for x in sweep):
+            charts.append((
+                title + " - peak RSS",
+                x_field,
+                "bytes",
+                {"peak RSS": [(x[x_field], x["peak_rss"]) for x in sweep]}
+            ))
+    return charts
+
+
+def _parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", nargs="+", type=int, default=DEFAULT_ROWS, help="The row counts of the row sweep.")
+    parser.add_argument(
+        "--columns", nargs="+", type=int, default=DEFAULT_COLUMNS,
+        help="The column counts of the column sweep."
+    )
+    parser.add_argument("--fixed-columns", type=int, default=10, help="The column count of the row sweep.")
+    parser.add_argument("--fixed-rows", type=int, default=10 ** 4, help="The row count of the column sweep.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-directory", default="benchmark-data", help="Where to store the generated datasets.")
+    parser.add_argument("--great-expectations-directory", default=_DEFAULT_GREAT_EXPECTATIONS_DIRECTORY)
+    parser.add_argument("--output", help="Save the results to this JSON file.")
+    parser.add_argument("--report", default="macro-report.html", help="The HTML report to write.")
+    parser.add_argument("--png", help="Also plot the report to this PNG file (requires matplotlib).")
+    parser.add_argument("--run-case", nargs=2, metavar=("DATA_DIRECTORY", "FILENAME"), help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = _parse_arguments(argv)
+
+    if arguments.run_case is not None:
+        data_directory, filename = arguments.run_case
+        print(json.dumps(run_case(data_directory, filename, arguments.great_expectations_directory)))
+        return 0
+
+    from .common import save_results
+    from .plot import write_html_report, write_png_report
+
+    cases: List[Tuple[int, int]] = [(x, arguments.fixed_columns) for x in arguments.rows]
+    cases += [(arguments.fixed_rows, x) for x in arguments.columns if (arguments.fixed_rows, x) not in cases]
+    results = run_benchmark(
+        cases,
+        os.path.abspath(arguments.data_directory),
+        os.path.abspath(arguments.great_expectations_directory),
+        seed=arguments.seed
+    )
+
+    if arguments.output is not None:
+        save_results(arguments.output, results)
+
+    charts = _build_charts(results, arguments.fixed_columns, arguments.fixed_rows)
+    write_html_report(
+        arguments.report,
+        "GreatExpectationsDetector scaling",
+        charts,
+        notes=[f"Cases with mismatching detection results: {sum(not x['verified'] for x in results)}"]
+    )
+    if arguments.png is not None and not write_png_report(arguments.png, charts):
+        print("matplotlib is not installed, no PNG report was written.")
+    return 0 if all(x["verified"] for x in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Micro-benchmarks for the data smell expectations.
+
+Each expectation (and therefore its metric provider) is validated on a
+synthetic column with a controlled smell rate and cardinality. The median
+throughput and the peak memory are reported and can be saved as JSON to be
+compared against a stored baseline.
+
+Usage (from the data_smell_detection directory)::
+
+    python -m benchmarks.micro --output current.json
+    python -m benchmarks.micro --baseline current.json --sizes 1000 100000
+"""
+import argparse
+import statistics
+import sys
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration
+
+# Import to register expectation classes
+import datasmelldetection.detectors.great_expectations  # noqa: F401
+from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.datasmell import default_registry
+
+from .columns import COLUMN_GENERATORS, generate_column
+from .common import (
+    build_validator,
+    compare_results,
+    load_results,
+    measure_peak_memory,
+    measure_wall_time,
+    save_results
+)
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+KEY_FIELDS = ("data_smell_type", "rows", "smell_rate", "cardinality")
+
+
+def get_expectation_type(data_smell_type: DataSmellType) -> str:
+    """
+    :param data_smell_type: A data smell type of the default registry.
+    :return: The type of the expectation which detects the data smell.
+    """
+    mapping = default_registry.snapshot().get_expectation_type_to_data_smell_type_dict()
+    for expectation_type, mapped_data_smell_type in mapping.items():
+        if mapped_data_smell_type == data_smell_type:
+            return expectation_type
+    raise ValueError(f"{data_smell_type} is not registered.")
+
+
+def run_case(
+        data_smell_type: DataSmellType,
+        rows: int,
+        smell_rate: float,
+        cardinality: int,
+        repeat: int = 5,
+        seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Benchmark the expectation of a data smell on a synthetic column.
+
+    :param data_smell_type: The data smell to benchmark.
+    :param rows: The number of rows of the column.
+    :param smell_rate: The fraction of faulty values.
+    :param cardinality: The maximum number of distinct clean and faulty values.
+    :param repeat: The number of timed validations.
+    :param seed: The seed for generating the column.
+    :return: The result of the benchmark case.
+    """
+    column, mask = generate_column(data_smell_type, rows, smell_rate, cardinality, seed)
+    validator = build_validator(pd.DataFrame({"values": column}))
+    configuration = ExpectationConfiguration(
+        expectation_type=get_expectation_type(data_smell_type),
+        kwargs={"column": "values"}
+    )
+
+    def validate():
+        return validator.graph_validate(
+            configurations=[configuration],
+            runtime_configuration={
+                "catch_exceptions": False,
+                "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
+            }
+        )
+
+    # Warm up and check that the expectation could be evaluated.
+    validation_result = validate()[0]
+    wall_times = measure_wall_time(validate, repeat)
+    wall_time = statistics.median(wall_times)
+
+    return {
+        "data_smell_type": data_smell_type.value,
+        "expectation_type": configuration.expectation_type,
+        "rows": rows,
+        "smell_rate": smell_rate,
+        "cardinality": cardinality,
+        "injected_faulty_count": int(mask.sum()),
+        "unexpected_count": validation_result.result.get("unexpected_count"),
+        "wall_time": wall_time,
+        "min_wall_time": min(wall_times),
+        "rows_per_second": rows / wall_time if wall_time > 0 else float("inf"),
+        "peak_memory": measure_peak_memory(validate)
+    }
+
+
+def _parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--smells", nargs="+", default=[x.value for x in COLUMN_GENERATORS.keys()],
+        metavar="SMELL", help="The data smells to benchmark (e.g. \"Casing Smell\")."
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="The numbers of rows.")
+    parser.add_argument("--smell-rates", nargs="+", type=float, default=[0.01], help="The fractions of faulty values.")
+    parser.add_argument("--cardinalities", nargs="+", type=int, default=[1000], help="The numbers of distinct values.")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of timed runs per case.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Save the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare the results to this JSON file.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1,
+        help="Report a regression if the throughput drops by more than this fraction of the baseline."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = _parse_arguments(argv)
+
+    results: List[Dict[str, Any]] = []
+    for smell in arguments.smells:
+        data_smell_type = DataSmellType(smell)
+        for rows in arguments.sizes:
+            for smell_rate in arguments.smell_rates:
+                for cardinality in arguments.cardinalities:
+                    result = run_case(
+                        data_smell_type, rows, smell_rate, cardinality,
+                        repeat=arguments.repeat, seed=arguments.seed
+                    )
+                    results.append(result)
+                    print(
+                        f"{result['data_smell_type']:<40} rows={rows:<10} rate={smell_rate:<6} "
+                        f"cardinality={cardinality:<8} {result['rows_per_second']:>14.0f} rows/s "
+                        f"{result['peak_memory'] / 2 ** 20:>10.1f} MiB"
+                    )
+
+    if arguments.output is not None:
+        save_results(arguments.output, results)
+
+    if arguments.baseline is None:
+        return 0
+
+    regression_count = 0
+    for comparison in compare_results(results, load_results(arguments.baseline), KEY_FIELDS, "rows_per_second"):
+        is_regression = comparison.ratio < 1 - arguments.tolerance
+        regression_count += int(is_regression)
+        print(
+            f"{'REGRESSION' if is_regression else 'ok':<10} {comparison.key} "
+            f"{comparison.ratio:.2f}x baseline throughput"
+        )
+    return 1 if regression_count > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Rendering of scaling curves as HTML (inline SVG) and PNG reports."""
+import html
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+except ImportError:  # pragma: no cover (PNG output is optional)
+    plt = None  # type: ignore
+
+Series = Dict[str, List[Tuple[float, float]]]
+"""Maps the name of a curve to its (x, y) points."""
+
+# An exponent above this value marks a curve as super-linear.
+SUPER_LINEAR_EXPONENT = 1.2
+
+_COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f"]
+
+
+def get_scaling_exponents(points: Sequence[Tuple[float, float]]) -> List[float]:
+    """
+    :param points: The (x, y) points of a curve sorted by x.
+    :return: The slope in log-log space between each pair of consecutive
+        points (1 means linear scaling, 2 quadratic scaling).
+    """
+    exponents: List[float] = []
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        if x1 > 0 and x2 > x1 and y1 > 0 and y2 > 0:
+            exponents.append(math.log(y2 / y1) / math.log(x2 / x1))
+    return exponents
+
+
+def _render_svg(series: Series, x_label: str, y_label: str, width: int = 640, height: int = 400) -> str:
+    points = [p for curve in series.values() for p in curve if p[0] > 0 and p[1] > 0]
+    if not points:
+        return "<p>No data.</p>"
+    margin = 60
+    x_min, x_max = math.log10(min(p[0] for p in points)), math.log10(max(p[0] for p in points))
+    y_min, y_max = math.log10(min(p[1] for p in points)), math.log10(max(p[1] for p in points))
+    x_max = x_max if x_max > x_min else x_min + 1
+    y_max = y_max if y_max > y_min else y_min + 1
+
+    def to_svg(x: float, y: float) -> Tuple[float, float]:
+        return (
+            margin + (math.log10(x) - x_min) / (x_max - x_min) * (width - 2 * margin),
+            height - margin - (math.log10(y) - y_min) / (y_max - y_min) * (height - 2 * margin)
+        )
+
+    elements: List[str] = [
+        f'<line x1="{margin}" y1="{height - margin}" x2="{width - margin}" y2="{height - margin}" stroke="black"/>',
+        f'<line x1="{margin}" y1="{margin}" x2="{margin}" y2="{height - margin}" stroke="black"/>',
+        f'<text x="{width / 2}" y="{height - 15}" text-anchor="middle">{html.escape(x_label)} (log)</text>',
+        f'<text x="15" y="{height / 2}" text-anchor="middle" '
+        f'transform="rotate(-90 15 {height / 2})">{html.escape(y_label)} (log)</text>'
+    ]
+    for exponent in range(math.floor(x_min), math.ceil(x_max) + 1):
+        if x_min <= exponent <= x_max:
+            x, _ = to_svg(10 ** exponent, 10 ** y_min)
+            elements.append(f'<text x="{x}" y="{height - margin + 18}" text-anchor="middle">1e{exponent}</text>')
+    for exponent in range(math.floor(y_min), math.ceil(y_max) + 1):
+        if y_min <= exponent <= y_max:
+            _, y = to_svg(10 ** x_min, 10 ** exponent)
+            elements.append(f'<text x="{margin - 5}" y="{y}" text-anchor="end">1e{exponent}</text>')
+
+    for index, (name, curve) in enumerate(series.items()):
+        color = _COLORS[index % len(_COLORS)]
+        svg_points = [to_svg(x, y) for x, y in curve if x > 0 and y > 0]
+        path = " ".join(f"{x:.1f},{y:.1f}" for x, y in svg_points)
+        elements.append(f'<polyline points="{path}" fill="none" stroke="{color}" stroke-width="2"/>')
+        elements.extend(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="3" fill="{color}"/>' for x, y in svg_points)
+        elements.append(
+            f'<text x="{width - margin + 5}" y="{margin + 15 * index}" fill="{color}">{html.escape(name)}</text>'
+        )
+
+    return f'<svg width="{width + 120}" height="{height}" xmlns="http://www.w3.org/2000/svg">' + \
+        "".join(elements) + "</svg>"
+
+
+def _render_exponent_table(series: Series) -> str:
+    rows: List[str] = []
+    for name, curve in series.items():
+        exponents = get_scaling_exponents(curve)
+        cells = "".join(
+            f'<td style="color: {"red; font-weight: bold" if x > SUPER_LINEAR_EXPONENT else "black"}">{x:.2f}</td>'
+            for x in exponents
+        )
+        rows.append(f"<tr><th>{html.escape(name)}</th>{cells}</tr>")
+    return "<table><caption>Scaling exponents between consecutive points " \
+        f"(&gt; {SUPER_LINEAR_EXPONENT} is super-linear)</caption>" + "".join(rows) + "</table>"
+
+
+def write_html_report(
+        path: str,
+        title: str,
+        charts: List[Tuple[str, str, str, Series]],
+        notes: Optional[List[str]] = None):
+    """
+    :param path: The HTML file to write.
+    :param title: The title of the report.
+    :param charts: The charts as (title, x label, y label, series) tuples.
+    :param notes: Additional paragraphs (e.g. about the environment).
+    """
+    sections: List[str] = []
+    for chart_title, x_label, y_label, series in charts:
+        sections.append(
+            f"<h2>{html.escape(chart_title)}</h2>" +
+            _render_svg(series, x_label, y_label) +
+            _render_exponent_table(series)
+        )
+    paragraphs = "".join(f"<p>{html.escape(x)}</p>" for x in (notes or []))
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(
+            f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title>"
+            "<style>body { font-family: sans-serif; } td, th { padding: 2px 8px; }</style></head>"
+            f"<body><h1>{html.escape(title)}</h1>{paragraphs}{''.join(sections)}</body></html>"
+        )
+
+
+def write_png_report(path: str, charts: List[Tuple[str, str, str, Series]]) -> bool:
+    """
+    :param path: The PNG file to write.
+    :param charts: The charts as (title, x label, y label, series) tuples.
+    :return: False if matplotlib is not installed (no file is written).
+    """
+    if plt is None or not charts:
+        return False
+    figure, axes = plt.subplots(len(charts), 1, figsize=(8, 5 * len(charts)), squeeze=False)
+    for (chart_title, x_label, y_label, series), axis in zip(charts, axes[:, 0]):
+        for name, curve in series.items():
+            axis.plot([x for x, _ in curve], [y for _, y in curve], marker="o", label=name)
+        axis.set_xscale("log")
+        axis.set_yscale("log")
+        axis.set_title(chart_title)
+        axis.set_xlabel(x_label)
+        axis.set_ylabel(y_label)
+        axis.legend()
+    figure.tight_layout()
+    figure.savefig(path)
+    plt.close(figure)
+    return True
@@ -0,0 +1,265 @@
+"""
+Import and startup time benchmark.
+
+Measures in fresh processes:
+
+* the cold import time of the library (with a per-module breakdown from
+  ``python -X importtime``),
+* the time to the first ``detect()`` on a tiny dataset,
+* the boot time of a gunicorn worker of the web application and the time to
+  its first response (the web application imports the library when the first
+  request loads the views).
+
+Usage (from the data_smell_detection directory)::
+
+    python -m benchmarks.startup --output startup.json
+    python -m benchmarks.startup --baseline startup.json --skip-gunicorn
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_REPOSITORY_ROOT = os.path.dirname(_PACKAGE_ROOT)
+_WEB_APPLICATION_DIRECTORY = os.path.join(_REPOSITORY_ROOT, "web_application", "argon-dashboard-django")
+
+IMPORTED_MODULE = "datasmelldetection.detectors.great_expectations"
+
+_FIRST_DETECT_SCRIPT = """
+import json, os, time
+start = time.perf_counter()
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.detector import DetectorBuilder
+imported = time.perf_counter()
+context = GreatExpectationsContextBuilder({great_expectations_directory!r}, {data_directory!r}).build()
+dataset = FileBasedDatasetManager(context).get_dataset({filename!r})
+loaded = time.perf_counter()
+DetectorBuilder(context=context, dataset=dataset).build().detect()
+detected = time.perf_counter()
+DetectorBuilder(context=context, dataset=dataset).build().detect()
+print(json.dumps({{
+    "import": imported - start,
+    "context_and_dataset": loaded - imported,
+    "first_detect": detected - loaded,
+    "second_detect": time.perf_counter() - detected
+}}))
+"""
+
+
+def parse_import_times(stderr: str) -> List[Dict[str, Any]]:
+    """
+    :param stderr: The output of ``python -X importtime``.
+    :return: The self and cumulative import time in seconds of each module.
+    """
+    modules: List[Dict[str, Any]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            # Header line
+            continue
+        modules.append({
+            "module": parts[2].strip(),
+            "self": int(parts[0]) / 1e6,
+            "cumulative": int(parts[1]) / 1e6
+        })
+    return modules
+
+
+def measure_import(module: str = IMPORTED_MODULE) -> Dict[str, Any]:
+    """
+    :param module: The module to import in a fresh process.
+    :return: The wall clock time of the import and the per-module breakdown
+        (empty if ``-X importtime`` is not supported, i.e. before Python 3.7).
+    """
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    options = ["-X", "importtime"] if sys.version_info >= (3, 7) else []
+    completed = subprocess.run(
+        [sys.executable] + options + ["-c", code],
+        cwd=_PACKAGE_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    return {
+        "wall_time": float(completed.stdout.strip().splitlines()[-1]),
+        "modules": parse_import_times(completed.stderr)
+    }
+
+
+def summarize_by_package(modules: List[Dict[str, Any]]) -> Dict[str, float]:
+    """
+    :param modules: The result of :func:`parse_import_times`.
+    :return: The summed self import time per top-level package.
+    """
+    result: Dict[str, float] = {}
+    for module in modules:
+        package = module["module"].split(".")[0]
+        result[package] = result.get(package, 0.0) + module["self"]
+    return dict(sorted(result.items(), key=lambda x: -x[1]))
+
+
+def measure_first_detect(great_expectations_directory: str, data_directory: str, filename: str) -> Dict[str, float]:
+    """
+    :return: The time of the import, of building the context and loading the
+        dataset, and of the first and second detection in a fresh process.
+    """
+    script = _FIRST_DETECT_SCRIPT.format(
+        great_expectations_directory=great_expectations_directory,
+        data_directory=data_directory,
+        filename=filename
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=_PACKAGE_ROOT,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_gunicorn_boot(timeout: float = 120.0, path: str = "/") -> Dict[str, float]:
+    """
+    Start the web application with one gunicorn worker.
+
+    :param timeout: The maximum time in seconds to wait for the server.
+    :param path: The URL path of the first request.
+    :return: The time until the server accepts connections and the time
+        until the first response.
+    """
+    port = _get_free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn", "core.wsgi",
+            "--bind", f"127.0.0.1:{port}", "--workers", "1", "--log-level", "warning"
+        ],
+        cwd=_WEB_APPLICATION_DIRECTORY,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        listening: Optional[float] = None
+        while listening is None:
+            if process.poll() is not None:
+                raise RuntimeError("gunicorn exited during startup.")
+            if time.perf_counter() - start > timeout:
+                raise TimeoutError("gunicorn did not start in time.")
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=1):
+                    listening = time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=timeout)
+        except urllib.error.HTTPError:
+            # Any response (e.g. a redirect to the login page) is sufficient.
+            pass
+        return {"listening": listening, "first_response": time.perf_counter() - start}
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def run_benchmark(repeat: int, great_expectations_directory: str, skip_gunicorn: bool = False) -> Dict[str, Any]:
+    """
+    :param repeat: The number of fresh processes per measurement.
+    :param great_expectations_directory: The Great Expectations directory.
+    :param skip_gunicorn: Don't measure the gunicorn boot time.
+    :return: The median times (in seconds) and the import breakdown of the
+        first run.
+    """
+    imports = [measure_import() for _ in range(repeat)]
+    first_detects = [
+        measure_first_detect(
+            great_expectations_directory,
+            os.path.join(_PACKAGE_ROOT, "tests", "test_sets"),
+            "data_smell_testset.csv"
+        )
+        for _ in range(repeat)
+    ]
+    timings: Dict[str, float] = {"import": statistics.median(x["wall_time"] for x in imports)}
+    for key in first_detects[0].keys():
+        timings[f"detect_script.{key}"] = statistics.median(x[key] for x in first_detects)
+    if not skip_gunicorn:
+        boots = [measure_gunicorn_boot() for _ in range(repeat)]
+        for key in boots[0].keys():
+            timings[f"gunicorn.{key}"] = statistics.median(x[key] for x in boots)
+
+    return {
+        "timings": timings,
+        "import_by_package": summarize_by_package(imports[0]["modules"]),
+        "slowest_modules": sorted(imports[0]["modules"], key=lambda x: -x["self"])[:30]
+    }
+
+
+def _parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="The number of fresh processes per measurement.")
+    parser.add_argument(
+        "--great-expectations-directory",
+        default=os.path.join(_REPOSITORY_ROOT, "great_expectations")
+    )
+    parser.add_argument("--skip-gunicorn", action="store_true", help="Don't measure the gunicorn boot time.")
+    parser.add_argument("--output", help="Save the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare the results to this JSON file.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1,
+        help="Report a regression if a time exceeds the baseline by more than this fraction."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from .common import get_environment
+
+    arguments = _parse_arguments(argv)
+    result = run_benchmark(arguments.repeat, arguments.great_expectations_directory, arguments.skip_gunicorn)
+
+    for key, value in result["timings"].items():
+        print(f"{key:<40} {value:>8.3f} s")
+    print("\nSelf import time by package:")
+    for package, value in list(result["import_by_package"].items())[:15]:
+        print(f"  {package:<38} {value:>8.3f} s")
+
+    if arguments.output is not None:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump(dict(result, environment=get_environment()), file, indent=2)
+
+    if arguments.baseline is None:
+        return 0
+
+    with open(arguments.baseline, encoding="utf-8") as file:
+        baseline_timings: Dict[str, float] = json.load(file)["timings"]
+    regression_count = 0
+    for key, value in result["timings"].items():
+        if key not in baseline_timings or baseline_timings[key] <= 0:
+            continue
+        ratio = value / baseline_timings[key]
+        is_regression = ratio > 1 + arguments.tolerance
+        regression_count += int(is_regression)
+        print(f"{'REGRESSION' if is_regression else 'ok':<10} {key:<40} {ratio:.2f}x baseline time")
+    return 1 if regression_count > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
-from typing import Optional, Set, Iterable, List, Any
+from typing import Optional, Set, Iterable, Iterator, List, Any
 
 from datasmelldetection.core import DataSmellType
 
@@ -42,6 +42,18 @@ class Detector(ABC):
     def detect(self) -> Iterable[DetectionResult]:
         """Perform detection and return the found data smells in the form of detection results."""
 
+    def detect_iter(self) -> Iterator[DetectionResult]:
+        """
+        Perform detection and yield the found data smells as soon as they are
+        available. Callers may stop iterating at any time to abandon the
+        detection.
+
+        The default implementation yields the results returned by
+        :meth:`detect`. Detectors which can provide results progressively
+        should override this method.
+        """
+        yield from self.detect()
+
     @abstractmethod
     def get_supported_data_smell_types(self) -> Set[DataSmellType]:
         """Return a set of data smell types which the detector can find in datasets."""
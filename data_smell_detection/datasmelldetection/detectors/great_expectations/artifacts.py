@@ -0,0 +1,558 @@
+import re
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from .kernels import NumericScan, distance_to_nearest_integer, scan_numeric
+from .summaries import SignSummary
+
+T = TypeVar("T")
+
+# The cache which is used by the metric providers of the current thread
+_active = threading.local()
+
+
+def get_size_in_bytes(value: Any) -> int:
+    """
+    :param value: A cached artifact.
+    :return: The approximate memory footprint of the artifact in bytes.
+    """
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return int(value.nbytes + sum(sys.getsizeof(x) for x in value.flat))
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(get_size_in_bytes(x) for x in value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+class ColumnArtifactCache:
+    """
+    Memoizes data which is derived from a column (e.g. its null mask or its
+    sorted values) and needed by several data smells. The cache is bounded by
+    the summed size of its artifacts. If the size exceeds the limit, the
+    least recently used artifacts are evicted.
+
+    Each :class:`.DatasetWrapper` owns a cache (see
+    :attr:`.DatasetWrapper.artifact_cache`). The detector activates it while
+    expectations are validated so that the metric providers can look up
+    artifacts using the functions of this module.
+
+    Columns are identified by their name and length since the metric
+    providers receive a new series for each metric (e.g. after missing values
+    were dropped). The identity of the data is tracked per activation
+    instead: the artifacts are dropped if the cache is activated for another
+    data frame (see :meth:`activate`).
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2 ** 20):
+        """
+        :param max_bytes: The maximum summed size of the cached artifacts.
+            Artifacts which are larger than this limit are not cached.
+        """
+        assert max_bytes >= 0, "max_bytes must not be negative."
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Artifacts which are not computed from the column (see pin())
+        self._pinned: Dict[Hashable, Any] = {}
+        # The data frame which the cached artifacts were derived from
+        self._data: Optional[weakref.ref] = None
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum summed size of the cached artifacts in bytes."""
+        return self._max_bytes
+
+    @property
+    def size(self) -> int:
+        """The summed size of the cached artifacts in bytes."""
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        """The number of artifacts which were found in the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of artifacts which had to be computed."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """The number of artifacts which were evicted to meet the limit."""
+        return self._evictions
+
+    def get_or_compute(
+            self,
+            column: pd.Series,
+            artifact_name: str,
+            compute: Callable[[], T],
+            parameters: Hashable = ()
+    ) -> T:
+        """
+        :param column: The column which the artifact is derived from. The
+            column is identified by its name and length within the data
+            frame which the cache was activated for.
+        :param artifact_name: The name of the artifact (e.g. "unique_codes").
+        :param compute: Computes the artifact if it is not cached.
+        :param parameters: Additional parameters of the artifact which are
+            part of the cache key.
+        :return: The cached or computed artifact. Artifacts are shared and
+            must not be modified.
+        """
+        key = (column.name, len(column), artifact_name, parameters)
+        with self._lock:
+            pinned_key = (column.name, artifact_name, parameters)
+            if pinned_key in self._pinned:
+                return self._pinned[pinned_key]
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        # Compute outside of the lock since computing may take long and may
+        # look up other artifacts.
+        value = compute()
+        size = get_size_in_bytes(value)
+        if size > self._max_bytes:
+            return value
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, size)
+                self._size += size
+            while self._size > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+        return value
+
+    def pin(self, column_name: Hashable, artifact_name: str, value: Any, parameters: Hashable = ()):
+        """
+        Use a given value for an artifact of all columns with the given name
+        instead of computing it. This allows to validate a part of a column
+        (e.g. a row shard) using artifacts of the whole column (e.g. its
+        mean). Pinned artifacts are not counted towards the size limit.
+
+        :param column_name: The name of the column.
+        :param artifact_name: The name of the artifact.
+        :param value: The value of the artifact.
+        :param parameters: The parameters of the artifact.
+        """
+        with self._lock:
+            self._pinned[(column_name, artifact_name, parameters)] = value
+
+    def get_pinned(self, column_name: Hashable, artifact_name: str, parameters: Hashable = ()) -> Optional[Any]:
+        """
+        :param column_name: The name of the column.
+        :param artifact_name: The name of the artifact.
+        :param parameters: The parameters of the artifact.
+        :return: The pinned value of the artifact (None if it is not pinned).
+        """
+        with self._lock:
+            return self._pinned.get((column_name, artifact_name, parameters))
+
+    def clear(self):
+        """Remove all artifacts (including pinned artifacts)."""
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+            self._size = 0
+            self._data = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # Remove the cached artifacts if they were derived from another data
+    # frame. Only a weak reference is kept so that the data frame can be
+    # released (a new data frame might reuse the id of a released one).
+    def _set_data(self, data: Any):
+        with self._lock:
+            if self._data is not None and self._data() is data:
+                return
+            self._entries.clear()
+            self._size = 0
+            self._data = weakref.ref(data)
+
+    @contextmanager
+    def activate(self, data: Optional[Any] = None) -> Iterator["ColumnArtifactCache"]:
+        """
+        Use the cache in the calling thread while the context is entered
+        (e.g. while a validator computes metrics).
+
+        :param data: The data frame which the columns belong to. If it is not
+            the data frame of the previous activation, the cached artifacts
+            (but not the pinned artifacts) are removed since they might
+            belong to other columns with the same names and lengths. If None,
+            the artifacts are kept.
+        """
+        if data is not None:
+            self._set_data(data)
+        previous: Optional[ColumnArtifactCache] = getattr(_active, "cache", None)
+        _active.cache = self
+        try:
+            yield self
+        finally:
+            _active.cache = previous
+
+
+def get_active_cache() -> Optional[ColumnArtifactCache]:
+    """
+    :return: The cache which was activated in the calling thread (None if no
+        cache is active).
+    """
+    return getattr(_active, "cache", None)
+
+
+def get_artifact(
+        column: pd.Series,
+        artifact_name: str,
+        compute: Callable[[], T],
+        parameters: Hashable = ()
+) -> T:
+    """
+    Look up an artifact in the active cache. The artifact is computed
+    without caching if no cache is active.
+
+    See :meth:`ColumnArtifactCache.get_or_compute` for the parameters.
+    """
+    cache = get_active_cache()
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(column, artifact_name, compute, parameters)
+
+
+def get_pinned_artifact(column: pd.Series, artifact_name: str, parameters: Hashable = ()) -> Optional[Any]:
+    """
+    :return: The value which was pinned for an artifact of the column in the
+        active cache (None if no value is pinned or no cache is active). See
+        :meth:`ColumnArtifactCache.pin`.
+    """
+    cache = get_active_cache()
+    if cache is None:
+        return None
+    return cache.get_pinned(column.name, artifact_name, parameters)
+
+
+def get_unique_codes(column: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    :param column: The column.
+    :return: The code of each value (-1 for missing values) and the distinct
+        values in order of their first occurrence, see :func:`pandas.factorize`.
+    """
+    return get_artifact(column, "unique_codes", lambda: pd.factorize(column))
+
+
+def get_duplicated_mask(column: pd.Series) -> np.ndarray:
+    """
+    :param column: The column.
+    :return: A boolean array which is True for all occurrences of values
+        which occur more than once (like
+        :meth:`pandas.Series.duplicated` with ``keep=False``). If the values
+        which occur more than once in the whole column are pinned as
+        "duplicated_values" (e.g. because the column is a row shard), they
+        are used instead.
+    """
+    def compute() -> np.ndarray:
+        codes, uniques = get_unique_codes(column)
+        duplicated_values = get_pinned_artifact(column, "duplicated_values")
+        if duplicated_values is None:
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            is_duplicated = counts > 1
+        else:
+            is_duplicated = pd.Index(uniques).isin(duplicated_values)
+        # Missing values (code -1) are never duplicated.
+        return np.append(is_duplicated, False)[codes]
+    return get_artifact(column, "duplicated_mask", compute)
+
+
+def get_numeric_scan(column: pd.Series) -> NumericScan:
+    """
+    :param column: A numeric column.
+    :return: The moments and the sign summary of the values, computed in one
+        pass (see :func:`.scan_numeric`). The scan only holds these small
+        summaries, so it is cached regardless of the column length and shared
+        by all numeric data smells of the column.
+    """
+    return get_artifact(column, "numeric_scan", lambda: scan_numeric(column.to_numpy(dtype=np.float64)))
+
+
+def get_distance_to_nearest_integer(column: pd.Series) -> np.ndarray:
+    """
+    :param column: A numeric column.
+    :return: The absolute difference of each value to the nearest integer.
+    """
+    return get_artifact(
+        column,
+        "distance_to_nearest_integer",
+        lambda: distance_to_nearest_integer(column.to_numpy(dtype=np.float64))
+    )
+
+
+def get_non_integer_mask(column: pd.Series, epsilon: float) -> np.ndarray:
+    """
+    :param column: A numeric column.
+    :param epsilon: The maximum distance to the nearest integer.
+    :return: A boolean array which is True for values whose distance to the
+        nearest integer exceeds epsilon. The mask is computed in one pass
+        without materializing the distances (see :func:`.scan_numeric`).
+    """
+    return get_artifact(
+        column,
+        "non_integer_mask",
+        lambda: scan_numeric(column.to_numpy(dtype=np.float64), epsilon=epsilon, summarize=False).non_integer_mask,
+        parameters=(epsilon,)
+    )
+
+
+@dataclass
+class SortedView:
+    """
+    The values of a numeric column in ascending order together with their
+    positions in the column. Quantiles can be looked up in O(1) and the
+    values below or above a threshold are found by binary search.
+    """
+
+    values: np.ndarray
+    """The sorted values (float64)."""  # pylint: disable=W0105
+
+    order: np.ndarray
+    """The position in the column of each sorted value (a stable argsort)."""  # pylint: disable=W0105
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.values.nbytes + self.order.nbytes)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def quantile(self, q: float) -> float:
+        """
+        :param q: The quantile in [0, 1].
+        :return: The quantile using linear interpolation (like
+            :meth:`pandas.Series.quantile`). NaN if the column is empty.
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        :param qs: The quantiles in [0, 1].
+        :return: The quantiles using linear interpolation.
+        """
+        count = len(self.values)
+        if count == 0:
+            return np.full(len(qs), np.nan)
+        # Same arithmetic as numpy's linear percentile which is used by pandas
+        # (pandas passes the quantiles as percentages).
+        indices = np.asarray(qs, dtype=np.float64) * 100 / 100 * (count - 1)
+        below = np.floor(indices).astype(np.intp)
+        above = np.minimum(below + 1, count - 1)
+        weights_above = indices - below
+        return self.values[below] * (1 - weights_above) + self.values[above] * weights_above
+
+    def median(self) -> float:
+        """:return: The median (NaN if the column is empty)."""
+        return self.quantile(0.5)
+
+    def median_absolute_deviation(self) -> float:
+        """:return: The median of the absolute deviations from the median."""
+        if len(self.values) == 0:
+            return np.nan
+        return float(np.median(np.abs(self.values - self.median())))
+
+    def count_below(self, threshold: float, inclusive: bool = False) -> int:
+        """
+        :param threshold: The threshold.
+        :param inclusive: Whether values equal to the threshold are counted.
+        :return: The number of values below the threshold.
+        """
+        return int(np.searchsorted(self.values, threshold, side="right" if inclusive else "left"))
+
+    def count_above(self, threshold: float, inclusive: bool = False) -> int:
+        """
+        :param threshold: The threshold.
+        :param inclusive: Whether values equal to the threshold are counted.
+        :return: The number of values above the threshold.
+        """
+        return len(self.values) - int(
+            np.searchsorted(self.values, threshold, side="left" if inclusive else "right")
+        )
+
+    def find_first(self, predicate: Callable[[float], bool]) -> int:
+        """
+        Binary search for the first sorted value which satisfies a predicate.
+
+        :param predicate: A predicate which is False for all values below and
+            True for all values above some point (e.g. a threshold test on a
+            monotonic function of the value).
+        :return: The index of the first sorted value which satisfies the
+            predicate (the number of values if there is none).
+        """
+        low, high = 0, len(self.values)
+        while low < high:
+            middle = (low + high) // 2
+            if predicate(self.values[middle]):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def get_mask(self, head: int = 0, tail: int = 0) -> np.ndarray:
+        """
+        :param head: The number of smallest values to select.
+        :param tail: The number of largest values to select.
+        :return: A boolean array in column order which is True for the
+            selected values.
+        """
+        mask = np.zeros(len(self.values), dtype=bool)
+        mask[self.order[:head]] = True
+        if tail > 0:
+            mask[self.order[len(self.values) - tail:]] = True
+        return mask
+
+
+def get_sorted_view(column: pd.Series) -> SortedView:
+    """
+    :param column: A numeric column without missing values.
+    :return: The sorted view of the column. It is shared by all numeric
+        data smells of the column.
+    """
+    def compute() -> SortedView:
+        values = column.to_numpy(dtype=np.float64)
+        order = np.argsort(values, kind="mergesort")
+        return SortedView(values=values[order], order=order)
+    return get_artifact(column, "sorted_view", compute)
+
+
+def get_mean_and_standard_deviation(column: pd.Series) -> Tuple[float, float]:
+    """
+    :param column: A numeric column without missing values.
+    :return: The mean and the sample standard deviation (computed like the
+        "column.mean" and "column.standard_deviation" metrics of Great
+        Expectations). If they are pinned because the column is a row shard,
+        the values which were merged from the moments of the shards are
+        used instead.
+    """
+    return get_artifact(column, "mean_and_standard_deviation", lambda: (column.mean(), column.std()))
+
+
+def get_sign_summary(column: pd.Series) -> SignSummary:
+    """
+    :param column: A numeric column.
+    :return: The sign summary of the values. If the sign summary of the
+        whole column is pinned (e.g. because the column is a row shard), it
+        is used instead.
+    """
+    sign_summary: Optional[SignSummary] = get_pinned_artifact(column, "sign_summary")
+    if sign_summary is not None:
+        return sign_summary
+    return get_numeric_scan(column).sign_summary
+
+
+@dataclass
+class Tokenization:
+    """
+    The tokens of the distinct values of a string column stored in a flat
+    array (like a list array of Apache Arrow). The tokens of the i-th distinct
+    value are ``tokens[offsets[i]:offsets[i + 1]]``. Map per value results
+    to the rows of the column using the codes of :func:`get_unique_codes`.
+    """
+
+    tokens: np.ndarray
+    """The tokens of all distinct values (object array of strings)."""  # pylint: disable=W0105
+
+    offsets: np.ndarray
+    """The start of the tokens of each distinct value and the total token count."""  # pylint: disable=W0105
+
+    @property
+    def nbytes(self) -> int:
+        return get_size_in_bytes(self.tokens) + int(self.offsets.nbytes)
+
+    def __len__(self) -> int:
+        """:return: The number of distinct values."""
+        return len(self.offsets) - 1
+
+    def get_token_counts(self) -> np.ndarray:
+        """:return: The number of tokens of each distinct value."""
+        return np.diff(self.offsets)
+
+    def map_tokens(self, function: Callable[[str], Any], dtype: Any = bool) -> np.ndarray:
+        """
+        :param function: The function to apply to each token.
+        :param dtype: The type of the results.
+        :return: The result of the function for each token. The function is
+            called once per distinct token.
+        """
+        codes, uniques = pd.factorize(self.tokens)
+        results = np.fromiter(map(function, uniques), dtype=dtype, count=len(uniques))
+        return results[codes]
+
+    def count_per_value(self, token_flags: np.ndarray) -> np.ndarray:
+        """
+        :param token_flags: A boolean array with one element per token.
+        :return: The number of flagged tokens of each distinct value.
+        """
+        counts = np.concatenate([[0], np.cumsum(token_flags, dtype=np.int64)])
+        return counts[self.offsets[1:]] - counts[self.offsets[:-1]]
+
+    def any_per_value(self, token_flags: np.ndarray) -> np.ndarray:
+        """
+        :param token_flags: A boolean array with one element per token.
+        :return: Whether any token of each distinct value is flagged.
+        """
+        return self.count_per_value(token_flags) > 0
+
+    def all_per_value(self, token_flags: np.ndarray) -> np.ndarray:
+        """
+        :param token_flags: A boolean array with one element per token.
+        :return: Whether all tokens of each distinct value are flagged (True
+            for values without tokens).
+        """
+        return self.count_per_value(token_flags) == self.get_token_counts()
+
+
+def get_tokenization(column: pd.Series, pattern: str = r"\S+") -> Tokenization:
+    """
+    :param column: A column of strings.
+    :param pattern: The regular expression which matches a token. Each value
+        is converted to a string and tokenized using :func:`re.findall`. By
+        default, values are split on whitespace.
+    :return: The tokens of the distinct values of the column (in the order
+        of :func:`get_unique_codes`). The tokenization is shared by all data
+        smells which use the same pattern.
+    """
+    def compute() -> Tokenization:
+        _, uniques = get_unique_codes(column)
+        regex = re.compile(pattern)
+        tokens: List[str] = []
+        offsets = np.empty(len(uniques) + 1, dtype=np.int64)
+        offsets[0] = 0
+        for index, value in enumerate(uniques):
+            tokens.extend(regex.findall(str(value)))
+            offsets[index + 1] = len(tokens)
+        token_array = np.empty(len(tokens), dtype=object)
+        token_array[:] = tokens
+        return Tokenization(tokens=token_array, offsets=offsets)
+    return get_artifact(column, "tokenization", compute, parameters=(pattern,))
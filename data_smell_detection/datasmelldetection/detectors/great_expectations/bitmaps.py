@@ -0,0 +1,162 @@
+from typing import Any, Iterable, Iterator, List
+
+import numpy as np
+
+# The number of bits of a row index which select its chunk
+_CHUNK_SHIFT = 16
+_CHUNK_SIZE = 1 << _CHUNK_SHIFT
+# Chunks with more rows are stored as bitsets (which need 8 KiB, i.e. the
+# size of 4096 offsets).
+_MAX_ARRAY_LENGTH = 4096
+
+
+class RowBitmap:
+    """
+    A compressed set of row indices in the style of roaring bitmaps. The rows
+    are partitioned into chunks of 2^16 rows. A sparse chunk stores the sorted
+    offsets of its rows (2 bytes per row) and a dense chunk stores a bitset
+    (8 KiB). Empty chunks are not stored. A bitmap of the faulty rows of a
+    column is therefore much smaller than a list of the row indices.
+
+    Bitmaps are immutable. They are created using :meth:`from_indices` or
+    :meth:`from_mask`.
+    """
+
+    __slots__ = ("_keys", "_containers", "_length")
+
+    def __init__(self, keys: np.ndarray, containers: List[np.ndarray]):
+        """
+        :param keys: The sorted chunk numbers of the non-empty chunks.
+        :param containers: The container of each chunk (a sorted uint16 array
+            of offsets or a packed bitset of 8192 uint8 values).
+        """
+        self._keys = keys
+        self._containers = containers
+        self._length = sum(_get_container_length(x) for x in containers)
+
+    @classmethod
+    def from_indices(cls, indices: Iterable[int]) -> "RowBitmap":
+        """
+        :param indices: Non-negative row indices in any order (duplicates are
+            ignored).
+        :return: The bitmap of the rows.
+        """
+        if not isinstance(indices, np.ndarray):
+            indices = list(indices)
+        indices = np.unique(np.asarray(indices, dtype=np.int64))
+        if len(indices) == 0:
+            return cls(np.empty(0, dtype=np.int64), [])
+        assert indices[0] >= 0, "Row indices must not be negative."
+
+        chunks = indices >> _CHUNK_SHIFT
+        offsets = (indices & (_CHUNK_SIZE - 1)).astype(np.uint16)
+        # The positions where a new chunk starts
+        boundaries = np.flatnonzero(np.diff(chunks)) + 1
+        starts = np.concatenate([[0], boundaries])
+        stops = np.concatenate([boundaries, [len(indices)]])
+
+        containers: List[np.ndarray] = []
+        for start, stop in zip(starts, stops):
+            chunk_offsets = offsets[start:stop]
+            if len(chunk_offsets) <= _MAX_ARRAY_LENGTH:
+                containers.append(chunk_offsets.copy())
+            else:
+                bits = np.zeros(_CHUNK_SIZE, dtype=bool)
+                bits[chunk_offsets] = True
+                containers.append(np.packbits(bits, bitorder="little"))
+        return cls(chunks[starts].copy(), containers)
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray, offset: int = 0) -> "RowBitmap":
+        """
+        :param mask: A boolean array which is True for the selected rows.
+        :param offset: The row index of the first element of the mask.
+        :return: The bitmap of the selected rows.
+        """
+        return cls.from_indices(np.flatnonzero(mask) + offset)
+
+    @classmethod
+    def union(cls, bitmaps: Iterable["RowBitmap"]) -> "RowBitmap":
+        """
+        :param bitmaps: Bitmaps (e.g. of the detection results of a dataset).
+        :return: The rows which are contained in any of the bitmaps.
+        """
+        return cls.from_indices(np.concatenate([np.empty(0, dtype=np.int64)] + [x.to_indices() for x in bitmaps]))
+
+    def to_indices(self) -> np.ndarray:
+        """:return: The sorted row indices (int64)."""
+        parts = [
+            (np.int64(key) << _CHUNK_SHIFT) + _get_container_offsets(container)
+            for key, container in zip(self._keys, self._containers)
+        ]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def to_mask(self, length: int) -> np.ndarray:
+        """
+        :param length: The number of rows.
+        :return: A boolean array which is True for the contained rows (e.g.
+            to filter the rows of a data frame).
+        """
+        mask = np.zeros(length, dtype=bool)
+        indices = self.to_indices()
+        mask[indices[indices < length]] = True
+        return mask
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the containers in bytes."""
+        return int(self._keys.nbytes + sum(x.nbytes for x in self._containers))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, row: Any) -> bool:
+        if not isinstance(row, (int, np.integer)) or row < 0:
+            return False
+        key, offset = int(row) >> _CHUNK_SHIFT, int(row) & (_CHUNK_SIZE - 1)
+        position = int(np.searchsorted(self._keys, key))
+        if position == len(self._keys) or self._keys[position] != key:
+            return False
+        container = self._containers[position]
+        if container.dtype == np.uint16:
+            index = int(np.searchsorted(container, offset))
+            return index < len(container) and int(container[index]) == offset
+        return bool((container[offset >> 3] >> (offset & 7)) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.to_indices().tolist())
+
+    def __or__(self, other: "RowBitmap") -> "RowBitmap":
+        return RowBitmap.union([self, other])
+
+    def __and__(self, other: "RowBitmap") -> "RowBitmap":
+        return RowBitmap.from_indices(np.intersect1d(self.to_indices(), other.to_indices(), assume_unique=True))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, RowBitmap):
+            return NotImplemented
+        return len(self) == len(other) and np.array_equal(self.to_indices(), other.to_indices())
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"RowBitmap(length={len(self)}, nbytes={self.nbytes})"
+
+    def __getstate__(self):
+        return self._keys, self._containers, self._length
+
+    def __setstate__(self, state):
+        self._keys, self._containers, self._length = state
+
+
+# Return the offsets of the rows of a container.
+def _get_container_offsets(container: np.ndarray) -> np.ndarray:
+    if container.dtype == np.uint16:
+        return container.astype(np.int64)
+    return np.flatnonzero(np.unpackbits(container, bitorder="little")).astype(np.int64)
+
+
+def _get_container_length(container: np.ndarray) -> int:
+    if container.dtype == np.uint16:
+        return len(container)
+    return int(np.unpackbits(container).sum())
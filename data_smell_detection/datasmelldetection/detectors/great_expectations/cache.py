@@ -0,0 +1,81 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    A thread-safe mapping which holds at most `maxsize` entries. If the cache
+    is full, the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        :param maxsize: The maximum number of entries to keep. Must be positive.
+        """
+        assert maxsize > 0, "maxsize must be a positive integer."
+        self._maxsize = maxsize
+        self._lock = Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of entries."""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """The number of successful lookups."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups which did not find an entry."""
+        return self._misses
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        :param key: The key to look up.
+        :param default: The value to return if no entry exists.
+        :return: The cached value or `default`.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Store a value. The least recently used entry is evicted if the cache
+        is full.
+
+        :param key: The key of the entry.
+        :param value: The value to store.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
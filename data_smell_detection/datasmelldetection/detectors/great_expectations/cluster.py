@@ -0,0 +1,432 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import threading
+import traceback
+from collections import deque
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Deque, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .tracing import default_tracer
+
+Address = Tuple[str, int]
+
+# A job of a map call: the index of its argument, the number of previous
+# attempts and the workers (by position) which failed it
+_Job = Tuple[int, int, FrozenSet[int]]
+
+AUTHKEY_ENVIRONMENT_VARIABLE = "DATASMELLDETECTION_CLUSTER_AUTHKEY"
+"""
+The environment variable which contains the shared secret of the workers
+started from the command line.
+"""  # pylint: disable=W0105
+
+
+class ClusterError(RuntimeError):
+    """
+    Raised if a job could not be executed by any worker of a cluster (e.g.
+    because the job failed in each attempt or because all workers were lost).
+    """
+
+
+# Protocol
+#
+# Coordinator and workers exchange pickled tuples over authenticated
+# multiprocessing connections (HMAC challenge using a shared secret):
+#
+# coordinator -> worker: ("job", function, argument)
+# worker -> coordinator: ("heartbeat",) while the job runs, then either
+#                        ("result", value) or ("error", formatted traceback)
+#
+# A worker serves each connection in a thread. A coordinator keeps one
+# connection per worker and sends the next job after receiving the result of
+# the previous one.
+
+
+class ShardWorker:
+    """
+    Executes jobs (e.g. row shards of a :class:`.ShardedDetector`) which are
+    sent by a :class:`ClusterExecutor`. Since jobs are pickled functions, a
+    worker executes arbitrary code on behalf of its clients. Clients are
+    therefore authenticated using a shared secret.
+    """
+
+    def __init__(
+            self,
+            authkey: bytes,
+            address: Address = ("127.0.0.1", 0),
+            heartbeat_interval: float = 1.0):
+        """
+        :param authkey: The shared secret of the coordinator and the workers.
+        :param address: The host and port to listen on (a free port is chosen
+            if the port is 0).
+        :param heartbeat_interval: The number of seconds between two heartbeats
+            which are sent while a job runs.
+        """
+        assert authkey, "authkey must not be empty."
+        self._listener = Listener(address, authkey=authkey)
+        self._heartbeat_interval = heartbeat_interval
+        self._closed = False
+
+    @property
+    def address(self) -> Address:
+        """The address the worker listens on."""
+        return self._listener.address
+
+    def serve_forever(self):
+        """Accept connections until the worker is closed."""
+        while not self._closed:
+            try:
+                connection = self._listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError):
+                # Failed authentication or closed listener
+                continue
+            threading.Thread(target=self._serve_connection, args=(connection,), daemon=True).start()
+
+    def close(self):
+        """Stop accepting connections."""
+        self._closed = True
+        self._listener.close()
+
+    # Execute the jobs received on a connection until it is closed.
+    def _serve_connection(self, connection: Connection):
+        send_lock = threading.Lock()
+
+        def send(message: Tuple[Any, ...]):
+            with send_lock:
+                connection.send(message)
+
+        with connection:
+            while True:
+                try:
+                    message = connection.recv()
+                except (EOFError, OSError):
+                    return
+                _, function, argument = message
+
+                finished = threading.Event()
+
+                # Show the coordinator that the job is still running.
+                def send_heartbeats():
+                    while not finished.wait(self._heartbeat_interval):
+                        try:
+                            send(("heartbeat",))
+                        except (OSError, ValueError):
+                            # The coordinator closed the connection.
+                            return
+
+                heartbeat_thread = threading.Thread(target=send_heartbeats, daemon=True)
+                heartbeat_thread.start()
+                try:
+                    response: Tuple[Any, ...] = ("result", function(argument))
+                except Exception:
+                    response = ("error", traceback.format_exc())
+                finally:
+                    finished.set()
+                    heartbeat_thread.join()
+                try:
+                    send(response)
+                except (OSError, ValueError):
+                    return
+
+
+class ClusterExecutor:
+    """
+    Dispatches jobs to :class:`ShardWorker` instances (e.g. on other hosts).
+    Each worker executes one job at a time. A job is retried on another
+    worker if it failed, if its worker was lost or if its worker did not send
+    a heartbeat in time. A worker only retries a job which it failed itself
+    if every remaining worker failed the job. Lost workers don't receive
+    further jobs.
+
+    An executor can be passed to a :class:`.ShardedDetector`. Note that the
+    workers must be able to import this package and to read the dataset
+    under the same path (e.g. from a shared file system).
+    """
+
+    def __init__(
+            self,
+            addresses: List[Address],
+            authkey: bytes,
+            heartbeat_timeout: float = 10.0,
+            max_attempts: int = 3):
+        """
+        :param addresses: The addresses of the workers.
+        :param authkey: The shared secret of the coordinator and the workers.
+        :param heartbeat_timeout: The number of seconds after which a worker
+            which neither sent a heartbeat nor a result is considered lost.
+            Should be a multiple of the heartbeat interval of the workers.
+        :param max_attempts: The maximum number of times a job is executed.
+        """
+        assert addresses, "At least one worker address must be provided."
+        assert max_attempts > 0, "max_attempts must be positive."
+        self.addresses = list(addresses)
+        self.authkey = authkey
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_attempts = max_attempts
+
+    def map(self, function: Callable[[Any], Any], arguments: Iterable[Any]) -> List[Any]:
+        """
+        Apply a function to each argument using the workers.
+
+        :param function: A picklable (e.g. module level) function.
+        :param arguments: The picklable arguments.
+        :return: The results in the order of the arguments.
+        :raise ClusterError: If a job failed in each attempt or no worker is
+            left.
+        """
+        arguments = list(arguments)
+        state = _MapState(len(arguments), len(self.addresses))
+        with default_tracer.span(
+                "cluster_executor.map",
+                job_count=len(arguments),
+                worker_count=len(self.addresses)) as span:
+            threads = [
+                threading.Thread(
+                    target=self._run_worker,
+                    args=(worker, address, function, arguments, state),
+                    daemon=True
+                )
+                for worker, address in enumerate(self.addresses)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            if span is not None:
+                span.set_attribute("retry_count", state.retry_count)
+                span.set_attribute("lost_worker_count", state.lost_worker_count)
+
+        if state.error is not None:
+            raise ClusterError(state.error)
+        if state.remaining > 0:
+            raise ClusterError("All workers were lost.")
+        return state.results
+
+    # Send jobs to one worker until all jobs are done or the worker is lost.
+    def _run_worker(
+            self,
+            worker: int,
+            address: Address,
+            function: Callable[[Any], Any],
+            arguments: List[Any],
+            state: "_MapState"):
+        try:
+            connection = Client(address, authkey=self.authkey)
+        except (OSError, EOFError, multiprocessing.AuthenticationError):
+            state.lose_worker(worker, None)
+            return
+
+        with connection:
+            while True:
+                job = state.take_job(worker)
+                if job is None:
+                    return
+                index, attempt, _ = job
+                try:
+                    connection.send(("job", function, arguments[index]))
+                    response = self._receive_response(connection)
+                except (OSError, EOFError, TimeoutError):
+                    state.lose_worker(worker, job)
+                    return
+
+                if response[0] == "result":
+                    state.finish_job(index, response[1])
+                elif attempt + 1 < self.max_attempts:
+                    state.retry_job(worker, job)
+                else:
+                    state.fail(f"Job {index} failed on worker {address[0]}:{address[1]}:\n{response[1]}")
+
+    # Wait for the result of a job. TimeoutError is raised if the worker did
+    # not respond in time.
+    def _receive_response(self, connection: Connection) -> Tuple[Any, ...]:
+        while True:
+            if not connection.poll(self.heartbeat_timeout):
+                raise TimeoutError("The worker did not send a heartbeat in time.")
+            response: Tuple[Any, ...] = connection.recv()
+            if response[0] != "heartbeat":
+                return response
+
+
+class _MapState:
+    """The jobs of a :meth:`ClusterExecutor.map` call shared by its threads."""
+
+    def __init__(self, job_count: int, worker_count: int):
+        self._condition = threading.Condition()
+        # Jobs which are not running
+        self._pending: Deque[_Job] = deque((x, 0, frozenset()) for x in range(job_count))
+        self._running_count = 0
+        # The workers which were not lost
+        self._workers: Set[int] = set(range(worker_count))
+        self.results: List[Any] = [None] * job_count
+        self.remaining = job_count
+        self.error: Optional[str] = None
+        self.retry_count = 0
+        self.lost_worker_count = 0
+
+    # Return the next job for a worker (None if there are no jobs left or the
+    # map call failed). Waits while other workers may return jobs for a retry
+    # or run the pending jobs which the worker failed.
+    def take_job(self, worker: int) -> Optional[_Job]:
+        with self._condition:
+            while self.error is None:
+                job = self._find_job(worker)
+                if job is not None:
+                    self._pending.remove(job)
+                    self._running_count += 1
+                    return job
+                if not self._pending and self._running_count == 0:
+                    return None
+                self._condition.wait()
+            return None
+
+    # Return the first pending job which the worker did not fail. A failed
+    # job is only returned if every remaining worker failed it.
+    def _find_job(self, worker: int) -> Optional[_Job]:
+        for job in self._pending:
+            if worker not in job[2] or self._workers <= job[2]:
+                return job
+        return None
+
+    def finish_job(self, index: int, result: Any):
+        with self._condition:
+            self.results[index] = result
+            self.remaining -= 1
+            self._running_count -= 1
+            self._condition.notify_all()
+
+    def retry_job(self, worker: int, job: _Job):
+        with self._condition:
+            self._pending.append((job[0], job[1] + 1, job[2] | {worker}))
+            self.retry_count += 1
+            self._running_count -= 1
+            self._condition.notify_all()
+
+    # Return the job of a lost worker (if any) for a retry.
+    def lose_worker(self, worker: int, job: Optional[_Job]):
+        with self._condition:
+            self.lost_worker_count += 1
+            self._workers.discard(worker)
+            if job is not None:
+                self._pending.append((job[0], job[1] + 1, job[2]))
+                self.retry_count += 1
+                self._running_count -= 1
+            self._condition.notify_all()
+
+    def fail(self, error: str):
+        with self._condition:
+            if self.error is None:
+                self.error = error
+            self._running_count -= 1
+            self._condition.notify_all()
+
+
+class LocalCluster:
+    """
+    Starts :class:`ShardWorker` instances as processes on the local host.
+    This allows to use and to test the cluster execution on a single host.
+    """
+
+    def __init__(
+            self,
+            worker_count: int,
+            authkey: Optional[bytes] = None,
+            heartbeat_interval: float = 1.0):
+        """
+        :param worker_count: The number of worker processes.
+        :param authkey: The shared secret (a random secret if None).
+        :param heartbeat_interval: See :class:`ShardWorker`.
+        """
+        self.authkey: bytes = authkey if authkey is not None else os.urandom(32)
+        self._processes: List[multiprocessing.Process] = []
+        self.addresses: List[Address] = []
+        try:
+            for _ in range(worker_count):
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(
+                    target=_run_local_worker,
+                    args=(sender, self.authkey, heartbeat_interval),
+                    daemon=True
+                )
+                process.start()
+                sender.close()
+                self._processes.append(process)
+                self.addresses.append(receiver.recv())
+                receiver.close()
+        except:
+            self.close()
+            raise
+
+    def get_executor(self, **kwargs: Any) -> ClusterExecutor:
+        """
+        :param kwargs: Additional arguments of :class:`ClusterExecutor`.
+        :return: An executor which uses the workers of this cluster.
+        """
+        return ClusterExecutor(self.addresses, self.authkey, **kwargs)
+
+    def terminate_worker(self, index: int):
+        """
+        Terminate a worker process (e.g. to simulate a failure).
+
+        :param index: The position of the worker in :attr:`addresses`.
+        """
+        self._processes[index].terminate()
+        self._processes[index].join()
+
+    def close(self):
+        """Terminate all worker processes."""
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+    def __enter__(self) -> "LocalCluster":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# Start a worker and send its address to the parent process (executed in a
+# LocalCluster process).
+def _run_local_worker(connection: Connection, authkey: bytes, heartbeat_interval: float):
+    worker = ShardWorker(authkey, heartbeat_interval=heartbeat_interval)
+    connection.send(worker.address)
+    connection.close()
+    worker.serve_forever()
+
+
+def _parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Start a worker for row sharded data smell detection.")
+    parser.add_argument("--host", default="127.0.0.1", help="The host to listen on.")
+    parser.add_argument("--port", type=int, default=7077, help="The port to listen on.")
+    parser.add_argument(
+        "--heartbeat-interval", type=float, default=1.0,
+        help="The number of seconds between two heartbeats."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = _parse_arguments(argv)
+    authkey: Optional[str] = os.environ.get(AUTHKEY_ENVIRONMENT_VARIABLE)
+    if not authkey:
+        print(f"The shared secret must be set in {AUTHKEY_ENVIRONMENT_VARIABLE}.", file=sys.stderr)
+        return 2
+    worker = ShardWorker(
+        authkey.encode("utf-8"),
+        address=(arguments.host, arguments.port),
+        heartbeat_interval=arguments.heartbeat_interval
+    )
+    print(f"Listening on {worker.address[0]}:{worker.address[1]}", flush=True)
+    try:
+        worker.serve_forever()
+    except KeyboardInterrupt:
+        worker.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,6 @@
-from typing import Optional
+from threading import Lock, local
+from typing import Optional, Dict, List, Tuple
+from weakref import finalize
 
 from great_expectations import DataContext
 
@@ -61,3 +63,133 @@ class GreatExpectationsContextBuilder:
             context_root_dir=self._context_root_dir,
             runtime_environment=runtime_environment
         )
+
+    def build_cached(self, pool: Optional["GreatExpectationsContextPool"] = None) -> DataContext:
+        """
+        Return a reusable Great Expectations context object of the calling
+        thread for the configured directories. The context is only
+        constructed if the pool has no context for the directories which is
+        not in use by another thread.
+
+        :param pool: The :class:`.GreatExpectationsContextPool` to use. If it
+            is None, the :data:`.default_context_pool` is used.
+        :return: The :class:`~great_expectations.DataContext` object of the
+            calling thread. It must not be passed to other threads.
+        """
+        if pool is None:
+            pool = default_context_pool
+        return pool.get_context(self._context_root_dir, self._data_directory)
+
+
+class _ContextOwner:
+    # The contexts of a thread which are stored in the thread-local storage
+    # of a GreatExpectationsContextPool.
+    __slots__ = ("generation", "contexts", "__weakref__")
+
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.contexts: Dict[Tuple[str, str], DataContext] = dict()
+
+
+class GreatExpectationsContextPool:
+    """
+    A thread-safe pool of :class:`great_expectations.DataContext` instances.
+
+    Constructing a context parses the great_expectations.yml configuration
+    file and instantiates all stores and data sources. A context itself is
+    not thread-safe (e.g. its stores and its data source cache are modified
+    while datasets are loaded). This class therefore hands out one context
+    per (context_root_dir, data_directory) pair and thread. A thread keeps
+    its contexts until it terminates. Afterwards they are handed to other
+    threads, so that applications which start a thread per request (e.g. the
+    Django development server) do not construct a context per request.
+    """
+
+    def __init__(self):
+        # Guards the idle contexts and the generation.
+        self._lock = Lock()
+        # The contexts of terminated threads which can be reused.
+        self._idle_contexts: Dict[Tuple[str, str], List[DataContext]] = dict()
+        # Incremented by clear() to discard the contexts of all threads.
+        self._generation = 0
+        # Stores the _ContextOwner of each thread.
+        self._local = local()
+
+    def get_context(self, context_root_dir: str, data_directory: str) -> DataContext:
+        """
+        Get the context of the calling thread for the specified directories.
+        The context is constructed using a
+        :class:`.GreatExpectationsContextBuilder` if neither the calling
+        thread nor a terminated thread used a context for the directories
+        before.
+
+        :param context_root_dir: A directory containing the great_expectations.yml
+            configuration file.
+        :param data_directory: A directory which contains CSV files that should
+            be imported.
+        :return: The :class:`~great_expectations.DataContext` object of the
+            calling thread. It must not be passed to other threads.
+        """
+        key = (context_root_dir, data_directory)
+        contexts = self._get_owner().contexts
+
+        context = contexts.get(key)
+        if context is None:
+            with self._lock:
+                idle_contexts = self._idle_contexts.get(key)
+                context = idle_contexts.pop() if idle_contexts else None
+            if context is None:
+                # Construct the context without holding the lock to allow
+                # other threads to retrieve contexts in the meantime.
+                context = GreatExpectationsContextBuilder(context_root_dir, data_directory).build()
+            contexts[key] = context
+        return context
+
+    # Return the _ContextOwner of the calling thread. Its contexts are
+    # released when it is garbage collected, i.e. when the thread terminates
+    # or when the pool was cleared.
+    def _get_owner(self) -> _ContextOwner:
+        with self._lock:
+            generation = self._generation
+        owner: Optional[_ContextOwner] = getattr(self._local, "owner", None)
+        if owner is None or owner.generation != generation:
+            owner = _ContextOwner(generation)
+            finalizer = finalize(owner, self._release, generation, owner.contexts)
+            finalizer.atexit = False
+            self._local.owner = owner
+        return owner
+
+    # Make the contexts of a terminated thread available to other threads.
+    def _release(self, generation: int, contexts: Dict[Tuple[str, str], DataContext]):
+        with self._lock:
+            if generation != self._generation:
+                # The pool was cleared in the meantime.
+                return
+            for key, context in contexts.items():
+                self._idle_contexts.setdefault(key, []).append(context)
+
+    def clear(self):
+        """
+        Discard all contexts. Threads construct new contexts on their next
+        call of :meth:`get_context`.
+        """
+        with self._lock:
+            self._generation += 1
+            self._idle_contexts.clear()
+
+    def __len__(self) -> int:
+        """
+        :return: The number of contexts of the calling thread.
+        """
+        owner: Optional[_ContextOwner] = getattr(self._local, "owner", None)
+        with self._lock:
+            if owner is None or owner.generation != self._generation:
+                return 0
+        return len(owner.contexts)
+
+
+default_context_pool: GreatExpectationsContextPool = GreatExpectationsContextPool()
+"""
+The default :class:`.GreatExpectationsContextPool` which is used by
+:meth:`.GreatExpectationsContextBuilder.build_cached`.
+"""  # pylint: disable=W0105
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Iterable, List, Dict, Any
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Mapping, Tuple
 
 from great_expectations.profile.base import ProfilerDataType
 from great_expectations.validator.validator import (
@@ -9,11 +9,14 @@ from great_expectations.validator.validator import (
     ExpectationValidationResult
 )
 
+from datasmelldetection.core.datasmells import DataSmellType
 from datasmelldetection.core.detector import (
     DetectionResult,
     DetectionStatistics
 )
+from .bitmaps import RowBitmap
 from .datasmell import DataSmellRegistry
+from .tracing import default_tracer
 
 
 @dataclass
@@ -32,6 +35,96 @@ class ExtendedDetectionResult(DetectionResult):
     Expectation which performed the data smell detection.
     """  # pylint: disable=W0105
 
+    faulty_row_indices: Optional[List[Any]] = None
+    """
+    The row indices of all faulty elements. This field is only set if the
+    complete result format was used for validation.
+    """  # pylint: disable=W0105
+
+
+class CompactDetectionResult:
+    """
+    A variant of :class:`ExtendedDetectionResult` which needs less memory to
+    keep the results of large datasets. The result uses `__slots__`, keeps the faulty elements as a
+    (bounded) tuple of samples and stores the rows of all faulty elements as
+    a :class:`.RowBitmap` instead of a list. The rows allow to filter the
+    dataset without detecting the data smells again.
+
+    Compact results are created by the :class:`CompactResultConverter`.
+    """
+
+    __slots__ = (
+        "data_smell_type",
+        "column_name",
+        "column_type",
+        "total_element_count",
+        "faulty_element_count",
+        "faulty_elements",
+        "expectation_kwargs",
+        "faulty_rows"
+    )
+
+    def __init__(
+            self,
+            data_smell_type: DataSmellType,
+            column_name: str,
+            column_type: ProfilerDataType,
+            total_element_count: int,
+            faulty_element_count: int,
+            faulty_elements: Tuple[Any, ...],
+            expectation_kwargs: Dict[str, Any],
+            faulty_rows: Optional[RowBitmap] = None):
+        """
+        :param data_smell_type: The type of the detected data smell.
+        :param column_name: The column where the data smell was found.
+        :param column_type: The type of the column.
+        :param total_element_count: The number of analyzed elements.
+        :param faulty_element_count: The number of faulty elements.
+        :param faulty_elements: A subset of the faulty elements.
+        :param expectation_kwargs: The kwargs of the expectation which
+            detected the data smell.
+        :param faulty_rows: The rows of all faulty elements (None if they were
+            not collected).
+        """
+        self.data_smell_type = data_smell_type
+        self.column_name = column_name
+        self.column_type = column_type
+        self.total_element_count = total_element_count
+        self.faulty_element_count = faulty_element_count
+        self.faulty_elements = faulty_elements
+        self.expectation_kwargs = expectation_kwargs
+        self.faulty_rows = faulty_rows
+
+    @property
+    def statistics(self) -> DetectionStatistics:
+        """The statistics like in :attr:`.DetectionResult.statistics`."""
+        return DetectionStatistics(
+            total_element_count=self.total_element_count,
+            faulty_element_count=self.faulty_element_count
+        )
+
+    def to_detection_result(self) -> ExtendedDetectionResult:
+        """:return: The equivalent :class:`ExtendedDetectionResult`."""
+        return ExtendedDetectionResult(
+            data_smell_type=self.data_smell_type,
+            column_name=self.column_name,
+            statistics=self.statistics,
+            faulty_elements=list(self.faulty_elements),
+            column_type=self.column_type,
+            expectation_kwargs=self.expectation_kwargs,
+            faulty_row_indices=list(self.faulty_rows) if self.faulty_rows is not None else None
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactDetectionResult):
+            return NotImplemented
+        return all(getattr(self, x) == getattr(other, x) for x in self.__slots__)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return "CompactDetectionResult(" + ", ".join(f"{x}={getattr(self, x)!r}" for x in self.__slots__) + ")"
+
 
 class DetectionResultConverter(ABC):
     """
@@ -53,6 +146,30 @@ class DetectionResultConverter(ABC):
         to :class:`~.ExtendedDetectionResult` instances.
         """
 
+    def convert_validation_results(
+            self,
+            validation_results: Iterable[ExpectationValidationResult]
+    ) -> Iterable[ExtendedDetectionResult]:
+        """
+        Convert a subset of the expectation validation results of a suite
+        (e.g. the results for one column). This method is used to convert
+        results progressively.
+
+        The default implementation wraps the validation results into an
+        :class:`~great_expectations.validator.validator.ExpectationSuiteValidationResult`
+        and passes it to :meth:`convert`. Subclasses may override this
+        method to avoid the wrapping.
+
+        :param validation_results: The validation results to convert.
+        :return: The resulting data smell detection results.
+        """
+        validation_results = list(validation_results)
+        suite_validation_result = ExpectationSuiteValidationResult(
+            success=all(x.success for x in validation_results),
+            results=validation_results
+        )
+        return self.convert(suite_validation_result)
+
     @property
     def meta(self) -> Dict[str, Any]:
         """Additional meta information which converters can use."""
@@ -132,52 +249,123 @@ class StandardResultConverter(DetectionResultConverter):
             expectation suite.
         :return: The resulting data smell detection results.
         """
-        # Lookup dictionary which maps the expectation type (as found in an
-        # ExpectationSuiteValidationResult to data smell types.
-        data_smell_type_dict = self.registry.get_expectation_type_to_data_smell_type_dict()
-
-        detected_data_smells = []
-
         # Validated expectations (unfiltered)
         expectation_validation_results: List[ExpectationValidationResult] = \
             validation_suite_result.results
 
+        with default_tracer.span(
+                "converter.convert",
+                result_count=len(expectation_validation_results)):
+            return list(self.convert_validation_results(expectation_validation_results))
+
+    def convert_validation_results(
+            self,
+            validation_results: Iterable[ExpectationValidationResult]
+    ) -> Iterator[ExtendedDetectionResult]:
+        """
+        Lazily convert expectation validation results to detection results.
+        Each detection result is yielded as soon as the corresponding
+        validation result has been converted.
+
+        :param validation_results: The validation results to convert.
+        :return: An iterator over the resulting data smell detection results.
+        """
+        # Lookup dictionary which maps the expectation type (as found in an
+        # ExpectationSuiteValidationResult to data smell types. The read-only
+        # mapping of the registry snapshot is used to avoid copying.
+        data_smell_type_dict = self.registry.snapshot().get_expectation_type_to_data_smell_type_dict()
+
         # Only keep relevant results
         filtered_validation_results: Iterable[ExpectationValidationResult] = \
-            filter(self.filter_callback, expectation_validation_results)
+            filter(self.filter_callback, validation_results)
 
         for validation_result in filtered_validation_results:
-            # At the time of writing exceptions are ignored
-            # since the detection result conversion should proceed even if a
-            # minor number of exceptions were raised. The invalid validation
-            # results are stored in the _invalid_validation_results list.
-            try:
-                detection_statistics = DetectionStatistics(
-                    total_element_count=validation_result.result["element_count"],
-                    faulty_element_count=validation_result.result["unexpected_count"]
-                )
-
-                # Column where the data smell is present
-                column_name = validation_result.expectation_config["kwargs"]["column"]
-                # A subset of fault elements which contain the data smell.
-                faulty_elements = validation_result.result["partial_unexpected_list"]
-                # The type of the data smell which is present in the corresponding
-                # column.
-                expectation_type: str = validation_result.expectation_config["expectation_type"]
-                data_smell_type = data_smell_type_dict[expectation_type]
-                # Get column type from passed meta information
-                column_type: ProfilerDataType = self.meta["column_types"][column_name]
-
-                detection_result = ExtendedDetectionResult(
-                    column_name=column_name,
-                    statistics=detection_statistics,
-                    faulty_elements=faulty_elements,
-                    data_smell_type=data_smell_type,
-                    column_type=column_type,
-                    expectation_kwargs=validation_result.expectation_config["kwargs"]
-                )
-                detected_data_smells.append(detection_result)
-            except:
-                self._invalid_validation_results.append(validation_result)
-
-        return detected_data_smells
+            detection_result = self._convert_validation_result(
+                validation_result,
+                data_smell_type_dict
+            )
+            if detection_result is not None:
+                yield detection_result
+
+    # Convert one validation result. None is returned if the conversion
+    # failed.
+    def _convert_validation_result(
+            self,
+            validation_result: ExpectationValidationResult,
+            data_smell_type_dict: Mapping[str, DataSmellType]
+    ) -> Optional[ExtendedDetectionResult]:
+        # At the time of writing exceptions are ignored
+        # since the detection result conversion should proceed even if a
+        # minor number of exceptions were raised. The invalid validation
+        # results are stored in the _invalid_validation_results list.
+        try:
+            detection_statistics = DetectionStatistics(
+                total_element_count=validation_result.result["element_count"],
+                faulty_element_count=validation_result.result["unexpected_count"]
+            )
+
+            # Column where the data smell is present
+            column_name = validation_result.expectation_config["kwargs"]["column"]
+            # A subset of fault elements which contain the data smell. The
+            # list is missing if no faulty elements were requested.
+            faulty_elements = validation_result.result.get("partial_unexpected_list", [])
+            # The indices of all faulty rows (only present for the complete
+            # result format).
+            faulty_row_indices = validation_result.result.get("unexpected_index_list")
+            # The type of the data smell which is present in the corresponding
+            # column.
+            expectation_type: str = validation_result.expectation_config["expectation_type"]
+            data_smell_type = data_smell_type_dict[expectation_type]
+            # Get column type from passed meta information
+            column_type: ProfilerDataType = self.meta["column_types"][column_name]
+
+            return self._create_detection_result(
+                column_name=column_name,
+                statistics=detection_statistics,
+                faulty_elements=faulty_elements,
+                data_smell_type=data_smell_type,
+                column_type=column_type,
+                # The expectation configurations are shared by cached
+                # expectation suites (see DataSmellAwareProfiler) and must
+                # not be modified by users of the result.
+                expectation_kwargs=deepcopy(validation_result.expectation_config["kwargs"]),
+                faulty_row_indices=faulty_row_indices
+            )
+        except:
+            self._invalid_validation_results.append(validation_result)
+            return None
+
+    # Create the detection result from the extracted fields.
+    def _create_detection_result(self, **fields: Any) -> Any:
+        return ExtendedDetectionResult(**fields)
+
+
+class CompactResultConverter(StandardResultConverter):
+    """
+    A :class:`StandardResultConverter` which creates
+    :class:`CompactDetectionResult` instances. The rows of the faulty
+    elements are only available if the complete result detail is used (see
+    :attr:`.ResultDetail.COMPLETE`). They are converted to bitmaps as soon as
+    a validation result is converted, so the lists of Great Expectations are
+    not kept. This requires integer row indices (e.g. the default index of a
+    loaded CSV file).
+
+    The converter only reduces the memory which is needed to keep the
+    results. Great Expectations builds the lists of all faulty values and
+    row indices of an expectation before its result is converted, so the
+    peak memory usage of the validation is not reduced.
+    """
+
+    def _create_detection_result(self, **fields: Any) -> Any:
+        faulty_row_indices: Optional[List[Any]] = fields["faulty_row_indices"]
+        statistics: DetectionStatistics = fields["statistics"]
+        return CompactDetectionResult(
+            data_smell_type=fields["data_smell_type"],
+            column_name=fields["column_name"],
+            column_type=fields["column_type"],
+            total_element_count=statistics.total_element_count,
+            faulty_element_count=statistics.faulty_element_count,
+            faulty_elements=tuple(fields["faulty_elements"]),
+            expectation_kwargs=fields["expectation_kwargs"],
+            faulty_rows=RowBitmap.from_indices(faulty_row_indices) if faulty_row_indices is not None else None
+        )
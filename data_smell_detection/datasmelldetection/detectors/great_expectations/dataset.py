@@ -1,10 +1,16 @@
-from typing import Set, Optional, Iterator
+import os
+from typing import Set, Optional, Iterator, List, Dict, Any
 from great_expectations import DataContext
 from great_expectations.core.batch import BatchRequest
 from great_expectations.dataset.pandas_dataset import PandasDataset
 import great_expectations
+import pandas as pd
 
 import datasmelldetection.core
+from .artifacts import ColumnArtifactCache
+from .memory import MemoryEstimate, estimate_memory_usage
+from .tracing import default_tracer
+from .transport import SharedFrame
 
 
 class DatasetWrapper(datasmelldetection.core.Dataset):
@@ -12,35 +18,148 @@ class DatasetWrapper(datasmelldetection.core.Dataset):
     A thin wrapper around :class:`great_expectations.dataset.Dataset`.
 
     This class is required in order to allow consistent retrieval of column names.
+
+    If the path of the underlying CSV file is known, the dataset may be loaded
+    lazily on first access. This allows to estimate the memory footprint and
+    to load only a subset of the columns before the whole file is loaded.
     """
 
     def __init__(
             self,
-            dataset: great_expectations.dataset.Dataset,
-            batch_request: BatchRequest):
+            dataset: Optional[great_expectations.dataset.Dataset],
+            batch_request: BatchRequest,
+            path: Optional[str] = None,
+            reader_options: Optional[Dict[str, Any]] = None,
+            artifact_cache: Optional[ColumnArtifactCache] = None):
         """
         :param dataset: The :class:`great_expectations.dataset.Dataset` which should be
-            wrapped.
+            wrapped. If None, the dataset is loaded from `path` on first access.
         :param batch_request: The :class:`~great_expectations.core.batch.BatchRequest`
             which was used to import the wrapped
             :class:`great_expectations.dataset.Dataset`.
+        :param path: The CSV file which contains the dataset (required if
+            `dataset` is None).
+        :param reader_options: Keyword arguments for :func:`pandas.read_csv`
+            which are used to load the CSV file.
+        :param artifact_cache: The cache for data derived from the columns
+            (a cache with the default size limit is created if None).
         """
-
+        assert dataset is not None or path is not None, "Either dataset or path must be provided."
         self._dataset = dataset
         self._batch_request = batch_request
+        self._path = path
+        self._reader_options: Dict[str, Any] = dict(reader_options or {})
+        # Column names of a dataset which is not loaded yet (read from the
+        # header on demand)
+        self._column_names: Optional[List[str]] = None
+        self._artifact_cache = artifact_cache if artifact_cache is not None else ColumnArtifactCache()
+
+    @property
+    def artifact_cache(self) -> ColumnArtifactCache:
+        """
+        The cache for data which is derived from the columns of the dataset
+        and shared between data smells (e.g. null masks or sorted values).
+        """
+        return self._artifact_cache
 
     def get_column_names(self) -> Set[str]:
         """
         :return: The column names of the wrapped dataset.
         """
+        if self._dataset is None:
+            return set(self.get_ordered_column_names())
         return set(self._dataset.get_table_columns())
 
+    def get_ordered_column_names(self) -> List[str]:
+        """
+        :return: The column names of the wrapped dataset in the order of the
+            file. If the dataset is not loaded yet, only the header is read.
+        """
+        if self._dataset is not None:
+            return list(self._dataset.get_table_columns())
+        if self._column_names is None:
+            header: pd.DataFrame = pd.read_csv(self._path, nrows=0, **self._reader_options)
+            self._column_names = [str(x) for x in header.columns]
+        return list(self._column_names)
+
+    def is_loaded(self) -> bool:
+        """
+        :return: True if the whole dataset is held in memory.
+        """
+        return self._dataset is not None
+
+    def get_path(self) -> Optional[str]:
+        """
+        :return: The CSV file which contains the dataset (None if unknown).
+        """
+        return self._path
+
+    def get_reader_options(self) -> Dict[str, Any]:
+        """
+        :return: The keyword arguments for :func:`pandas.read_csv` which are
+            used to load the CSV file.
+        """
+        return dict(self._reader_options)
+
     def get_great_expectations_dataset(self) -> great_expectations.dataset.Dataset:
         """
-        :return: The wrapped :class:`great_expectations.dataset.Dataset`.
+        :return: The wrapped :class:`great_expectations.dataset.Dataset`. The
+            dataset is loaded if this did not happen yet.
         """
+        if self._dataset is None:
+            self._dataset = PandasDataset(self.read_columns(None))
         return self._dataset
 
+    def read_columns(self, column_names: Optional[List[str]]) -> pd.DataFrame:
+        """
+        Load a subset of the columns. The result is not kept by the wrapper.
+
+        :param column_names: The columns to load (all columns if None).
+        :return: The loaded columns in the order of the file.
+        """
+        if self._dataset is not None:
+            if column_names is None:
+                return self._dataset
+            return self._dataset[[x for x in self._dataset.columns if x in set(column_names)]]
+        with default_tracer.span("dataset.read_columns", path=self._path):
+            if column_names is None:
+                return pd.read_csv(self._path, **self._reader_options)
+            return pd.read_csv(self._path, usecols=list(column_names), **self._reader_options)
+
+    def share(
+            self,
+            column_names: Optional[List[str]] = None,
+            use_shared_memory: Optional[bool] = None
+    ) -> SharedFrame:
+        """
+        Place columns in shared memory so that worker processes can access
+        them without pickling the dataset (see :class:`.SharedFrame`).
+
+        :param column_names: The columns to share (all columns if None).
+        :param use_shared_memory: See :class:`.SharedFrame`.
+        :return: The shared columns. The caller must close the frame.
+        """
+        with default_tracer.span("dataset.share", path=self._path):
+            return SharedFrame(self.read_columns(column_names), use_shared_memory=use_shared_memory)
+
+    def estimate_memory_usage(self, sample_row_count: int = 1000) -> MemoryEstimate:
+        """
+        Estimate the in-memory footprint of the dataset. If the dataset is
+        loaded, its actual size is returned. Otherwise, the size is estimated
+        from the file size and the first rows of the file.
+
+        :param sample_row_count: The number of rows to load for the estimate.
+        :return: The (estimated) footprint.
+        """
+        if self._dataset is not None:
+            column_bytes = self._dataset.memory_usage(deep=True, index=False)
+            return MemoryEstimate(
+                row_count=len(self._dataset),
+                column_bytes={str(x): int(column_bytes[x]) for x in self._dataset.columns},
+                is_exact=True
+            )
+        return estimate_memory_usage(self._path, sample_row_count, self._reader_options)
+
     def get_batch_request(self) -> BatchRequest:
         """
         :return: The :class:`~great_expectations.core.batch.BatchRequest` which
@@ -91,6 +210,7 @@ class FileBasedDatasetManager(datasmelldetection.core.DatasetManager):
         # Build batch request with no filename => needed to get all available
         # batch definitions
         batch_request = self.build_batch_request(None)
+        self._refresh_data_references(batch_request)
         batch_definitions = self._datasource.get_available_batch_definitions(batch_request)
 
         def extract_filename(x):
@@ -100,16 +220,41 @@ class FileBasedDatasetManager(datasmelldetection.core.DatasetManager):
         filenames: Iterator[str] = map(extract_filename, batch_definitions)
         return set(filenames)
 
-    def get_dataset(self, dataset_identifier: str) -> DatasetWrapper:
+    def get_dataset(self, dataset_identifier: str, lazy: bool = False) -> DatasetWrapper:
         """
         :param dataset_identifier: The dataset identifier (e.g. file name of the CSV file)
             to import.
+        :param lazy: If True, the dataset is not loaded before it is accessed.
+            This allows the detector to check the memory budget (see
+            :attr:`.DataSmellAwareConfiguration.max_memory`) and to load the
+            columns in batches.
         :return: The imported dataset.
         """
 
-        batch_request = self.build_batch_request(filename=dataset_identifier)
-        batch = self._datasource.get_single_batch_from_batch_request(batch_request)
-        dataset: great_expectations.dataset.Dataset = PandasDataset(batch.data.dataframe)
+        with default_tracer.span(
+                "dataset_manager.get_dataset",
+                dataset_identifier=dataset_identifier,
+                lazy=lazy) as span:
+            batch_request = self.build_batch_request(filename=dataset_identifier)
+            path: str = os.path.join(
+                self._datasource.data_connectors[batch_request.data_connector_name].base_directory,
+                dataset_identifier
+            )
+            if lazy:
+                return DatasetWrapper(None, batch_request=batch_request, path=path)
+
+            self._refresh_data_references(batch_request)
+            batch = self._datasource.get_single_batch_from_batch_request(batch_request)
+            dataset: great_expectations.dataset.Dataset = PandasDataset(batch.data.dataframe)
+            if span is not None:
+                span.set_attribute("row_count", len(dataset))
         # Construct internal dataset wrapper to enable consistent column name
         # access.
-        return DatasetWrapper(dataset, batch_request=batch_request)
+        return DatasetWrapper(dataset, batch_request=batch_request, path=path)
+
+    # The data connector only lists the files of the data directory while its
+    # cache of file references is empty. Contexts are reused (see
+    # GreatExpectationsContextBuilder.build_cached), so the cache is refreshed
+    # to find files which were added after the first lookup.
+    def _refresh_data_references(self, batch_request: BatchRequest):
+        self._datasource.data_connectors[batch_request.data_connector_name]._refresh_data_references_cache()
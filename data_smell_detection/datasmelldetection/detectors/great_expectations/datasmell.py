@@ -2,7 +2,9 @@ from abc import ABC
 import copy
 from dataclasses import dataclass
 from inspect import isabstract
-from typing import Set, Optional, Dict
+from threading import Lock
+from types import MappingProxyType
+from typing import Set, Optional, Dict, FrozenSet, Mapping, Any
 from great_expectations.exceptions import InvalidExpectationConfigurationError
 from great_expectations.expectations.expectation import Expectation
 from great_expectations.profile.base import ProfilerDataType
@@ -24,8 +26,121 @@ class DataSmellMetadata:
     """Column types for which smell detection should be performed."""  # pylint: disable=W0105
 
 
+class DataSmellRegistrySnapshot:
+    """
+    An immutable copy of the contents of a :class:`.DataSmellRegistry`.
+
+    All lookup results are precomputed read-only mappings, so lookups do not
+    allocate and snapshots can be shared between threads. Snapshots are
+    hashable and compare equal if their contents are equal. Snapshots are
+    created using :meth:`.DataSmellRegistry.snapshot`.
+    """
+
+    __slots__ = (
+        "_profiler_data_type_specific_data_smells",
+        "_expectation_type_to_data_smell_type",
+        "_registered_data_smells",
+        "_key",
+        "_hash"
+    )
+
+    def __init__(
+            self,
+            profiler_data_type_specific_data_smells: Dict[ProfilerDataType, Dict[DataSmellType, str]],
+            expectation_type_to_data_smell_type: Dict[str, DataSmellType]):
+        """
+        :param profiler_data_type_specific_data_smells: The data smells (and
+            the corresponding expectation types) for each ProfilerDataType.
+        :param expectation_type_to_data_smell_type: The mapping from
+            expectation types to data smell types.
+        """
+        self._profiler_data_type_specific_data_smells: Mapping[ProfilerDataType, Mapping[DataSmellType, str]] = \
+            MappingProxyType({
+                data_type: MappingProxyType(dict(profiler_data_type_specific_data_smells.get(data_type, {})))
+                for data_type in ProfilerDataType
+            })
+        self._expectation_type_to_data_smell_type: Mapping[str, DataSmellType] = \
+            MappingProxyType(dict(expectation_type_to_data_smell_type))
+        self._registered_data_smells: FrozenSet[DataSmellType] = \
+            frozenset(expectation_type_to_data_smell_type.values())
+
+        # Hashable representation of the contents (used for comparisons).
+        self._key = (
+            frozenset(
+                (data_type, frozenset(smells.items()))
+                for data_type, smells in self._profiler_data_type_specific_data_smells.items()
+            ),
+            frozenset(self._expectation_type_to_data_smell_type.items())
+        )
+        self._hash = hash(self._key)
+
+    def get_smell_dict_for_profiler_data_type(self, profiler_data_type: ProfilerDataType) -> \
+            Mapping[DataSmellType, str]:
+        """
+        See :meth:`.DataSmellRegistry.get_smell_dict_for_profiler_data_type`.
+
+        :return: A read-only mapping from data smell types to expectation types.
+        """
+        return self._profiler_data_type_specific_data_smells[profiler_data_type]
+
+    def get_expectation_type_to_data_smell_type_dict(self) -> Mapping[str, DataSmellType]:
+        """
+        See :meth:`.DataSmellRegistry.get_expectation_type_to_data_smell_type_dict`.
+
+        :return: A read-only mapping from expectation types to data smell types.
+        """
+        return self._expectation_type_to_data_smell_type
+
+    def get_registered_data_smells(self) -> FrozenSet[DataSmellType]:
+        """
+        See :meth:`.DataSmellRegistry.get_registered_data_smells`.
+
+        :return: The frozen set of registered data smell types.
+        """
+        return self._registered_data_smells
+
+    def snapshot(self) -> "DataSmellRegistrySnapshot":
+        """
+        :return: The snapshot itself. This method allows snapshots to be used
+            wherever a :class:`.DataSmellRegistry` is accepted.
+        """
+        return self
+
+    # Snapshots are immutable => copies can share the instance.
+    def __copy__(self) -> "DataSmellRegistrySnapshot":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "DataSmellRegistrySnapshot":
+        return self
+
+    # Read-only mappings can't be pickled => pickle the plain dictionaries.
+    def __reduce__(self):
+        return (
+            DataSmellRegistrySnapshot,
+            (
+                {k: dict(v) for k, v in self._profiler_data_type_specific_data_smells.items()},
+                dict(self._expectation_type_to_data_smell_type)
+            )
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, DataSmellRegistrySnapshot):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
 class DataSmellRegistry:
-    """Store expectations for specific column types."""
+    """
+    Store expectations for specific column types.
+
+    Registrations are guarded by a lock. Code which performs lookups while
+    other threads might register data smells (e.g. detectors) should use an
+    immutable :class:`.DataSmellRegistrySnapshot` obtained from
+    :meth:`snapshot`.
+    """
 
     def __init__(self):
         # Store the data smells for each profiler type.
@@ -41,6 +156,23 @@ class DataSmellRegistry:
         # Type: Dict[str, DataSmellType]
         self._expectation_type_to_data_smell_type = dict()
 
+        # Guards registrations and the creation of snapshots.
+        self._lock = Lock()
+        # The snapshot of the current contents (created on demand and
+        # discarded if a data smell is registered).
+        self._snapshot: Optional[DataSmellRegistrySnapshot] = None
+
+    # Locks can't be copied or pickled => exclude the lock from the state.
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_snapshot"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
     def register(self, metadata: DataSmellMetadata, expectation_type: str):
         """
         Store a new mapping between a data smell and the corresponding Great Expectations
@@ -49,11 +181,34 @@ class DataSmellRegistry:
         :param metadata: Information about the smell detection.
         :param expectation_type: The type of the Great Expectations expectation.
         """
-        for data_type in metadata.profiler_data_types:
-            self._profiler_data_type_specific_data_smells[data_type][metadata.data_smell_type] = expectation_type
+        with self._lock:
+            for data_type in metadata.profiler_data_types:
+                self._profiler_data_type_specific_data_smells[data_type][metadata.data_smell_type] = expectation_type
+
+            self._expectation_type_to_data_smell_type[expectation_type] = \
+                metadata.data_smell_type
+
+            # Snapshots are immutable => create a new one on demand.
+            self._snapshot = None
+
+    def snapshot(self) -> DataSmellRegistrySnapshot:
+        """
+        Get an immutable copy of the current contents of the registry. The
+        snapshot is only recomputed after a data smell has been registered.
+
+        :return: The :class:`.DataSmellRegistrySnapshot` of the registry.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
 
-        self._expectation_type_to_data_smell_type[expectation_type] = \
-            metadata.data_smell_type
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = DataSmellRegistrySnapshot(
+                    self._profiler_data_type_specific_data_smells,
+                    self._expectation_type_to_data_smell_type
+                )
+            return self._snapshot
 
     def get_smell_dict_for_profiler_data_type(self, profiler_data_type: ProfilerDataType) -> \
             Dict[DataSmellType, str]:
@@ -1,8 +1,19 @@
+import time
+import tracemalloc
 from dataclasses import dataclass
-from typing import Set, Optional, Iterable, Dict, Any
+from enum import Enum
+from typing import Set, Optional, Iterable, Iterator, Dict, Any, List, Tuple
+import pandas as pd
+from great_expectations.core import ExpectationSuite
+from great_expectations.core.batch import Batch
+from great_expectations.dataset.pandas_dataset import PandasDataset
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.profile.base import DatasetProfiler
 from great_expectations import DataContext
-from great_expectations.validator.validator import ExpectationSuiteValidationResult
+from great_expectations.validator.validator import (
+    ExpectationValidationResult,
+    Validator
+)
 
 from datasmelldetection.core.datasmells import DataSmellType
 from datasmelldetection.core.detector import (
@@ -16,7 +27,45 @@ from .converter import (
     ExtendedDetectionResult,
     StandardResultConverter
 )
+from .kernels import BlockExecutor
+from .memory import get_peak_memory, plan_column_batches
+from .planner import CostModel, ExecutionPlan, PlannedEvaluation, build_plan
 from .profiler import DataSmellAwareProfiler
+from .profiling import ActiveProfile, ProfileCapture
+from .tracing import PausableSpan, default_tracer
+from .report import EvaluationReport, Measurement, RunReport, SkippedEvaluation, get_peak_rss
+
+
+class ResultDetail(Enum):
+    """
+    Controls which information about faulty elements is collected during
+    data smell detection. Less detail avoids collecting and serializing the
+    faulty values of large datasets.
+    """
+
+    COUNTS = "counts"
+    """
+    Only compute the number of analyzed and faulty elements. The faulty
+    elements of the detection results are empty.
+    """  # pylint: disable=W0105
+
+    SAMPLES = "samples"
+    """
+    Compute the counts and collect a limited number of faulty elements
+    (see :attr:`.DataSmellAwareConfiguration.sample_count`).
+    """  # pylint: disable=W0105
+
+    COMPLETE = "complete"
+    """
+    Compute the counts, collect a limited number of faulty elements and the
+    row indices of all faulty elements
+    (:attr:`.ExtendedDetectionResult.faulty_row_indices`). Use the
+    :class:`.CompactResultConverter` to keep the rows of large datasets as
+    bitmaps (:attr:`.CompactDetectionResult.faulty_rows`). Note that Great
+    Expectations still builds lists of all faulty values and row indices
+    while an expectation is validated, so this detail does not lower the
+    peak memory usage of the validation.
+    """  # pylint: disable=W0105
 
 
 @dataclass
@@ -35,8 +84,140 @@ class DataSmellAwareConfiguration(Configuration):
     configuration value.
     """  # pylint: disable=W0105
 
+    result_detail: ResultDetail = ResultDetail.SAMPLES
+    """
+    Which information about faulty elements should be collected. This field
+    is passed to Great Expectations as the result format.
+    """  # pylint: disable=W0105
+
+    sample_count: int = 20
+    """
+    The maximum number of faulty elements which are collected per detection
+    result. This field is ignored if :attr:`result_detail` is
+    :attr:`.ResultDetail.COUNTS`.
+    """  # pylint: disable=W0105
+
+    collect_evaluation_timings: bool = False
+    """
+    If True, each expectation (column × data smell pair) is validated
+    separately and its wall clock time, CPU time and row throughput are
+    recorded in the :attr:`.GreatExpectationsDetector.run_report`. Metrics
+    are not shared between the expectations of a column in this mode.
+    """  # pylint: disable=W0105
+
+    max_memory: Optional[int] = None
+    """
+    The memory budget in bytes for loading and validating the dataset (None
+    for no budget). Before a lazily loaded dataset (see
+    :meth:`.FileBasedDatasetManager.get_dataset`) is loaded, its footprint is
+    estimated from the file size and the first rows. If the estimate exceeds
+    the budget, the columns are loaded and validated in batches which fit
+    into the budget. A :class:`.MemoryBudgetExceededError` is raised before
+    loading if a single column does not fit. Datasets which are already
+    loaded are processed at once.
+    """  # pylint: disable=W0105
+
+    time_budget: Optional[float] = None
+    """
+    The wall clock time in seconds after which no further evaluation (column
+    × data smell pair) is started (None for no budget). If a budget is set,
+    the evaluations are validated separately and cheap evaluations are
+    started first. An evaluation is skipped if its estimated time exceeds the
+    remaining budget. Skipped evaluations are recorded in the
+    :attr:`.GreatExpectationsDetector.run_report`, i.e. the results are
+    partial if :attr:`.RunReport.is_complete` is False. Evaluations which
+    were already started are finished, so the budget may be exceeded by the
+    last evaluation.
+    """  # pylint: disable=W0105
+
+    collect_memory_usage: bool = False
+    """
+    If True, the memory allocated during each stage of the detection
+    (profiling, dataset loading, validation and conversion) and the peak
+    resident set size are recorded in the
+    :attr:`.GreatExpectationsDetector.run_report` using :mod:`tracemalloc`.
+    If evaluation timings are collected, the memory allocated by each
+    expectation is recorded as well. Tracing memory allocations slows down
+    detection considerably.
+    """  # pylint: disable=W0105
+
+    thread_count: int = 1
+    """
+    The number of threads which evaluate element-wise numeric kernels (e.g.
+    the distances to the nearest integer or z-scores) of large columns in
+    blocks (see :class:`.BlockExecutor`). NumPy releases the GIL in these
+    kernels, so this speeds up numeric data smells without starting worker
+    processes. The results don't depend on the number of threads.
+    """  # pylint: disable=W0105
+
+
+def get_result_format(configuration: Optional[Configuration]) -> Dict[str, Any]:
+    """
+    :param configuration: The detector configuration.
+    :return: The Great Expectations result format which corresponds to the
+        configured result detail (see :class:`ResultDetail`).
+    """
+    result_detail: ResultDetail = ResultDetail.SAMPLES
+    sample_count: int = 20
+    if isinstance(configuration, DataSmellAwareConfiguration):
+        result_detail = configuration.result_detail
+        sample_count = configuration.sample_count
+
+    if result_detail == ResultDetail.COUNTS:
+        # Counts are part of the basic result format. Don't collect any
+        # faulty elements.
+        return {"result_format": "BASIC", "partial_unexpected_count": 0}
+    if result_detail == ResultDetail.SAMPLES:
+        return {"result_format": "BASIC", "partial_unexpected_count": sample_count}
+    return {"result_format": "COMPLETE", "partial_unexpected_count": sample_count}
+
+
+class _Deadline:
+    """
+    Tracks the time budget of a detection run. The time of an evaluation is
+    estimated from its cost using the time per cost unit of the evaluations
+    which were already finished.
+    """
+
+    def __init__(self, time_budget: float):
+        self.end: float = time.perf_counter() + time_budget
+        self._finished_cost = 0.0
+        self._finished_time = 0.0
+
+    def get_remaining_time(self) -> float:
+        return self.end - time.perf_counter()
+
+    def estimate_time(self, cost: float) -> Optional[float]:
+        if self._finished_cost <= 0:
+            return None
+        return cost * self._finished_time / self._finished_cost
+
+    def allows(self, cost: float) -> bool:
+        remaining_time = self.get_remaining_time()
+        if remaining_time <= 0:
+            return False
+        estimated_time = self.estimate_time(cost)
+        return estimated_time is None or estimated_time <= remaining_time
+
+    def record(self, cost: float, wall_time: float):
+        self._finished_cost += cost
+        self._finished_time += wall_time
+
 
 class GreatExpectationsDetector(ConfigurableDetector):
+    working_memory_factor: float = 3.0
+    """
+    The estimated size of the temporary data which is created while a column
+    is validated (e.g. string conversions for regex matching) relative to the
+    size of the column. Used to check the memory budget.
+    """  # pylint: disable=W0105
+
+    cost_model: CostModel = CostModel()
+    """
+    Estimates the cost of the evaluations of an :class:`.ExecutionPlan` (see
+    :meth:`plan`).
+    """  # pylint: disable=W0105
+
     def __init__(
             self,
             context: DataContext,
@@ -44,13 +225,16 @@ class GreatExpectationsDetector(ConfigurableDetector):
             profiler: DatasetProfiler,
             registry: DataSmellRegistry,
             converter: DetectionResultConverter,
-            configuration: Optional[Configuration]):
+            configuration: Optional[Configuration],
+            profile_capture: Optional[ProfileCapture] = None):
         super(GreatExpectationsDetector, self).__init__(configuration)
         self.context = context
         self.dataset = dataset
         self.profiler = profiler
         self.registry = registry
         self.converter = converter
+        self.profile_capture = profile_capture
+        self._run_report: Optional[RunReport] = None
 
     @property
     def dataset(self) -> DatasetWrapper:
@@ -106,9 +290,334 @@ class GreatExpectationsDetector(ConfigurableDetector):
         # TODO: Validate argument
         self._converter = new_context
 
+    @property
+    def profile_capture(self) -> Optional[ProfileCapture]:
+        """
+        Captures a profile of each detection run (None to disable profiling).
+        The path of a written profile is stored in
+        :attr:`.RunReport.profile_path`.
+        """
+        return self._profile_capture
+
+    @profile_capture.setter
+    def profile_capture(self, new_profile_capture: Optional[ProfileCapture]):
+        self._profile_capture = new_profile_capture
+
+    @property
+    def run_report(self) -> Optional[RunReport]:
+        """
+        Information about the most recent detection run (None if no detection
+        was performed yet). The report is filled while the results of
+        :meth:`detect_iter` are consumed.
+        """
+        return self._run_report
+
     def detect(self) -> Iterable[ExtendedDetectionResult]:
+        return list(self.detect_iter())
+
+    def detect_iter(self) -> Iterator[ExtendedDetectionResult]:
+        """
+        Perform detection and yield the detection results column by column.
+        The expectations of a column are validated together and the
+        corresponding detection results are yielded before the next column is
+        validated. Iteration can be stopped at any time to abandon the
+        remaining columns.
+
+        If a time budget is configured (see
+        :attr:`.DataSmellAwareConfiguration.time_budget`), the results are
+        yielded per evaluation with cheap evaluations first instead.
+        """
+        collect_evaluation_timings: bool = False
+        collect_memory_usage: bool = False
+        time_budget: Optional[float] = None
+        thread_count: int = 1
+        if isinstance(self.configuration, DataSmellAwareConfiguration):
+            collect_evaluation_timings = self.configuration.collect_evaluation_timings
+            collect_memory_usage = self.configuration.collect_memory_usage
+            time_budget = self.configuration.time_budget
+            thread_count = self.configuration.thread_count
+
+        block_executor = BlockExecutor(thread_count)
+        try:
+            yield from self._pause_between_results(
+                self._detect_iter(collect_evaluation_timings, collect_memory_usage, time_budget, block_executor),
+                # Only trace memory allocations if tracing was not started by
+                # the caller.
+                collect_memory_usage and not tracemalloc.is_tracing(),
+                thread_count
+            )
+        finally:
+            block_executor.close()
+
+    # Run the steps of the detector within the detect span, with memory
+    # tracing (if requested) and with profiling (if requested). They are
+    # paused while the consumer handles the results, so that the work of the
+    # consumer is neither traced nor profiled. Spans which the consumer
+    # creates don't become children of the detect span either.
+    def _pause_between_results(
+            self,
+            iterator: Iterator[ExtendedDetectionResult],
+            trace_memory: bool,
+            thread_count: int
+    ) -> Iterator[ExtendedDetectionResult]:
+        profile_capture: Optional[ProfileCapture] = self.profile_capture
+        profile: Optional[ActiveProfile] = profile_capture.start() if profile_capture is not None else None
+        span: PausableSpan = default_tracer.start_span("detector.detect", thread_count=thread_count)
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                if trace_memory:
+                    tracemalloc.start()
+                span.resume()
+                if profile is not None:
+                    profile.resume()
+                try:
+                    detection_result = next(iterator)
+                except StopIteration:
+                    break
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    if profile is not None:
+                        profile.pause()
+                    span.pause()
+                    if trace_memory:
+                        tracemalloc.stop()
+                yield detection_result
+        finally:
+            # Abandoning the iteration (GeneratorExit) is not an error.
+            iterator.close()
+            span.finish(error)
+            if profile is not None:
+                profile_path = profile.finish()
+                if self._run_report is not None:
+                    self._run_report.profile_path = profile_path
+
+    def _detect_iter(
+            self,
+            collect_evaluation_timings: bool,
+            collect_memory_usage: bool,
+            time_budget: Optional[float],
+            block_executor: BlockExecutor
+    ) -> Iterator[ExtendedDetectionResult]:
+        deadline: Optional[_Deadline] = _Deadline(time_budget) if time_budget is not None else None
+        run_report = RunReport()
+        self._run_report = run_report
+
+        # None => process all columns at once
+        column_batches: List[Optional[List[str]]] = [None]
+        planned_batches: Optional[List[List[str]]] = self._plan_column_batches(run_report)
+        if planned_batches:
+            column_batches = list(planned_batches)
+        run_report.column_batch_count = len(column_batches)
+
+        runtime_configuration: Dict[str, Any] = {
+            "catch_exceptions": True,
+            "result_format": get_result_format(self.configuration)
+        }
+
+        for column_batch in column_batches:
+            if deadline is not None and column_batch is not None and deadline.get_remaining_time() <= 0:
+                # Don't load the batch if no evaluation can be started anymore.
+                run_report.skipped_evaluations.extend(
+                    SkippedEvaluation(column_name=x, expectation_type=None, data_smell_type=None)
+                    for x in column_batch
+                )
+                continue
+
+            # Import dataset (or the columns of the batch)
+            with Measurement(collect_memory_usage) as measurement, \
+                    default_tracer.span("detector.load_dataset"):
+                data_asset: PandasDataset = self._load_data_asset(column_batch)
+            run_report.add_stage_measurement("dataset_load", measurement)
+            run_report.row_count = len(data_asset)
+
+            # Planning is cheap and counted as profiling.
+            with Measurement(collect_memory_usage) as measurement:
+                suite = self._profile(data_asset)
+                plan = self._build_plan(data_asset, suite, deadline is not None)
+            run_report.add_stage_measurement("profiling", measurement)
+
+            # Validate the loaded data frame instead of importing the dataset
+            # again using the batch request.
+            with Measurement(collect_memory_usage) as measurement, \
+                    default_tracer.span("detector.build_validator"):
+                validator = Validator(
+                    execution_engine=PandasExecutionEngine(),
+                    batches=[Batch(data=pd.DataFrame(data_asset))],
+                    expectation_suite=suite
+                )
+            run_report.add_stage_measurement("dataset_load", measurement)
+            if collect_memory_usage:
+                run_report.peak_rss = get_peak_rss()
+
+            self.converter.meta = {
+                "column_types": suite.meta["columns"]
+            }
+
+            yield from self._validate(
+                data_asset,
+                validator,
+                plan,
+                runtime_configuration,
+                collect_evaluation_timings,
+                collect_memory_usage,
+                deadline,
+                block_executor
+            )
+            # Release the columns of the batch before the next batch is loaded.
+            del data_asset, validator
+            if column_batch is not None:
+                self.dataset.artifact_cache.clear()
+
+    # Validate the evaluations of the plan column by column and yield the
+    # detection results of each column. If a deadline is given, the
+    # evaluations are validated separately.
+    def _validate(
+            self,
+            data_asset: PandasDataset,
+            validator: Validator,
+            plan: ExecutionPlan,
+            runtime_configuration: Dict[str, Any],
+            collect_evaluation_timings: bool,
+            collect_memory_usage: bool,
+            deadline: Optional[_Deadline],
+            block_executor: BlockExecutor
+    ) -> Iterator[ExtendedDetectionResult]:
+        run_report: RunReport = self._run_report
+
+        # Validate each expectation separately to measure it or to meet the
+        # deadline if requested.
+        batches: List[Tuple[Optional[str], List[PlannedEvaluation]]] = \
+            plan.get_batches(split=collect_evaluation_timings or deadline is not None)
+
+        for column_name, batch in batches:
+            cost: float = sum(x.estimated_cost for x in batch)
+            if deadline is not None and not deadline.allows(cost):
+                run_report.skipped_evaluations.extend(
+                    SkippedEvaluation(
+                        column_name=column_name,
+                        expectation_type=x.expectation_type,
+                        data_smell_type=x.data_smell_type,
+                        estimated_time=deadline.estimate_time(x.estimated_cost)
+                    )
+                    for x in batch
+                )
+                continue
+
+            with Measurement(collect_memory_usage) as measurement, \
+                    default_tracer.span(
+                        "detector.validate",
+                        column_name=column_name,
+                        expectation_count=len(batch)):
+                # Share derived column data between the metric providers and
+                # evaluate numeric kernels in blocks.
+                with self.dataset.artifact_cache.activate(data_asset), block_executor.activate():
+                    validation_results: List[ExpectationValidationResult] = validator.graph_validate(
+                        configurations=[x.configuration for x in batch],
+                        runtime_configuration=runtime_configuration
+                    )
+            run_report.add_stage_measurement("validation", measurement)
+            if deadline is not None:
+                deadline.record(cost, measurement.wall_time)
+
+            if collect_evaluation_timings:
+                evaluation = batch[0]
+                run_report.evaluations.append(EvaluationReport(
+                    column_name=column_name,
+                    expectation_type=evaluation.expectation_type,
+                    data_smell_type=evaluation.data_smell_type,
+                    wall_time=measurement.wall_time,
+                    cpu_time=measurement.cpu_time,
+                    row_count=run_report.row_count,
+                    peak_memory=measurement.peak_memory,
+                    memory_increment=measurement.memory_increment
+                ))
+
+            # Convert eagerly so that the conversion can be measured
+            # without measuring the consumer of the results.
+            with Measurement(collect_memory_usage) as measurement, \
+                    default_tracer.span("converter.convert", column_name=column_name):
+                detection_results = list(
+                    self.converter.convert_validation_results(validation_results)
+                )
+            run_report.add_stage_measurement("conversion", measurement)
+
+            if collect_memory_usage:
+                run_report.peak_rss = get_peak_rss()
+            yield from detection_results
+
+    # Check the memory budget and split the columns into batches which fit
+    # into the budget. None is returned if all columns can be processed at
+    # once.
+    def _plan_column_batches(self, run_report: RunReport) -> Optional[List[List[str]]]:
+        if not isinstance(self.configuration, DataSmellAwareConfiguration) or \
+                self.configuration.max_memory is None:
+            return None
+        # Loaded datasets can't be split anymore.
+        if self.dataset.is_loaded() or self.dataset.get_path() is None:
+            return None
+
+        estimate = self.dataset.estimate_memory_usage()
+        column_bytes: Dict[str, int] = estimate.column_bytes
+        # Only the specified columns are loaded.
+        column_names = self.configuration.column_names
+        if isinstance(column_names, set):
+            column_bytes = {x: y for x, y in column_bytes.items() if x in column_names}
+
+        run_report.estimated_peak_memory = get_peak_memory(column_bytes, self.working_memory_factor)
+        if run_report.estimated_peak_memory <= self.configuration.max_memory and \
+                not isinstance(column_names, set):
+            return None
+        return plan_column_batches(column_bytes, self.configuration.max_memory, self.working_memory_factor)
+
+    def plan(self) -> ExecutionPlan:
+        """
+        Profile the dataset and create the plan which :meth:`detect_iter`
+        would execute without validating anything. This allows to inspect
+        the estimated cost of the evaluations (see
+        :meth:`.ExecutionPlan.explain`) before running detection. The memory
+        budget is respected while profiling.
+
+        :return: The execution plan.
+        """
+        time_budget: Optional[float] = None
+        if isinstance(self.configuration, DataSmellAwareConfiguration):
+            time_budget = self.configuration.time_budget
+
+        evaluations: List[PlannedEvaluation] = []
+        row_count = 0
+        for column_batch in self._plan_column_batches(RunReport()) or [None]:
+            data_asset: PandasDataset = self._load_data_asset(column_batch)
+            plan = self._build_plan(data_asset, self._profile(data_asset), time_budget is not None)
+            evaluations.extend(plan.evaluations)
+            row_count = plan.row_count
+        return ExecutionPlan(row_count=row_count, evaluations=evaluations)
+
+    # Create the plan of a (column batch of a) detection run. Cheap
+    # evaluations are executed first if the run has a deadline.
+    def _build_plan(self, data_asset: PandasDataset, suite: ExpectationSuite, sort_by_cost: bool) -> ExecutionPlan:
+        plan = build_plan(
+            suite,
+            data_asset,
+            self.registry.snapshot().get_expectation_type_to_data_smell_type_dict(),
+            self.cost_model
+        )
+        return plan.sort_by_cost() if sort_by_cost else plan
+
+    def _load_data_asset(self, column_names: Optional[List[str]]) -> PandasDataset:
+        if column_names is None:
+            return self.dataset.get_great_expectations_dataset()
+        return PandasDataset(self.dataset.read_columns(column_names))
+
+    # Generate the expectation suite which contains the expectations for
+    # data smell detection.
+    def _profile(self, data_asset: PandasDataset) -> ExpectationSuite:
         profiler_configuration: Dict[str, Any] = {
-            "registry": self.registry
+            # Use an immutable snapshot since other threads might register
+            # data smells while detection is performed.
+            "registry": self.registry.snapshot()
         }
 
         if self.configuration is not None:
@@ -124,26 +633,13 @@ class GreatExpectationsDetector(ConfigurableDetector):
             profiler_configuration["column_names"] = column_names
 
         suite, _ = self.profiler.profile(
-            data_asset=self.dataset.get_great_expectations_dataset(),
+            data_asset=data_asset,
             profiler_configuration=profiler_configuration
         )
-
-        # Import dataset
-        validator = self.context.get_validator(
-            batch_request=self._dataset.get_batch_request(),
-            expectation_suite=suite
-        )
-        validation_result: ExpectationSuiteValidationResult = validator.validate()
-
-        self.converter.meta = {
-            "column_types": suite.meta["columns"]
-        }
-        detected_smells = self.converter.convert(validation_result)
-
-        return detected_smells
+        return suite
 
     def get_supported_data_smell_types(self) -> Set[DataSmellType]:
-        return self._registry.get_registered_data_smells()
+        return set(self._registry.snapshot().get_registered_data_smells())
 
 
 class DetectorBuilder:
@@ -166,6 +662,8 @@ class DetectorBuilder:
         self._converter: Optional[DetectionResultConverter] = None
         # The configuration to use.
         self._configuration: Optional[Configuration] = None
+        # Captures profiles of detection runs (disabled if None)
+        self._profile_capture: Optional[ProfileCapture] = None
 
     def set_context(self, context: DataContext):
         self._context = context
@@ -191,6 +689,10 @@ class DetectorBuilder:
         self._configuration = configuration
         return self
 
+    def set_profile_capture(self, profile_capture: Optional[ProfileCapture]):
+        self._profile_capture = profile_capture
+        return self
+
     def build(self) -> GreatExpectationsDetector:
         # Ensure a non-null data smell registry is present
         registry: Optional[DataSmellRegistry] = self._registry
@@ -215,5 +717,6 @@ class DetectorBuilder:
             registry=registry,
             profiler=profiler,
             converter=converter,
-            configuration=self._configuration
+            configuration=self._configuration,
+            profile_capture=self._profile_capture
         )
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import Dict, Any
 
 from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation import ColumnMapExpectation
@@ -7,9 +7,16 @@ from great_expectations.expectations.metrics import (
     column_condition_partial,
 )
 from great_expectations.profile.base import ProfilerDataType
+import numpy as np
+import pandas as pd
 import re
 
 from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.artifacts import (
+    Tokenization,
+    get_tokenization,
+    get_unique_codes
+)
 from datasmelldetection.detectors.great_expectations.datasmell import (
     DataSmell,
     DataSmellMetadata
@@ -20,34 +27,50 @@ class ColumnValuesDontContainCasingSmell(ColumnMapMetricProvider):
     condition_metric_name = "column_values.custom.not_contains_casing_smell"
     condition_value_keys = ("same_case_wordcount_threshold", )
 
-    @classmethod
-    def _contains_casing_smell(cls, element: str, same_case_wordcount_threshold: int) -> bool:
-        same_case_wordcount_threshold = int(same_case_wordcount_threshold)
-        # Extract substrings of the input string by splitting on spaces
-        word_candidates: List[str] = re.split(r"\s+", element)
-
-        words: List[str] = list()
-        for word in word_candidates:
-            # Find consecutive alphabetical characters. Require matching to
-            # start at the begin of a string to consider cases like
-            # "word." where only "word" should be extracted.
-            substrings = list(re.findall(r"^[a-zA-Z]+", word))
-            words = words + substrings
+    # e.g. "AbC" or "AbcDef"
+    _mixed_case_regex_case1 = r"[A-Z]+[a-z]+[A-Z]+.*"
+    # e.g. "aBC" or "abCdefGHI"
+    _mixed_case_regex_case2 = r"[a-z]+[A-Z]+.*"
+    _mixed_case_regex = re.compile(f"^({_mixed_case_regex_case1}|{_mixed_case_regex_case2})$")
 
-        word_count: int = len(words)
+    # Properties of the word of a token (bit flags)
+    _HAS_WORD = 1
+    _IS_LOWER_CASE = 2
+    _IS_UPPER_CASE = 4
+    _IS_MIXED_CASE = 8
 
-        # Case 1: Function for testing if all words are in lowercase
-        # (e.g. "abc def ghi")
-        def is_all_lower_case(word: str) -> bool:
-            return word.lower() == word
+    # Classify the word of a whitespace separated token.
+    @classmethod
+    def _classify_token(cls, token: str) -> int:
+        # Find consecutive alphabetical characters. Require matching to
+        # start at the begin of a string to consider cases like
+        # "word." where only "word" should be extracted.
+        match = re.match(r"[a-zA-Z]+", token)
+        if match is None:
+            return 0
+        word = match.group(0)
+        result = cls._HAS_WORD
+        if word.lower() == word:
+            result |= cls._IS_LOWER_CASE
+        if word.upper() == word:
+            result |= cls._IS_UPPER_CASE
+        if cls._mixed_case_regex.match(word):
+            result |= cls._IS_MIXED_CASE
+        return result
 
-        # Case 1: Function for testing if all words are in uppercase
-        # (e.g. "ABC DEF GHI")
-        def is_all_upper_case(word: str) -> bool:
-            return word.upper() == word
+    # Return True for each distinct value which does not contain a casing smell.
+    @classmethod
+    def _get_flags(cls, tokenization: Tokenization, same_case_wordcount_threshold: int) -> np.ndarray:
+        same_case_wordcount_threshold = int(same_case_wordcount_threshold)
+        token_classes: np.ndarray = tokenization.map_tokens(cls._classify_token, dtype=np.int8)
+        word_count: np.ndarray = tokenization.count_per_value((token_classes & cls._HAS_WORD) != 0)
 
-        is_all_words_lowercase: bool = all(map(is_all_lower_case, words))
-        is_all_words_uppercase: bool = all(map(is_all_upper_case, words))
+        # Case 1: Test if all words are in lowercase (e.g. "abc def ghi") or
+        # all words are in uppercase (e.g. "ABC DEF GHI")
+        is_all_words_lowercase = \
+            tokenization.count_per_value((token_classes & cls._IS_LOWER_CASE) != 0) == word_count
+        is_all_words_uppercase = \
+            tokenization.count_per_value((token_classes & cls._IS_UPPER_CASE) != 0) == word_count
 
         # At least `same_case_wordcount_threshold` lowercase or uppercase words
         # have to be present to flag a casing smell. This is required since
@@ -56,28 +79,22 @@ class ColumnValuesDontContainCasingSmell(ColumnMapMetricProvider):
         # NOTE: Only consider a Casing Smell to be present if all words are
         # lower case or all are upper case. This is done to avoid that
         # inputs like "A test string" are not flagged.
-        if word_count >= same_case_wordcount_threshold and \
-                (is_all_words_lowercase or is_all_words_uppercase):
-            return True
+        is_same_case = (word_count >= same_case_wordcount_threshold) & \
+            (is_all_words_lowercase | is_all_words_uppercase)
 
         # Case 2: Some words are in mixed case (e.g. "AbC dEf gHI")
-        def is_mixed_case(x: str) -> bool:
-            # e.g. "AbC" or "AbcDef"
-            regex_case1 = r"[A-Z]+[a-z]+[A-Z]+.*"
-            # e.g. "aBC" or "abCdefGHI"
-            regex_case2 = r"[a-z]+[A-Z]+.*"
-            regex = f"^({regex_case1}|{regex_case2})$"
-            return bool(re.match(regex, x))
-        return any(map(is_mixed_case, words))
+        is_mixed_case = tokenization.any_per_value((token_classes & cls._IS_MIXED_CASE) != 0)
+        return ~(is_same_case | is_mixed_case)
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, _metrics, same_case_wordcount_threshold: int, **kwargs):
-        # Negate the result of _contains_casing_smell since Great Expectations
-        # assumes that False is returned if a value is faulty
-        # (a data smell is present).
-        def not_contains_casing_smell(element: str) -> bool:
-            return not cls._contains_casing_smell(element, same_case_wordcount_threshold)
-        return column.map(not_contains_casing_smell)
+        # The whitespace separated tokens of each distinct value are extracted
+        # once and shared with other word based data smells. Great
+        # Expectations assumes that False is returned if a value is faulty (a
+        # data smell is present).
+        codes, _ = get_unique_codes(column)
+        flags = cls._get_flags(get_tokenization(column), same_case_wordcount_threshold)
+        return pd.Series(flags[codes], index=column.index)
 
 
 class ExpectColumnValuesToNotContainCasingSmell(ColumnMapExpectation, DataSmell):
@@ -1,21 +1,44 @@
 from typing import Dict, Any
 
+import pandas as pd
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.core import ExpectColumnValuesToBeUnique
+from great_expectations.expectations.metrics import (
+    ColumnMapMetricProvider,
+    column_condition_partial,
+)
 from great_expectations.profile.base import ProfilerDataType
 
 from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.artifacts import get_duplicated_mask
 from datasmelldetection.detectors.great_expectations.datasmell import (
     DataSmell,
     DataSmellMetadata
 )
 
 
+class ColumnValuesDontContainDuplicatedValueSmell(ColumnMapMetricProvider):
+    """
+    Computes the same result as the "column_values.unique" metric of Great
+    Expectations. The duplicated values are found using the shared unique
+    codes of the column. If the column is a part of a larger column (e.g. a
+    row shard), the duplicated values of the whole column can be pinned (see
+    :func:`.get_duplicated_mask`).
+    """
+
+    condition_metric_name = "column_values.custom.not_contains_duplicated_value_smell"
+
+    @column_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, column, **kwargs):
+        return pd.Series(~get_duplicated_mask(column), index=column.index)
+
+
 class ExpectColumnValuesToNotContainDuplicatedValueSmell(ExpectColumnValuesToBeUnique, DataSmell):
     """
     Detect if a duplicate value smell is present.
 
     The ExpectColumnValuesToBeUnique expectation from Great Expectations
-    is used.
+    is used with an equivalent metric which supports row shards.
     """
 
     data_smell_metadata = DataSmellMetadata(
@@ -27,6 +50,8 @@ class ExpectColumnValuesToNotContainDuplicatedValueSmell(ExpectColumnValuesToBeU
     # NOTE: library_metadata not set since the ExpectColumnValuesToBeUnique
     # expectation sets it.
 
+    map_metric = "column_values.custom.not_contains_duplicated_value_smell"
+
     default_kwarg_values: Dict[str, Any] = {
         "mostly": 0.95
     }
@@ -1,22 +1,67 @@
 from typing import Optional
 
+import numpy as np
+import pandas as pd
+
 from datasmelldetection.core import DataSmellType
+from datasmelldetection.detectors.great_expectations.artifacts import (
+    SortedView,
+    get_mean_and_standard_deviation,
+    get_sorted_view
+)
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.kernels import z_score_below
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.metrics import (
+    ColumnMapMetricProvider,
+    column_condition_partial,
+)
 from great_expectations.profile.base import ProfilerDataType
 
 from great_expectations.expectations.expectation import ColumnMapExpectation
 
 
+class ColumnValuesDontContainExtremeValueSmell(ColumnMapMetricProvider):
+    """
+    Computes the same result as the "column_values.z_score.under_threshold"
+    metric of Great Expectations. Since the z-score is monotonic in the value,
+    the extreme values are the smallest and the largest values of the column.
+    They are found by binary search in the sorted view of the column instead
+    of comparing the z-score of each value.
+    """
+
+    condition_metric_name = "column_values.custom.not_contains_extreme_value_smell"
+    condition_value_keys = ("threshold", "double_sided")
+
+    @column_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, column, threshold, double_sided, **kwargs):
+        mean, standard_deviation = get_mean_and_standard_deviation(column)
+        if not double_sided or not np.isfinite(standard_deviation) or standard_deviation == 0:
+            # Degenerated z-scores (e.g. NaN) => compare each value
+            return pd.Series(
+                z_score_below(column.to_numpy(dtype=np.float64), mean, standard_deviation, threshold, double_sided),
+                index=column.index
+            )
+
+        threshold = abs(threshold)
+        view: SortedView = get_sorted_view(column)
+        # Evaluate the z-score like Great Expectations to get identical
+        # results for values close to the threshold.
+        head = view.find_first(lambda x: (x - mean) / standard_deviation > -threshold)
+        tail = len(view) - view.find_first(lambda x: (x - mean) / standard_deviation >= threshold)
+        return pd.Series(~view.get_mask(head=head, tail=tail), index=column.index)
+
+
 class ExpectColumnValuesToNotContainExtremeValueSmell(ColumnMapExpectation, DataSmell):
     """
     Detect the presence of an extreme value smell (outliers).
 
-    This expectation internally uses the "column_values.z_score.under_threshold"
-    metric which is also be used by the
-    "expect_column_value_z_scores_to_be_less_than" expectation. By default,
-    double-sided checking is performed.
+    This expectation computes the same result as the
+    "column_values.z_score.under_threshold" metric which is also be used by
+    the "expect_column_value_z_scores_to_be_less_than" expectation. By
+    default, double-sided checking is performed.
     
     
     Parameters:
@@ -36,7 +81,7 @@ class ExpectColumnValuesToNotContainExtremeValueSmell(ColumnMapExpectation, Data
         profiler_data_types={ProfilerDataType.INT, ProfilerDataType.FLOAT, ProfilerDataType.NUMERIC}
     )
 
-    map_metric = "column_values.z_score.under_threshold"
+    map_metric = "column_values.custom.not_contains_extreme_value_smell"
     success_keys = (
         "mostly",
         "threshold",
@@ -1,4 +1,7 @@
+import pandas as pd
+
 from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.artifacts import get_non_integer_mask
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -21,7 +24,7 @@ class ColumnValuesDontContainIntegerAsFloatingPointNumberSmell(ColumnMapMetricPr
     def _pandas(cls, column, epsilon, **kwargs):
         # Round to nearest integer to estimate the presence of an integer as
         # floating point number smell.
-        return (column - column.round(decimals=0)).abs() > epsilon
+        return pd.Series(get_non_integer_mask(column, epsilon), index=column.index)
 
 
 class ExpectColumnValuesToNotContainIntegerAsFloatingPointNumberSmell(ColumnMapExpectation, DataSmell):
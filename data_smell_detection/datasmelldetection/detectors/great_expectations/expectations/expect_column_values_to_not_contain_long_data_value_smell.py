@@ -1,14 +1,37 @@
-from typing import Optional, Iterable, Dict, Any, List
+from typing import Iterable, Dict, Any, List
 import re
 
+import pandas as pd
+
 from datasmelldetection.core import DataSmellType
+from datasmelldetection.detectors.great_expectations.artifacts import get_tokenization, get_unique_codes
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
 
-from great_expectations.core.expectation_configuration import ExpectationConfiguration
-from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation import ColumnMapExpectation
+from great_expectations.expectations.metrics import (
+    ColumnMapMetricProvider,
+    column_condition_partial,
+)
 from great_expectations.profile.base import ProfilerDataType
-from great_expectations.validator.validation_graph import MetricConfiguration
+
+
+class ColumnValuesDontContainLongDataValueSmell(ColumnMapMetricProvider):
+    condition_metric_name = "column_values.custom.not_contains_long_data_value_smell"
+    condition_value_keys = ("length_threshold",)
+
+    @column_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, column, length_threshold: int, **kwargs):
+        # Words consist of word characters and never contain whitespace, so
+        # each long word is part of a whitespace separated token. The tokens
+        # are shared with other word based data smells and each distinct
+        # token is only checked once.
+        regex = re.compile(r"\w{" + str(int(length_threshold)) + r",}")
+        codes, _ = get_unique_codes(column)
+        tokenization = get_tokenization(column)
+        contains_long_word = tokenization.any_per_value(
+            tokenization.map_tokens(lambda x: regex.search(x) is not None))
+        return pd.Series(~contains_long_word[codes], index=column.index)
 
 
 _test_data = {
@@ -250,7 +273,7 @@ class ExpectColumnValuesToNotContainLongDataValueSmell(ColumnMapExpectation, Dat
         "package": "experimental_expectations",
     }
 
-    map_metric = "column_values.not_match_regex"
+    map_metric = "column_values.custom.not_contains_long_data_value_smell"
     success_keys = ("length_threshold", "mostly")
 
     default_kwarg_values = {
@@ -258,35 +281,6 @@ class ExpectColumnValuesToNotContainLongDataValueSmell(ColumnMapExpectation, Dat
         "mostly": 0.95
     }
 
-    def get_validation_dependencies(
-        self,
-        configuration: Optional[ExpectationConfiguration] = None,
-        execution_engine: Optional[ExecutionEngine] = None,
-        runtime_configuration: Optional[dict] = None,
-    ):
-        dependencies = super(ExpectColumnValuesToNotContainLongDataValueSmell, self).get_validation_dependencies(
-            configuration, execution_engine, runtime_configuration
-        )
-
-        # Get values for success kwargs (needed to ensure that default length
-        # threshold value is used if it is not explicitly specified).
-        success_kwargs = self.get_success_kwargs(configuration)
-
-        pattern = re.compile(r"^column_values\.not_match_regex\.")
-        length_threshold = success_kwargs["length_threshold"]
-        regex: str = r"\w{" + str(int(length_threshold)) + r",}"
-
-        # Override regex for internally used metric
-        # (column_values.not_match_regex). This is required since the regex is
-        # constructed above using the length threshold parameter.
-        for metric_name, metric_configuration_ in dependencies["metrics"].items():
-            if pattern.search(metric_name):
-                assert isinstance(metric_configuration_, MetricConfiguration)
-                metric_configuration: MetricConfiguration = metric_configuration_
-                metric_configuration.metric_value_kwargs["regex"] = regex
-
-        return dependencies
-
 
 expectation = ExpectColumnValuesToNotContainLongDataValueSmell()
 expectation.register_data_smell()
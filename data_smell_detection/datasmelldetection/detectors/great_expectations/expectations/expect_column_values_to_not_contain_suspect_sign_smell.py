@@ -1,24 +1,22 @@
 import json
 
-from typing import Optional
-
+import numpy as np
+import pandas as pd
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
-    ExecutionEngine,
 )
 from great_expectations.expectations.expectation import (
     ColumnMapExpectation,
-    ExpectationConfiguration,
 )
 from great_expectations.expectations.metrics import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
 from great_expectations.profile.base import ProfilerDataType
-from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.artifacts import get_sign_summary
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmell, DataSmellMetadata
 
 
@@ -27,49 +25,25 @@ class ColumnValuesDontContainSuspectSignSmell(ColumnMapMetricProvider):
     condition_value_keys = ("percentile_threshold",)
 
     @column_condition_partial(engine=PandasExecutionEngine)
-    def _pandas(cls, column, _metrics, **kwargs):
-        quantiles = _metrics.get("column.quantile_values")
-        if quantiles[0] >= 0:
+    def _pandas(cls, column, percentile_threshold, **kwargs):
+        # The quantiles are decided exactly by the sign summary of the
+        # numeric scan which is shared with the other numeric data smells (or
+        # by the summary of the whole column if the column is a row shard).
+        majority_sign = get_sign_summary(column).get_majority_sign(percentile_threshold)
+        values = column.to_numpy(dtype=np.float64)
+
+        if majority_sign > 0:
             # The majority of the values are positive => return True for positive values
             # to flag negative values
-            return column >= 0
-        elif quantiles[1] <= 0:
+            faulty = values < 0
+        elif majority_sign < 0:
             # The majority of the values are negative => return True for negative values
             # to flag positive values
-            return column <= 0
+            faulty = values > 0
         else:
             # Suspect sign smell not present
-            return column.map(lambda x: True)
-
-    @classmethod
-    def _get_evaluation_dependencies(
-            cls,
-            metric: MetricConfiguration,
-            configuration: Optional[ExpectationConfiguration] = None,
-            execution_engine: Optional[ExecutionEngine] = None,
-            runtime_configuration: Optional[dict] = None,
-    ):
-        """Returns a dictionary of given metric names and their corresponding configuration, specifying the metric
-        types and their respective domains"""
-        dependencies: dict = super()._get_evaluation_dependencies(
-            metric=metric,
-            configuration=configuration,
-            execution_engine=execution_engine,
-            runtime_configuration=runtime_configuration,
-        )
-
-        percentile_threshold = metric.metric_value_kwargs["percentile_threshold"]
-
-        dependencies["column.quantile_values"] = MetricConfiguration(
-            metric_name="column.quantile_values",
-            metric_domain_kwargs=metric.metric_domain_kwargs,
-            metric_value_kwargs={
-                "quantiles": [percentile_threshold, 1 - percentile_threshold],
-                "allow_relative_error": "linear"
-            }
-        )
-
-        return dependencies
+            faulty = np.zeros(len(values), dtype=bool)
+        return pd.Series(~faulty, index=column.index)
 
 
 class ExpectColumnValuesToNotContainSuspectSignSmell(ColumnMapExpectation, DataSmell):
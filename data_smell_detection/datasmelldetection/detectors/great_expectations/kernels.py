@@ -0,0 +1,361 @@
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import reduce
+from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from .summaries import Moments, SignSummary
+
+try:
+    import numba
+except ImportError:  # pragma: no cover (numba is optional)
+    numba = None  # type: ignore
+
+T = TypeVar("T")
+
+# The block executor which is used by the kernels of the current thread
+_active = threading.local()
+
+
+class BlockExecutor:
+    """
+    Evaluates NumPy kernels on contiguous blocks of large arrays using a
+    thread pool. NumPy releases the GIL in element-wise operations, so the
+    blocks are processed concurrently without the start-up and copying costs
+    of worker processes (e.g. inside a gunicorn worker where forking is
+    undesirable).
+
+    The detector activates an executor while expectations are validated if
+    :attr:`.DataSmellAwareConfiguration.thread_count` is greater than one.
+    The metric providers use it through the functions of this module. Their
+    results don't depend on the number of threads since each element is
+    computed independently.
+    """
+
+    def __init__(self, thread_count: Optional[int] = None, min_block_size: int = 2 ** 16):
+        """
+        :param thread_count: The number of threads (the number of CPUs if
+            None).
+        :param min_block_size: The minimum number of elements per block.
+            Smaller arrays are processed in the calling thread.
+        """
+        self._thread_count: int = thread_count if thread_count is not None else (os.cpu_count() or 1)
+        assert self._thread_count > 0, "thread_count must be positive."
+        assert min_block_size > 0, "min_block_size must be positive."
+        self._min_block_size = min_block_size
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def thread_count(self) -> int:
+        """The number of threads."""
+        return self._thread_count
+
+    def get_blocks(self, length: int) -> List[Tuple[int, int]]:
+        """
+        :param length: The length of an array.
+        :return: The start and stop of each block of the array (at most one
+            block per thread, each block has at least the minimum block size
+            unless the array is smaller).
+        """
+        block_count = max(1, min(self._thread_count, length // self._min_block_size))
+        boundaries = [length * x // block_count for x in range(block_count + 1)]
+        return list(zip(boundaries, boundaries[1:]))
+
+    def map_blocks(self, function: Callable[[int, int], T], length: int) -> List[T]:
+        """
+        :param function: Is called with the start and stop of each block.
+        :param length: The length of the array.
+        :return: The results of the blocks in order.
+        """
+        blocks = self.get_blocks(length)
+        if len(blocks) == 1:
+            return [function(*blocks[0])]
+        return list(self._get_pool().map(lambda x: function(*x), blocks))
+
+    def close(self):
+        """Shut down the threads."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def __enter__(self) -> "BlockExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @contextmanager
+    def activate(self) -> Iterator["BlockExecutor"]:
+        """
+        Use the executor for the kernels called by the calling thread while
+        the context is entered (e.g. while a validator computes metrics).
+        """
+        previous: Optional[BlockExecutor] = getattr(_active, "executor", None)
+        _active.executor = self
+        try:
+            yield self
+        finally:
+            _active.executor = previous
+
+    # The threads are started on first use.
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._thread_count)
+            return self._pool
+
+
+def get_active_executor() -> Optional[BlockExecutor]:
+    """
+    :return: The executor which was activated in the calling thread (None if
+        no executor is active).
+    """
+    return getattr(_active, "executor", None)
+
+
+def apply_elementwise(function: Callable[[np.ndarray], np.ndarray], values: np.ndarray, dtype: Any) -> np.ndarray:
+    """
+    Apply an element-wise kernel to an array. If an executor is active, the
+    kernel is applied to blocks of the array concurrently.
+
+    :param function: A function which maps an array to an array of the same
+        length whose elements only depend on the corresponding input element.
+    :param values: The input array.
+    :param dtype: The data type of the result.
+    :return: The result of the kernel for the whole array.
+    """
+    executor = get_active_executor()
+    if executor is None or len(executor.get_blocks(len(values))) == 1:
+        return np.asarray(function(values), dtype=dtype)
+
+    result = np.empty(len(values), dtype=dtype)
+
+    def apply(start: int, stop: int):
+        result[start:stop] = function(values[start:stop])
+
+    executor.map_blocks(apply, len(values))
+    return result
+
+
+def distance_to_nearest_integer(values: np.ndarray) -> np.ndarray:
+    """
+    :param values: Floating point numbers.
+    :return: The absolute difference of each value to the nearest integer.
+    """
+    return apply_elementwise(lambda x: np.abs(x - np.round(x)), values, np.float64)
+
+
+def z_score_below(values: np.ndarray, mean: float, standard_deviation: float, threshold: float,
+                  double_sided: bool) -> np.ndarray:
+    """
+    :param values: Numeric values.
+    :param mean: The mean of the values.
+    :param standard_deviation: The standard deviation of the values.
+    :param threshold: The z-score threshold.
+    :param double_sided: Whether the absolute z-score is compared.
+    :return: A boolean array which is True for values whose (absolute)
+        z-score is below the threshold (like the
+        "column_values.z_score.under_threshold" metric).
+    """
+    if is_jit_available():
+        return scan_numeric(
+            values,
+            mean=mean,
+            standard_deviation=standard_deviation,
+            threshold=threshold,
+            double_sided=double_sided,
+            summarize=False
+        ).z_score_below_mask
+
+    threshold = abs(threshold) if double_sided else threshold
+
+    def kernel(x: np.ndarray) -> np.ndarray:
+        # Degenerated standard deviations (e.g. 0) result in NaN or infinite
+        # z-scores like in pandas. The error state is thread local.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_scores = (x - mean) / standard_deviation
+            return np.abs(z_scores) < threshold if double_sided else z_scores < threshold
+
+    return apply_elementwise(kernel, values, bool)
+
+
+def is_jit_available() -> bool:
+    """
+    :return: True if numba is installed. The kernels are compiled on first
+        use in this case. Otherwise, the NumPy implementations are used.
+    """
+    return numba is not None
+
+
+@dataclass
+class NumericScan:
+    """
+    The result of :func:`scan_numeric`. Masks which were not requested are
+    None.
+    """
+
+    moments: Optional[Moments] = None
+    """The moments of the values which are not NaN."""  # pylint: disable=W0105
+
+    sign_summary: Optional[SignSummary] = None
+    """The sign summary of the values which are not NaN."""  # pylint: disable=W0105
+
+    non_integer_mask: Optional[np.ndarray] = None
+    """
+    True for values whose distance to the nearest integer exceeds epsilon
+    (``|x - round(x)| > epsilon``).
+    """  # pylint: disable=W0105
+
+    z_score_below_mask: Optional[np.ndarray] = None
+    """True for values whose (absolute) z-score is below the threshold."""  # pylint: disable=W0105
+
+
+def scan_numeric(
+        values: np.ndarray,
+        epsilon: Optional[float] = None,
+        mean: float = math.nan,
+        standard_deviation: float = math.nan,
+        threshold: Optional[float] = None,
+        double_sided: bool = True,
+        summarize: bool = True,
+        use_jit: Optional[bool] = None
+) -> NumericScan:
+    """
+    Compute the masks and summaries of the numeric data smells in one pass
+    over the values. If numba is available, the pass is a compiled loop
+    which needs no temporary arrays besides the requested masks. Otherwise,
+    the NumPy kernels of this module are used. If an executor is active,
+    blocks of the values are scanned concurrently.
+
+    :param values: Numeric values (NaN for missing values).
+    :param epsilon: The epsilon of the Integer As Floating Point Number Smell
+        (the mask is not computed if None).
+    :param mean: The mean for the z-scores.
+    :param standard_deviation: The standard deviation for the z-scores.
+    :param threshold: The z-score threshold of the Extreme Value Smell (the
+        mask is not computed if None).
+    :param double_sided: Whether the absolute z-score is compared.
+    :param summarize: Whether the moments and the sign summary are computed.
+        The moments of both implementations may differ by rounding errors.
+    :param use_jit: Whether the compiled loop is used (if available if
+        None).
+    :return: The requested masks and summaries.
+    """
+    if use_jit is None:
+        use_jit = is_jit_available()
+    assert not use_jit or is_jit_available(), "numba is not installed."
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if threshold is not None and double_sided:
+        threshold = abs(threshold)
+
+    non_integer_mask = np.empty(len(values) if epsilon is not None else 0, dtype=bool)
+    z_score_below_mask = np.empty(len(values) if threshold is not None else 0, dtype=bool)
+
+    def scan(start: int, stop: int) -> Optional[Tuple[Moments, SignSummary]]:
+        block = values[start:stop]
+        if use_jit:
+            statistics = _get_jit_scan()(
+                block,
+                epsilon if epsilon is not None else math.nan,
+                mean,
+                standard_deviation,
+                threshold if threshold is not None else math.nan,
+                double_sided,
+                non_integer_mask[start:stop] if epsilon is not None else non_integer_mask,
+                z_score_below_mask[start:stop] if threshold is not None else z_score_below_mask,
+                summarize
+            )
+            if not summarize:
+                return None
+            count, block_mean, m2 = statistics[:3]
+            return Moments(count=count, mean=block_mean, m2=m2), SignSummary(count, *statistics[3:])
+
+        if epsilon is not None:
+            non_integer_mask[start:stop] = np.abs(block - np.round(block)) > epsilon
+        if threshold is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                z_scores = (block - mean) / standard_deviation
+                z_score_below_mask[start:stop] = (np.abs(z_scores) if double_sided else z_scores) < threshold
+        if not summarize:
+            return None
+        non_null_values = block[~np.isnan(block)]
+        return Moments.from_values(non_null_values), SignSummary.from_values(non_null_values)
+
+    executor = get_active_executor()
+    if executor is None:
+        summaries = [scan(0, len(values))]
+    else:
+        summaries = executor.map_blocks(scan, len(values))
+
+    result = NumericScan(
+        non_integer_mask=non_integer_mask if epsilon is not None else None,
+        z_score_below_mask=z_score_below_mask if threshold is not None else None
+    )
+    if summarize:
+        result.moments = reduce(Moments.merge, [x[0] for x in summaries])
+        result.sign_summary = reduce(SignSummary.merge, [x[1] for x in summaries])
+    return result
+
+
+# The loop of scan_numeric. Returns the count, mean and m2 of the moments and
+# the fields of the sign summary (except the count).
+def _scan_loop(values, epsilon, mean, standard_deviation, threshold, double_sided,
+               non_integer_mask, z_score_below_mask, summarize):
+    count = 0
+    running_mean = 0.0
+    m2 = 0.0
+    negative_count = 0
+    positive_count = 0
+    max_negative = -np.inf
+    min_non_negative = np.inf
+    max_non_positive = -np.inf
+    min_positive = np.inf
+    for index in range(len(values)):
+        value = values[index]
+        if len(non_integer_mask) > 0:
+            non_integer_mask[index] = abs(value - np.rint(value)) > epsilon
+        if len(z_score_below_mask) > 0:
+            z_score = (value - mean) / standard_deviation
+            z_score_below_mask[index] = (abs(z_score) if double_sided else z_score) < threshold
+        if summarize and not np.isnan(value):
+            # Welford's streaming update
+            count += 1
+            delta = value - running_mean
+            running_mean += delta / count
+            m2 += delta * (value - running_mean)
+            if value < 0:
+                negative_count += 1
+                max_negative = max(max_negative, value)
+                max_non_positive = max(max_non_positive, value)
+            elif value > 0:
+                positive_count += 1
+                min_positive = min(min_positive, value)
+                min_non_negative = min(min_non_negative, value)
+            else:
+                min_non_negative = min(min_non_negative, value)
+                max_non_positive = max(max_non_positive, value)
+    return (count, running_mean, m2, negative_count, positive_count,
+            max_negative, min_non_negative, max_non_positive, min_positive)
+
+
+# The compiled loop (compiled on first use)
+_jit_scan: Optional[Callable[..., Tuple[Any, ...]]] = None
+_jit_lock = threading.Lock()
+
+
+def _get_jit_scan() -> Callable[..., Tuple[Any, ...]]:
+    global _jit_scan
+    with _jit_lock:
+        if _jit_scan is None:
+            # The GIL is released so that an executor can scan blocks
+            # concurrently. Divisions by zero result in NaN or infinity like
+            # in NumPy.
+            _jit_scan = numba.njit(nogil=True, error_model="numpy")(_scan_loop)
+        return _jit_scan
@@ -0,0 +1,117 @@
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Any
+
+import pandas as pd
+
+
+class MemoryBudgetExceededError(MemoryError):
+    """
+    Raised if a dataset cannot be processed within the configured memory
+    budget (e.g. because a single column is too large). The error is raised
+    before the dataset is loaded.
+    """
+
+
+@dataclass
+class MemoryEstimate:
+    """The estimated in-memory footprint of a dataset."""
+
+    row_count: int
+    """The (estimated) number of rows."""  # pylint: disable=W0105
+
+    column_bytes: Dict[str, int] = field(default_factory=dict)
+    """The estimated size in bytes of each column after loading."""  # pylint: disable=W0105
+
+    is_exact: bool = False
+    """Whether the dataset was small enough to be measured completely."""  # pylint: disable=W0105
+
+    @property
+    def total_bytes(self) -> int:
+        """The estimated size in bytes of all columns."""
+        return sum(self.column_bytes.values())
+
+
+def estimate_memory_usage(
+        path: str,
+        sample_row_count: int = 1000,
+        reader_options: Optional[Mapping[str, Any]] = None
+) -> MemoryEstimate:
+    """
+    Estimate the in-memory footprint of a CSV file without loading it. The
+    first rows are loaded to infer the column types and the size per row. The
+    number of rows is extrapolated from the file size.
+
+    :param path: The CSV file.
+    :param sample_row_count: The number of rows to load.
+    :param reader_options: Keyword arguments for :func:`pandas.read_csv`.
+    :return: The estimated footprint.
+    """
+    reader_options = dict(reader_options or {})
+    sample: pd.DataFrame = pd.read_csv(path, nrows=sample_row_count, **reader_options)
+    sample_bytes: pd.Series = sample.memory_usage(deep=True, index=False)
+
+    if len(sample) < sample_row_count:
+        # The whole file was loaded.
+        return MemoryEstimate(
+            row_count=len(sample),
+            column_bytes={str(x): int(sample_bytes[x]) for x in sample.columns},
+            is_exact=True
+        )
+
+    # Measure the bytes of the header and of the sampled rows in the file.
+    with open(path, "rb") as file:
+        header_size = len(file.readline())
+        sample_size = sum(len(file.readline()) for _ in range(sample_row_count))
+    file_size = os.path.getsize(path)
+    row_count = int((file_size - header_size) / max(sample_size, 1) * sample_row_count)
+
+    scale = row_count / len(sample)
+    return MemoryEstimate(
+        row_count=row_count,
+        column_bytes={str(x): int(sample_bytes[x] * scale) for x in sample.columns}
+    )
+
+
+def get_peak_memory(column_bytes: Mapping[str, int], working_memory_factor: float) -> int:
+    """
+    :param column_bytes: The size in bytes of each loaded column.
+    :param working_memory_factor: The size of the temporary data created
+        while validating a column relative to the size of the column.
+    :return: The estimated peak memory usage of the detection when all
+        columns are loaded at once.
+    """
+    if not column_bytes:
+        return 0
+    return int(sum(column_bytes.values()) + working_memory_factor * max(column_bytes.values()))
+
+
+def plan_column_batches(
+        column_bytes: Mapping[str, int],
+        max_memory: int,
+        working_memory_factor: float
+) -> List[List[str]]:
+    """
+    Split the columns into batches which can be loaded and validated within
+    the memory budget. The column order is preserved.
+
+    :param column_bytes: The estimated size in bytes of each column.
+    :param max_memory: The memory budget in bytes.
+    :param working_memory_factor: See :func:`get_peak_memory`.
+    :return: The column names of each batch.
+    """
+    batches: List[List[str]] = []
+    batch: Dict[str, int] = {}
+    for column, size in column_bytes.items():
+        if get_peak_memory({column: size}, working_memory_factor) > max_memory:
+            raise MemoryBudgetExceededError(
+                f"Column {column} needs about {get_peak_memory({column: size}, working_memory_factor)} "
+                f"bytes which exceeds the memory budget of {max_memory} bytes."
+            )
+        if batch and get_peak_memory({**batch, column: size}, working_memory_factor) > max_memory:
+            batches.append(list(batch.keys()))
+            batch = {}
+        batch[column] = size
+    if batch:
+        batches.append(list(batch.keys()))
+    return batches
@@ -0,0 +1,281 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.profile.base import ProfilerDataType
+
+from datasmelldetection.core.datasmells import DataSmellType
+
+
+@dataclass
+class ColumnStatistics:
+    """Cheap statistics of a column which determine the cost of evaluations."""
+
+    data_type: Optional[ProfilerDataType]
+    """The column type inferred by the profiler."""  # pylint: disable=W0105
+
+    distinct_ratio: float = 1.0
+    """The ratio of distinct values among the sampled non-null values."""  # pylint: disable=W0105
+
+    mean_length: float = 0.0
+    """
+    The mean length of the sampled non-null values if the column stores
+    strings (0 otherwise).
+    """  # pylint: disable=W0105
+
+
+def get_column_statistics(
+        series: pd.Series,
+        data_type: Optional[ProfilerDataType] = None,
+        sample_size: int = 1000
+) -> ColumnStatistics:
+    """
+    :param series: The column.
+    :param data_type: The column type inferred by the profiler.
+    :param sample_size: The number of values to sample. The statistics are
+        computed from the first values to keep planning independent of the
+        row count.
+    :return: The statistics of the column.
+    """
+    sample: pd.Series = series.iloc[:sample_size].dropna()
+    if len(sample) == 0:
+        return ColumnStatistics(data_type=data_type, distinct_ratio=0.0)
+    mean_length = 0.0
+    if sample.dtype == object:
+        mean_length = float(sample.astype(str).str.len().mean())
+    return ColumnStatistics(
+        data_type=data_type,
+        distinct_ratio=sample.nunique() / len(sample),
+        mean_length=mean_length
+    )
+
+
+class CostModel:
+    """
+    Estimates the cost of an evaluation (column × data smell pair). The cost
+    is measured in units of checking one value for being missing, i.e. it is
+    proportional to the expected wall clock time. The cost grows linearly
+    with the row count and is scaled by the data smell type, by the column
+    type for checks which apply to several column types, by the length of
+    string values for string based checks and by the ratio of distinct values
+    for checks which count values.
+    """
+
+    relative_costs: Dict[DataSmellType, float] = {
+        DataSmellType.MISSING_VALUE_SMELL: 1.0,
+        DataSmellType.INTEGER_AS_FLOATING_POINT_NUMBER_SMELL: 1.0,
+        DataSmellType.SUSPECT_SIGN_SMELL: 2.0,
+        DataSmellType.EXTREME_VALUE_SMELL: 2.0,
+        DataSmellType.DUPLICATED_VALUE_SMELL: 3.0,
+        DataSmellType.INTEGER_AS_STRING_SMELL: 4.0,
+        DataSmellType.FLOATING_POINT_NUMBER_AS_STRING_SMELL: 4.0,
+        DataSmellType.LONG_DATA_VALUE_SMELL: 4.0,
+        DataSmellType.CASING_SMELL: 8.0
+    }
+    """
+    The cost of checking a value for each data smell type relative to
+    checking whether the value is missing. Unknown data smell types cost 1.
+    """  # pylint: disable=W0105
+
+    string_data_smell_types = frozenset([
+        DataSmellType.INTEGER_AS_STRING_SMELL,
+        DataSmellType.FLOATING_POINT_NUMBER_AS_STRING_SMELL,
+        DataSmellType.LONG_DATA_VALUE_SMELL,
+        DataSmellType.CASING_SMELL
+    ])
+    """Data smell types whose cost grows with the length of the values."""  # pylint: disable=W0105
+
+    data_type_factors: Dict[ProfilerDataType, float] = {
+        ProfilerDataType.STRING: 2.0,
+        ProfilerDataType.DATETIME: 2.0,
+        ProfilerDataType.UNKNOWN: 2.0
+    }
+    """
+    The factor by which the cost of a data smell type which is not string
+    based is scaled for each column type. Values of these column types are
+    stored as Python objects which are slower to check than values stored in
+    numpy arrays (e.g. for the Missing Value Smell or the Duplicated Value
+    Smell). Other column types use the factor 1.
+    """  # pylint: disable=W0105
+
+    reference_length: float = 16.0
+    """
+    The value length for which the relative costs of the string based data
+    smell types hold.
+    """  # pylint: disable=W0105
+
+    def estimate(
+            self,
+            data_smell_type: Optional[DataSmellType],
+            row_count: int,
+            column_statistics: Optional[ColumnStatistics] = None
+    ) -> float:
+        """
+        :param data_smell_type: The data smell type of the evaluation.
+        :param row_count: The number of rows of the column.
+        :param column_statistics: The statistics of the column (None if
+            unknown).
+        :return: The estimated cost of the evaluation.
+        """
+        cost = float(row_count) * self.relative_costs.get(data_smell_type, 1.0)
+        if column_statistics is None:
+            return cost
+        if data_smell_type in self.string_data_smell_types:
+            # The relative costs of string based data smell types already
+            # assume string columns.
+            if column_statistics.mean_length > 0:
+                cost *= max(column_statistics.mean_length / self.reference_length, 1.0)
+        elif column_statistics.data_type is not None:
+            cost *= self.data_type_factors.get(column_statistics.data_type, 1.0)
+        if data_smell_type == DataSmellType.DUPLICATED_VALUE_SMELL:
+            # Hashing many distinct values is more expensive.
+            cost *= 1.0 + column_statistics.distinct_ratio
+        return cost
+
+
+@dataclass
+class PlannedEvaluation:
+    """An evaluation (column × data smell pair) of an execution plan."""
+
+    column_name: Optional[str]
+    """The name of the checked column."""  # pylint: disable=W0105
+
+    configuration: ExpectationConfiguration
+    """The expectation to validate."""  # pylint: disable=W0105
+
+    data_smell_type: Optional[DataSmellType]
+    """The data smell type which is detected by the expectation."""  # pylint: disable=W0105
+
+    estimated_cost: float
+    """The estimated cost (see :class:`CostModel`)."""  # pylint: disable=W0105
+
+    @property
+    def expectation_type(self) -> str:
+        """The type of the expectation."""
+        return self.configuration.expectation_type
+
+
+@dataclass
+class ExecutionPlan:
+    """
+    The evaluations of a detection run in the order in which they are
+    executed. Plans are created by :meth:`.GreatExpectationsDetector.plan`
+    and can be inspected with :meth:`explain` before detection is run.
+    """
+
+    row_count: int
+    """The number of rows of the checked dataset."""  # pylint: disable=W0105
+
+    evaluations: List[PlannedEvaluation] = field(default_factory=list)
+    """The evaluations in execution order."""  # pylint: disable=W0105
+
+    @property
+    def total_cost(self) -> float:
+        """The summed estimated cost of all evaluations."""
+        return sum(x.estimated_cost for x in self.evaluations)
+
+    def sort_by_cost(self) -> "ExecutionPlan":
+        """
+        :return: A plan which executes the cheapest evaluations first. The
+            order of evaluations with the same cost is kept.
+        """
+        return ExecutionPlan(
+            row_count=self.row_count,
+            evaluations=sorted(self.evaluations, key=lambda x: x.estimated_cost)
+        )
+
+    def get_batches(self, split: bool = False) -> List[Tuple[Optional[str], List[PlannedEvaluation]]]:
+        """
+        :param split: If True, each evaluation forms a batch of its own.
+        :return: The evaluations grouped into batches which are validated
+            together. Consecutive evaluations of the same column are
+            validated together so that they share computed metrics.
+        """
+        batches: List[Tuple[Optional[str], List[PlannedEvaluation]]] = []
+        for evaluation in self.evaluations:
+            if not split and batches and batches[-1][0] == evaluation.column_name:
+                batches[-1][1].append(evaluation)
+            else:
+                batches.append((evaluation.column_name, [evaluation]))
+        return batches
+
+    def explain(self) -> str:
+        """
+        :return: A human readable description of the plan (one line per
+            evaluation with its estimated cost and share of the total cost).
+        """
+        total_cost = self.total_cost
+        lines: List[str] = [
+            f"Execution plan: {len(self.evaluations)} evaluations, {self.row_count} rows, "
+            f"total cost {total_cost:.0f}",
+            f"{'#':>4}  {'column':<30} {'data smell type':<40} {'cost':>14} {'share':>7}"
+        ]
+        for index, evaluation in enumerate(self.evaluations):
+            data_smell_type = evaluation.data_smell_type.value \
+                if evaluation.data_smell_type is not None else evaluation.expectation_type
+            share = evaluation.estimated_cost / total_cost if total_cost > 0 else 0.0
+            lines.append(
+                f"{index:>4}  {str(evaluation.column_name):<30.30} {data_smell_type:<40.40} "
+                f"{evaluation.estimated_cost:>14.0f} {share:>7.1%}"
+            )
+        return "\n".join(lines)
+
+
+def build_plan(
+        suite: ExpectationSuite,
+        data_asset: pd.DataFrame,
+        data_smell_type_dict: Mapping[str, DataSmellType],
+        cost_model: CostModel
+) -> ExecutionPlan:
+    """
+    :param suite: The expectation suite generated by the
+        :class:`.DataSmellAwareProfiler`.
+    :param data_asset: The dataset which is checked.
+    :param data_smell_type_dict: Maps expectation types to data smell types.
+    :param cost_model: The cost model to estimate the cost of evaluations.
+    :return: A plan which executes the evaluations in suite order (grouped
+        by column).
+    """
+    column_types: Mapping[str, ProfilerDataType] = _get_column_types(suite)
+    column_statistics: "Dict[Optional[str], Optional[ColumnStatistics]]" = {}
+    row_count = len(data_asset)
+
+    # Evaluations of the same column are planned consecutively (in the order
+    # of the first expectation of each column).
+    column_names: List[Optional[str]] = []
+    configurations_by_column: "Dict[Optional[str], List[ExpectationConfiguration]]" = {}
+    for configuration in suite.expectations:
+        column_name: Optional[str] = configuration.kwargs.get("column")
+        if column_name not in configurations_by_column:
+            column_names.append(column_name)
+            configurations_by_column[column_name] = []
+        configurations_by_column[column_name].append(configuration)
+
+    plan = ExecutionPlan(row_count=row_count)
+    for column_name, configuration in (
+            (x, y) for x in column_names for y in configurations_by_column[x]):
+        if column_name not in column_statistics:
+            column_statistics[column_name] = get_column_statistics(
+                data_asset[column_name],
+                column_types.get(column_name)
+            ) if column_name in data_asset.columns else None
+        data_smell_type = data_smell_type_dict.get(configuration.expectation_type)
+        plan.evaluations.append(PlannedEvaluation(
+            column_name=column_name,
+            configuration=configuration,
+            data_smell_type=data_smell_type,
+            estimated_cost=cost_model.estimate(data_smell_type, row_count, column_statistics[column_name])
+        ))
+    return plan
+
+
+# Parse the column types which the profiler stores in the meta information
+# of the suite (e.g. {"a": {"type": "ProfilerDataType.INT"}}).
+def _get_column_types(suite: ExpectationSuite) -> Dict[str, ProfilerDataType]:
+    column_types: Dict[str, ProfilerDataType] = {}
+    for column_name, column_information in suite.meta.get("columns", {}).items():
+        type_name = str(column_information.get("type", "")).split(".")[-1]
+        if type_name in ProfilerDataType.__members__:
+            column_types[column_name] = ProfilerDataType[type_name]
+    return column_types
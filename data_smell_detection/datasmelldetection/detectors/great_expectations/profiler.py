@@ -1,13 +1,17 @@
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Hashable, Optional, Tuple
 
 from copy import deepcopy
 from datasmelldetection.core import DataSmellType
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.profile.base import ProfilerDataType
 from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfilerBase
 from great_expectations.core.expectation_suite import ExpectationSuite
 
+from datasmelldetection.detectors.great_expectations.cache import LRUCache
+from datasmelldetection.detectors.great_expectations.tracing import default_tracer
 from datasmelldetection.detectors.great_expectations.datasmell import (
     DataSmellRegistry,
+    DataSmellRegistrySnapshot,
     default_registry
 )
 
@@ -15,7 +19,7 @@ from datasmelldetection.detectors.great_expectations.datasmell import (
 # Create a configuration dictionary for data smells. The registry is used to
 # get the data smell types of all registered data smells. An empty configuration
 # dictionary is created for each registered data smell.
-def _create_data_smell_configuration_dict(registry: DataSmellRegistry) \
+def _create_data_smell_configuration_dict(registry: DataSmellRegistrySnapshot) \
         -> Dict[DataSmellType, Dict[str, Any]]:
     registered_data_smells: Set[DataSmellType] = registry.get_registered_data_smells()
 
@@ -26,6 +30,21 @@ def _create_data_smell_configuration_dict(registry: DataSmellRegistry) \
     return result
 
 
+# Convert a (nested) configuration value to a hashable representation which
+# can be used as part of a cache key. The type of scalar values is kept to
+# avoid that e.g. the kwargs {"mostly": 1} and {"mostly": 1.0} share a cache
+# entry. A TypeError is raised for values which are not hashable.
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return frozenset((_freeze(k), _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(x) for x in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(x) for x in value)
+    hash(value)
+    return type(value).__name__, value
+
+
 class DataSmellAwareProfiler(BasicDatasetProfilerBase):
     """
     A Great Expectations based profiler for data smell detection.
@@ -44,7 +63,9 @@ class DataSmellAwareProfiler(BasicDatasetProfilerBase):
         :class:`~datasmelldetection.detectors.great_expectations.datasmell.DataSmellRegistry`
         to use. If this key does not exist or is None, then the default registry (
         :class:`~datasmelldetection.detectors.great_expectations.datasmell.default_registry`
-        ) is used. This key must be passed.
+        ) is used. This key must be passed. A
+        :class:`~datasmelldetection.detectors.great_expectations.datasmell.DataSmellRegistrySnapshot`
+        may be passed instead of a registry.
 
     data_smell_configuration:
         A dictionary of type Dict[DataSmellType, Dict[str, Any]]. It stores
@@ -70,53 +91,157 @@ class DataSmellAwareProfiler(BasicDatasetProfilerBase):
         to the specified columns. Columns which are specified in the set but
         are not present in a dataset to profile are ignored. If this key is not
         provided it is assumed that all columns should be processed.
+
+    Generated expectation suites are cached in :attr:`suite_cache`. Datasets
+    which share the same column names and column types are profiled with the
+    same registry contents and data smell configuration reuse the cached
+    expectation configurations. Set :attr:`suite_cache` to None to disable
+    caching.
+    """
+
+    suite_cache: Optional[LRUCache] = LRUCache(maxsize=128)
     """
+    The cache which stores generated expectation configurations. The cache is
+    shared by all profiling runs.
+    """  # pylint: disable=W0105
+
+    @classmethod
+    def profile(cls, data_asset, *args, **kwargs):
+        with default_tracer.span("profiler.profile"):
+            return super(DataSmellAwareProfiler, cls).profile(data_asset, *args, **kwargs)
 
     @classmethod
     def _profile(cls, dataset, configuration=None) -> ExpectationSuite:
         df = dataset
 
-        # Expectations to evaluate later on
-        expectation_suite = ExpectationSuite(
-            expectation_suite_name="profiled_expectation_suite"
-        )
-
         # Ensure that a valid data smell registry is passed.
         assert configuration is not None and \
             "registry" in configuration and \
-            isinstance(configuration["registry"], DataSmellRegistry), \
+            isinstance(configuration["registry"], (DataSmellRegistry, DataSmellRegistrySnapshot)), \
             "Data smell registry is not valid."
         # TODO: Test assert
-        registry: DataSmellRegistry = configuration["registry"]
+        # Use an immutable snapshot to ensure consistent lookups even if data
+        # smells are registered concurrently.
+        registry: DataSmellRegistrySnapshot = configuration["registry"].snapshot()
 
         # Kwargs to use for each data smell type.
-        if configuration is None or \
-                "data_smell_configuration" not in configuration or \
-                not isinstance(configuration["data_smell_configuration"], dict):
-            data_smell_configuration: Dict[DataSmellType, Dict[str, Any]] = _create_data_smell_configuration_dict(registry)
-        else:
+        data_smell_configuration: Optional[Dict[DataSmellType, Dict[str, Any]]] = None
+        if "data_smell_configuration" in configuration and \
+                isinstance(configuration["data_smell_configuration"], dict):
             data_smell_configuration = configuration["data_smell_configuration"]
 
         df.set_default_expectation_argument("catch_exceptions", True)
         df.set_config_value("interactive_evaluation", False)
 
         columns: List[str] = df.get_table_columns()
-        if configuration is not None and \
-                "column_names" in configuration and \
+        if "column_names" in configuration and \
                 isinstance(configuration["column_names"], set):
             # The user specified column names. Assume that only the specified
             # columns should be processed.
             specified_column_names = configuration["column_names"]
             columns = [x for x in columns if x in specified_column_names]
 
+        return cls.build_expectation_suite(
+            cls.get_column_types(df, columns),
+            registry,
+            data_smell_configuration
+        )
+
+    @classmethod
+    def get_column_types(cls, dataset, column_names: List[str]) -> List[Tuple[str, ProfilerDataType]]:
+        """
+        :param dataset: The :class:`great_expectations.dataset.Dataset` to
+            profile.
+        :param column_names: The columns whose types should be inferred.
+        :return: The inferred type of each column.
+        """
+        return [(column, cls._get_column_type(dataset, column)) for column in column_names]
+
+    @classmethod
+    def build_expectation_suite(
+            cls,
+            column_types: List[Tuple[str, ProfilerDataType]],
+            registry: DataSmellRegistrySnapshot,
+            data_smell_configuration: Optional[Dict[DataSmellType, Dict[str, Any]]] = None
+    ) -> ExpectationSuite:
+        """
+        Create the expectation suite for columns of known types. This allows
+        to build a suite for a dataset which is profiled in parts (e.g. row
+        shards, see :mod:`.sharding`).
+
+        :param column_types: The columns and their types.
+        :param registry: The data smell registry (or a snapshot of it).
+        :param data_smell_configuration: See the "data_smell_configuration"
+            configuration key. All registered data smells are used if None.
+        :return: The expectation suite.
+        """
+        registry = registry.snapshot()
+        if data_smell_configuration is None:
+            data_smell_configuration = _create_data_smell_configuration_dict(registry)
+
+        # Look up the expectation configurations of a previous run with the
+        # same column signature, registry and data smell configuration.
+        suite_cache: Optional[LRUCache] = cls.suite_cache
+        cache_key: Optional[Hashable] = None
+        if suite_cache is not None:
+            try:
+                cache_key = (
+                    tuple(column_types),
+                    registry,
+                    _freeze(data_smell_configuration)
+                )
+            except TypeError:
+                # Unhashable kwargs => don't cache
+                cache_key = None
+
+        cached = suite_cache.get(cache_key) if cache_key is not None else None
+        span = default_tracer.current_span()
+        if span is not None:
+            span.set_attribute("column_count", len(column_types))
+            span.set_attribute("cache_hit", cached is not None)
+        if cached is None:
+            cached = cls._build_expectation_configurations(
+                column_types, registry, data_smell_configuration
+            )
+            if cache_key is not None:
+                suite_cache.put(cache_key, cached)
+        configurations, meta_columns = cached
+
+        # Expectations to evaluate later on. The expectation configurations
+        # are shared between suites created from the same cache entry. They
+        # must therefore not be modified.
+        expectation_suite = ExpectationSuite(
+            expectation_suite_name="profiled_expectation_suite",
+            expectations=list(configurations)
+        )
+
+        # Add column type information to the expectation suite.
+        expectation_suite.meta["columns"] = deepcopy(meta_columns)
+
+        return expectation_suite
+
+    # Create the expectation configurations for all columns and the
+    # information about the column types which is stored in the meta
+    # information of the expectation suite.
+    @classmethod
+    def _build_expectation_configurations(
+            cls,
+            column_types: List[Tuple[str, ProfilerDataType]],
+            registry: DataSmellRegistrySnapshot,
+            data_smell_configuration: Dict[DataSmellType, Dict[str, Any]]) \
+            -> Tuple[Tuple[ExpectationConfiguration, ...], Dict[str, Dict[str, str]]]:
+        # The configurations by domain (expectation type and column). Like
+        # ExpectationSuite.add_expectation, a configuration replaces an
+        # existing configuration of the same domain (e.g. if a column name is
+        # present more than once) without scanning the whole suite.
+        configurations: Dict[Tuple[str, str], ExpectationConfiguration] = dict()
+
         # Store information about the column types (needed for analysis)
         meta_columns: Dict[str, Dict[str, str]] = {}
-        for column in columns:
+        for column, _ in column_types:
             meta_columns[column] = {}
 
-        for column in columns:
-            type_ = cls._get_column_type(df, column)
-
+        for column, type_ in column_types:
             meta_columns[column]["type"] = str(type_)
 
             # Parameters used to evaluate expectation later on.
@@ -133,9 +258,6 @@ class DataSmellAwareProfiler(BasicDatasetProfilerBase):
                 config = ExpectationConfiguration(
                     expectation_type=expectation_type, kwargs=kwargs
                 )
-                expectation_suite.add_expectation(config)
-
-        # Add column type information to the expectation suite.
-        expectation_suite.meta["columns"] = meta_columns
+                configurations[(expectation_type, column)] = config
 
-        return expectation_suite
+        return tuple(configurations.values()), meta_columns
@@ -0,0 +1,222 @@
+import cProfile
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Optional, List, Dict, Tuple, Any
+
+# Distinguishes profiles which are written in the same second.
+_profile_counter = itertools.count()
+
+
+class ProfileCapture:
+    """
+    Captures a profile of detection runs and writes it to a directory. Two
+    modes are supported:
+
+    "cprofile":
+        Deterministic profiling with :mod:`cProfile`. The profile is written
+        in the pstats format (`.prof`) which can be inspected with
+        :mod:`pstats` or tools like snakeviz.
+    "sampling":
+        The stack of the detecting thread is sampled in a background thread.
+        This has a lower overhead than cProfile. The profile is written in
+        the speedscope format (`.speedscope.json`), see
+        https://www.speedscope.app.
+
+    Only the time spent in the detector is profiled, i.e. not the time spent
+    by the consumer of :meth:`.GreatExpectationsDetector.detect_iter` between
+    results.
+    """
+
+    modes = ("cprofile", "sampling")
+    """The supported profiling modes."""  # pylint: disable=W0105
+
+    def __init__(
+            self,
+            directory: str,
+            mode: str = "cprofile",
+            threshold: float = 0.0,
+            sampling_interval: float = 0.005):
+        """
+        :param directory: The directory to write the profiles to. It is
+            created if it does not exist.
+        :param mode: "cprofile" or "sampling".
+        :param threshold: Only runs which take at least this many seconds
+            (wall clock time spent in the detector) are written. The profile
+            of faster runs is discarded.
+        :param sampling_interval: The time in seconds between two samples
+            (only used in the "sampling" mode).
+        """
+        assert mode in self.modes, f"mode must be one of {self.modes}."
+        assert threshold >= 0, "threshold must not be negative."
+        assert sampling_interval > 0, "sampling_interval must be positive."
+        self.directory = directory
+        self.mode = mode
+        self.threshold = threshold
+        self.sampling_interval = sampling_interval
+
+    def start(self) -> "ActiveProfile":
+        """
+        :return: A paused profile of a detection run. Call
+            :meth:`.ActiveProfile.resume` to start profiling.
+        """
+        if self.mode == "cprofile":
+            return _CProfileProfile(self)
+        return _SamplingProfile(self)
+
+    def _create_path(self, suffix: str) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        filename = "detection-{}-{}-{}{}".format(
+            time.strftime("%Y%m%d-%H%M%S"),
+            os.getpid(),
+            next(_profile_counter),
+            suffix
+        )
+        return os.path.join(self.directory, filename)
+
+
+class ActiveProfile(ABC):
+    """The profile of a single detection run."""
+
+    def __init__(self, capture: ProfileCapture):
+        self.capture = capture
+        # The profiled wall clock time in seconds
+        self.wall_time = 0.0
+        self._resumed_at: Optional[float] = None
+
+    def resume(self):
+        """Start or continue profiling in the calling thread."""
+        self._resumed_at = time.perf_counter()
+
+    def pause(self):
+        """Pause profiling (e.g. before a result is passed to the consumer)."""
+        if self._resumed_at is not None:
+            self.wall_time += time.perf_counter() - self._resumed_at
+            self._resumed_at = None
+
+    def finish(self) -> Optional[str]:
+        """
+        Stop profiling and write the profile if the run exceeded the
+        threshold.
+
+        :return: The path of the written profile (None if the run was faster
+            than the threshold).
+        """
+        self.pause()
+        if self.wall_time < self.capture.threshold:
+            return None
+        return self._write()
+
+    @abstractmethod
+    def _write(self) -> str:
+        """
+        Write the profile to the directory of the capture.
+
+        :return: The path of the written profile.
+        """
+        pass
+
+
+class _CProfileProfile(ActiveProfile):
+    def __init__(self, capture: ProfileCapture):
+        super(_CProfileProfile, self).__init__(capture)
+        self._profile = cProfile.Profile()
+
+    def resume(self):
+        super(_CProfileProfile, self).resume()
+        self._profile.enable()
+
+    def pause(self):
+        self._profile.disable()
+        super(_CProfileProfile, self).pause()
+
+    def _write(self) -> str:
+        path = self.capture._create_path(".prof")
+        self._profile.dump_stats(path)
+        return path
+
+
+class _SamplingProfile(ActiveProfile):
+    def __init__(self, capture: ProfileCapture):
+        super(_SamplingProfile, self).__init__(capture)
+        self._thread_id: Optional[int] = None
+        self._active = threading.Event()
+        self._stopped = threading.Event()
+        self._frames: List[Dict[str, Any]] = []
+        self._frame_indices: Dict[Tuple[str, str, int], int] = {}
+        self._samples: List[List[int]] = []
+        self._weights: List[float] = []
+        self._sampler: Optional[threading.Thread] = None
+
+    def resume(self):
+        super(_SamplingProfile, self).resume()
+        self._thread_id = threading.get_ident()
+        if self._sampler is None:
+            self._sampler = threading.Thread(target=self._sample, name="datasmelldetection-sampler", daemon=True)
+            self._sampler.start()
+        self._active.set()
+
+    def pause(self):
+        self._active.clear()
+        super(_SamplingProfile, self).pause()
+
+    def finish(self) -> Optional[str]:
+        self.pause()
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        return super(_SamplingProfile, self).finish()
+
+    # Runs in the sampler thread.
+    def _sample(self):
+        last_sample = time.perf_counter()
+        while not self._stopped.wait(self.capture.sampling_interval):
+            now = time.perf_counter()
+            if not self._active.is_set():
+                last_sample = now
+                continue
+            frame = sys._current_frames().get(self._thread_id)  # pylint: disable=W0212
+            stack: List[int] = []
+            while frame is not None:
+                stack.append(self._get_frame_index(frame))
+                frame = frame.f_back
+            if stack:
+                # Speedscope expects the stack from the root to the leaf.
+                stack.reverse()
+                self._samples.append(stack)
+                self._weights.append(now - last_sample)
+            last_sample = now
+
+    def _get_frame_index(self, frame) -> int:
+        code = frame.f_code
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        index = self._frame_indices.get(key)
+        if index is None:
+            index = len(self._frames)
+            self._frame_indices[key] = index
+            self._frames.append({"name": code.co_name, "file": code.co_filename, "line": code.co_firstlineno})
+        return index
+
+    def _write(self) -> str:
+        path = self.capture._create_path(".speedscope.json")
+        total = sum(self._weights)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({
+                "$schema": "https://www.speedscope.app/file-format-schema.json",
+                "shared": {"frames": self._frames},
+                "profiles": [{
+                    "type": "sampled",
+                    "name": "data smell detection",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": total,
+                    "samples": self._samples,
+                    "weights": self._weights
+                }],
+                "exporter": "datasmelldetection"
+            }, file)
+        return path
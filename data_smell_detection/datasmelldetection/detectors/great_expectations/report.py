@@ -0,0 +1,275 @@
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict
+
+try:
+    import resource
+except ImportError:  # pragma: no cover (not available on Windows)
+    resource = None  # type: ignore
+
+from datasmelldetection.core.datasmells import DataSmellType
+
+
+@dataclass
+class EvaluationReport:
+    """Timing information about the evaluation of one expectation."""
+
+    column_name: Optional[str]
+    """The column which was checked."""  # pylint: disable=W0105
+
+    expectation_type: str
+    """The type of the evaluated expectation."""  # pylint: disable=W0105
+
+    data_smell_type: Optional[DataSmellType]
+    """
+    The data smell which the expectation detects (None if the expectation
+    type is not registered).
+    """  # pylint: disable=W0105
+
+    wall_time: float
+    """The elapsed wall clock time in seconds."""  # pylint: disable=W0105
+
+    cpu_time: float
+    """
+    The CPU time in seconds which the process spent during the evaluation
+    (all threads).
+    """  # pylint: disable=W0105
+
+    row_count: int
+    """The number of processed rows."""  # pylint: disable=W0105
+
+    peak_memory: Optional[int] = None
+    """
+    The peak size in bytes of the memory blocks which were allocated during
+    the evaluation (None if memory usage was not collected).
+    """  # pylint: disable=W0105
+
+    memory_increment: Optional[int] = None
+    """
+    The size in bytes of the memory blocks which were allocated during the
+    evaluation and are still allocated afterwards (None if memory usage was
+    not collected).
+    """  # pylint: disable=W0105
+
+    @property
+    def rows_per_second(self) -> float:
+        """The number of processed rows per second (wall clock time)."""
+        if self.wall_time <= 0:
+            return float("inf") if self.row_count > 0 else 0.0
+        return self.row_count / self.wall_time
+
+
+@dataclass
+class SkippedEvaluation:
+    """
+    An evaluation (column × data smell pair) which was not started since the
+    time budget of the run would have been exceeded.
+    """
+
+    column_name: Optional[str]
+    """The name of the column."""  # pylint: disable=W0105
+
+    expectation_type: Optional[str]
+    """
+    The type of the skipped expectation (None if all expectations of the
+    column were skipped before the column was loaded).
+    """  # pylint: disable=W0105
+
+    data_smell_type: Optional[DataSmellType]
+    """The data smell type of the skipped expectation (if known)."""  # pylint: disable=W0105
+
+    estimated_time: Optional[float] = None
+    """
+    The estimated wall clock time in seconds of the evaluation (None if no
+    estimate was available).
+    """  # pylint: disable=W0105
+
+
+@dataclass
+class StageReport:
+    """
+    Timing and memory information about a stage of a detection run (e.g.
+    profiling or validation).
+    """
+
+    name: str
+    """The name of the stage."""  # pylint: disable=W0105
+
+    wall_time: float = 0.0
+    """The elapsed wall clock time in seconds."""  # pylint: disable=W0105
+
+    cpu_time: float = 0.0
+    """The CPU time in seconds which the process spent in the stage."""  # pylint: disable=W0105
+
+    peak_memory: Optional[int] = None
+    """
+    The peak size in bytes of the memory blocks which were allocated during
+    the stage (None if memory usage was not collected). If a stage is
+    entered multiple times (e.g. once per column), the maximum is stored.
+    """  # pylint: disable=W0105
+
+    memory_increment: Optional[int] = None
+    """
+    The size in bytes of the memory blocks which were allocated during the
+    stage and are still allocated afterwards (None if memory usage was not
+    collected).
+    """  # pylint: disable=W0105
+
+
+@dataclass
+class RunReport:
+    """Information about a detection run of a detector."""
+
+    row_count: int = 0
+    """The number of rows of the checked dataset."""  # pylint: disable=W0105
+
+    stages: List[StageReport] = field(default_factory=list)
+    """
+    Information about the stages of the run in the order in which they were
+    entered first.
+    """  # pylint: disable=W0105
+
+    peak_rss: Optional[int] = None
+    """
+    The peak resident set size of the process in bytes at the end of the run
+    (None if memory usage was not collected or if it is not available on
+    the platform). The value covers the whole lifetime of the process.
+    """  # pylint: disable=W0105
+
+    estimated_peak_memory: Optional[int] = None
+    """
+    The estimated peak memory usage in bytes if all columns were loaded at
+    once (None if no memory budget was checked).
+    """  # pylint: disable=W0105
+
+    column_batch_count: int = 1
+    """
+    The number of column batches which were loaded one after another to stay
+    within the memory budget.
+    """  # pylint: disable=W0105
+
+    profile_path: Optional[str] = None
+    """
+    The file which stores the captured profile of the run (None if no profile
+    was captured, see :class:`.ProfileCapture`).
+    """  # pylint: disable=W0105
+
+    evaluations: List[EvaluationReport] = field(default_factory=list)
+    """
+    Timing information for each evaluated expectation (column × data smell
+    pair). This list is only filled if evaluation timings are collected.
+    """  # pylint: disable=W0105
+
+    skipped_evaluations: List[SkippedEvaluation] = field(default_factory=list)
+    """
+    The evaluations which were skipped to meet the time budget (see
+    :attr:`.DataSmellAwareConfiguration.time_budget`).
+    """  # pylint: disable=W0105
+
+    @property
+    def is_complete(self) -> bool:
+        """True if no evaluation was skipped."""
+        return len(self.skipped_evaluations) == 0
+
+    def get_stage(self, name: str) -> Optional[StageReport]:
+        """
+        :param name: The name of the stage.
+        :return: The report of the stage or None if the stage was not entered.
+        """
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        return None
+
+    def add_stage_measurement(self, name: str, measurement: "Measurement"):
+        """
+        Add a measurement to the report of a stage. The report is created if
+        the stage was not entered before.
+
+        :param name: The name of the stage (e.g. "validation").
+        :param measurement: The finished measurement.
+        """
+        stage = self.get_stage(name)
+        if stage is None:
+            stage = StageReport(name=name)
+            self.stages.append(stage)
+
+        stage.wall_time += measurement.wall_time
+        stage.cpu_time += measurement.cpu_time
+        if measurement.peak_memory is not None:
+            stage.peak_memory = max(stage.peak_memory or 0, measurement.peak_memory)
+            stage.memory_increment = (stage.memory_increment or 0) + measurement.memory_increment
+
+    def get_wall_time_by_data_smell_type(self) -> Dict[Optional[DataSmellType], float]:
+        """
+        :return: The summed wall clock time of all evaluations per data smell
+            type.
+        """
+        result: Dict[Optional[DataSmellType], float] = dict()
+        for evaluation in self.evaluations:
+            result[evaluation.data_smell_type] = \
+                result.get(evaluation.data_smell_type, 0.0) + evaluation.wall_time
+        return result
+
+    def get_wall_time_by_column(self) -> Dict[Optional[str], float]:
+        """
+        :return: The summed wall clock time of all evaluations per column.
+        """
+        result: Dict[Optional[str], float] = dict()
+        for evaluation in self.evaluations:
+            result[evaluation.column_name] = \
+                result.get(evaluation.column_name, 0.0) + evaluation.wall_time
+        return result
+
+
+class Measurement:
+    """
+    A context manager which measures the elapsed wall clock and CPU time of
+    the enclosed block. If memory tracking is enabled, the peak and the
+    remaining size of memory blocks allocated in the block are measured using
+    :mod:`tracemalloc` which must already be tracing. Measurements must not
+    be nested if memory is tracked.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self.wall_time: float = 0.0
+        self.cpu_time: float = 0.0
+        self.peak_memory: Optional[int] = None
+        self.memory_increment: Optional[int] = None
+
+    def __enter__(self) -> "Measurement":
+        if self.track_memory:
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            else:
+                # Python < 3.9: Forget existing traces to reset the peak.
+                tracemalloc.clear_traces()
+            self._memory_start, _ = tracemalloc.get_traced_memory()
+
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.wall_time = time.perf_counter() - self._wall_start
+        self.cpu_time = time.process_time() - self._cpu_start
+
+        if self.track_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            self.peak_memory = max(0, peak - self._memory_start)
+            self.memory_increment = current - self._memory_start
+
+
+def get_peak_rss() -> Optional[int]:
+    """
+    :return: The peak resident set size of the process in bytes or None if
+        it is not available.
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
@@ -0,0 +1,673 @@
+import io
+import multiprocessing
+import os
+from dataclasses import dataclass, field
+from functools import reduce
+from itertools import chain
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.core.batch import Batch
+from great_expectations.dataset.pandas_dataset import PandasDataset
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.profile.base import ProfilerDataType
+from great_expectations.validator.validator import (
+    ExpectationValidationResult,
+    Validator
+)
+
+from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.core.detector import ConfigurableDetector, Configuration
+from .artifacts import ColumnArtifactCache
+from .converter import DetectionResultConverter, ExtendedDetectionResult, StandardResultConverter
+from .dataset import DatasetWrapper
+from .datasmell import DataSmellRegistry, default_registry
+from .detector import DataSmellAwareConfiguration, get_result_format
+from .kernels import scan_numeric
+from .profiler import DataSmellAwareProfiler
+from .summaries import DuplicateSummary, Moments, SignSummary
+from .tracing import default_tracer
+from .transport import AttachedFrame, RowRange, SharedFrame, SharedFrameHandle
+
+
+class ShardingError(ValueError):
+    """
+    Raised if a dataset cannot be checked in row shards (e.g. because the
+    shards of a column have different column types or because a data smell
+    cannot be merged).
+    """
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    """A range of bytes [start, stop) of a file."""
+
+    start: int
+    """The first byte."""  # pylint: disable=W0105
+
+    stop: int
+    """The byte after the last byte."""  # pylint: disable=W0105
+
+
+def split_csv(path: str, shard_count: int) -> List[ByteRange]:
+    """
+    Split the rows of a CSV file into ranges of about the same size. Each
+    range starts at the beginning of a line and ends after a line break, so
+    each range can be parsed on its own. The header line is not part of any
+    range. Quoted values which contain line breaks are not supported.
+
+    :param path: The CSV file.
+    :param shard_count: The maximum number of ranges. Must be positive.
+    :return: The byte ranges in file order (at least one range).
+    """
+    assert shard_count > 0, "shard_count must be positive."
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        # Skip the header.
+        file.readline()
+        data_start = file.tell()
+        boundaries: List[int] = [data_start]
+        for index in range(1, shard_count):
+            target = data_start + (size - data_start) * index // shard_count
+            if target <= boundaries[-1]:
+                continue
+            # Move to the beginning of the next line (or stay at target if
+            # the previous byte is a line break).
+            file.seek(target - 1)
+            file.readline()
+            position = file.tell()
+            if position >= size:
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    boundaries.append(size)
+    return [ByteRange(x, y) for x, y in zip(boundaries, boundaries[1:])]
+
+
+def split_rows(row_count: int, shard_count: int) -> List[RowRange]:
+    """
+    Split rows into ranges of about the same size.
+
+    :param row_count: The number of rows.
+    :param shard_count: The maximum number of ranges. Must be positive.
+    :return: The row ranges in order (at least one range).
+    """
+    assert shard_count > 0, "shard_count must be positive."
+    boundaries = sorted({row_count * x // shard_count for x in range(shard_count + 1)})
+    if len(boundaries) == 1:
+        return [(0, 0)]
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def read_csv_shard(
+        path: str,
+        byte_range: ByteRange,
+        column_names: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, Any]] = None,
+        reader_options: Optional[Dict[str, Any]] = None,
+        row_offset: int = 0
+) -> pd.DataFrame:
+    """
+    Load the rows of a byte range of a CSV file.
+
+    :param path: The CSV file.
+    :param byte_range: The rows to load (see :func:`split_csv`).
+    :param column_names: The columns to load (all columns if None).
+    :param dtypes: The types of the columns (inferred if None).
+    :param reader_options: Keyword arguments for :func:`pandas.read_csv`.
+    :param row_offset: The position of the first row in the file. The index
+        of the result starts at this position.
+    :return: The loaded rows in the order of the file.
+    """
+    reader_options = dict(reader_options or {})
+    header: List[str] = [str(x) for x in pd.read_csv(path, nrows=0, **reader_options).columns]
+    with open(path, "rb") as file:
+        file.seek(byte_range.start)
+        data = file.read(byte_range.stop - byte_range.start)
+
+    selected_column_names = [x for x in header if column_names is None or x in set(column_names)]
+    if data.strip() == b"":
+        data_frame = pd.DataFrame({
+            x: pd.Series([], dtype=(dtypes or {}).get(x, object)) for x in selected_column_names
+        })
+    else:
+        data_frame = pd.read_csv(
+            io.BytesIO(data),
+            header=None,
+            names=header,
+            usecols=selected_column_names,
+            dtype=dtypes,
+            **reader_options
+        )
+    data_frame.index = pd.RangeIndex(row_offset, row_offset + len(data_frame))
+    return data_frame
+
+
+@dataclass
+class ColumnSummary:
+    """Mergeable information about the values of a column in a row shard."""
+
+    dtype: str
+    """The pandas data type of the column."""  # pylint: disable=W0105
+
+    non_null_count: int
+    """The number of values which are not missing."""  # pylint: disable=W0105
+
+    column_type: ProfilerDataType
+    """The column type inferred by the profiler."""  # pylint: disable=W0105
+
+    moments: Optional[Moments] = None
+    """The moments of numeric columns (if needed by a data smell)."""  # pylint: disable=W0105
+
+    sign_summary: Optional[SignSummary] = None
+    """The sign summary of numeric columns (if needed by a data smell)."""  # pylint: disable=W0105
+
+    duplicate_summary: Optional[DuplicateSummary] = None
+    """The distinct and duplicated values (if needed by a data smell)."""  # pylint: disable=W0105
+
+
+@dataclass
+class ShardSummary:
+    """Mergeable information about a row shard of a dataset."""
+
+    row_count: int
+    """The number of rows."""  # pylint: disable=W0105
+
+    columns: Dict[str, ColumnSummary] = field(default_factory=dict)
+    """The summary of each column."""  # pylint: disable=W0105
+
+
+@dataclass
+class _ShardTask:
+    """
+    A row shard which is processed by a worker. The shard is either a byte
+    range of the CSV file or a row range of a shared frame (if the dataset is
+    already loaded).
+    """
+
+    path: str
+    byte_range: Optional[ByteRange]
+    column_names: Optional[List[str]]
+    reader_options: Dict[str, Any]
+    dtypes: Optional[Dict[str, str]] = None
+    row_offset: int = 0
+    frame: Optional[SharedFrameHandle] = None
+    rows: Optional[RowRange] = None
+
+    def read(self) -> pd.DataFrame:
+        if self.frame is not None:
+            # The shared columns already have the types of the whole dataset.
+            with AttachedFrame(self.frame) as frame:
+                return frame.to_data_frame(rows=self.rows)
+        return read_csv_shard(
+            self.path,
+            self.byte_range,
+            self.column_names,
+            self.dtypes,
+            self.reader_options,
+            self.row_offset
+        )
+
+
+# The summaries which are needed for data smells which depend on all values
+# of a column
+_SUMMARY_KINDS: Dict[DataSmellType, str] = {
+    DataSmellType.EXTREME_VALUE_SMELL: "moments",
+    DataSmellType.SUSPECT_SIGN_SMELL: "sign_summary",
+    DataSmellType.DUPLICATED_VALUE_SMELL: "duplicate_summary"
+}
+
+
+# Summarize a row shard (executed by a worker).
+def _summarize_shard(arguments: Tuple[_ShardTask, Dict[ProfilerDataType, FrozenSet[str]]]) -> ShardSummary:
+    task, summary_kinds = arguments
+    data_frame = task.read()
+    column_types = DataSmellAwareProfiler.get_column_types(
+        PandasDataset(data_frame),
+        [str(x) for x in data_frame.columns]
+    )
+
+    summary = ShardSummary(row_count=len(data_frame))
+    for column_name, column_type in column_types:
+        column: pd.Series = data_frame[column_name]
+        values: pd.Series = column.dropna()
+        column_summary = ColumnSummary(
+            dtype=column.dtype.str if isinstance(column.dtype, np.dtype) else str(column.dtype),
+            non_null_count=len(values),
+            column_type=column_type
+        )
+        kinds: FrozenSet[str] = summary_kinds.get(column_type, frozenset())
+        is_numeric = isinstance(column.dtype, np.dtype) and column.dtype.kind in "iuf"
+        if ("moments" in kinds or "sign_summary" in kinds) and is_numeric:
+            # Compute both summaries in one pass.
+            scan = scan_numeric(values.to_numpy(dtype=np.float64))
+            if "moments" in kinds:
+                column_summary.moments = scan.moments
+            if "sign_summary" in kinds:
+                column_summary.sign_summary = scan.sign_summary
+        if "duplicate_summary" in kinds:
+            column_summary.duplicate_summary = DuplicateSummary.from_values(values)
+        summary.columns[column_name] = column_summary
+    return summary
+
+
+# The validation result of an expectation for a row shard (result, exception
+# info and success)
+_ShardResult = Tuple[Dict[str, Any], Dict[str, Any], bool]
+
+
+# Validate the expectations for a row shard (executed by a worker). The
+# artifacts of the whole columns are pinned.
+def _validate_shard(
+        arguments: Tuple[_ShardTask, List[ExpectationConfiguration], Dict[Tuple[str, str], Any], Dict[str, Any]]
+) -> List[_ShardResult]:
+    task, configurations, pins, runtime_configuration = arguments
+    data_frame = task.read()
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=data_frame)],
+        expectation_suite=ExpectationSuite(
+            expectation_suite_name="sharded_expectation_suite",
+            expectations=list(configurations)
+        )
+    )
+    results: List[_ShardResult] = []
+    # Validate the expectations of each column together so that they share
+    # computed artifacts.
+    for _, column_configurations in _group_by_column(configurations):
+        artifact_cache = ColumnArtifactCache()
+        for (column_name, artifact_name), value in pins.items():
+            artifact_cache.pin(column_name, artifact_name, value)
+        with artifact_cache.activate(data_frame):
+            validation_results = validator.graph_validate(
+                configurations=column_configurations,
+                runtime_configuration=runtime_configuration
+            )
+        results.extend(
+            (dict(x.result or {}), dict(x.exception_info or {}), bool(x.success))
+            for x in validation_results
+        )
+    return results
+
+
+# Group consecutive expectation configurations of the same column.
+def _group_by_column(
+        configurations: List[ExpectationConfiguration]
+) -> List[Tuple[Optional[str], List[ExpectationConfiguration]]]:
+    groups: List[Tuple[Optional[str], List[ExpectationConfiguration]]] = []
+    for configuration in configurations:
+        column_name = configuration.kwargs.get("column")
+        if groups and groups[-1][0] == column_name:
+            groups[-1][1].append(configuration)
+        else:
+            groups.append((column_name, [configuration]))
+    return groups
+
+
+def merge_shard_results(
+        configuration: ExpectationConfiguration,
+        shard_results: List[_ShardResult],
+        partial_unexpected_count: int
+) -> ExpectationValidationResult:
+    """
+    Merge the validation results of an expectation for the row shards of a
+    dataset. Counts are summed up, faulty elements are concatenated in row
+    order and the success is computed from the merged counts like Great
+    Expectations computes it for column map expectations.
+
+    :param configuration: The validated expectation.
+    :param shard_results: The result of each shard in row order.
+    :param partial_unexpected_count: The maximum number of faulty elements
+        in the partial lists.
+    :return: The validation result for the whole dataset.
+    """
+    if len(shard_results) == 1:
+        result, exception_info, success = shard_results[0]
+        return ExpectationValidationResult(
+            success=success,
+            expectation_config=configuration,
+            result=result,
+            exception_info=exception_info
+        )
+
+    for result, exception_info, _ in shard_results:
+        if exception_info.get("raised_exception"):
+            return ExpectationValidationResult(
+                success=False,
+                expectation_config=configuration,
+                result=result,
+                exception_info=exception_info
+            )
+
+    results: List[Dict[str, Any]] = [x[0] for x in shard_results]
+    merged: Dict[str, Any] = {
+        "element_count": sum(x["element_count"] for x in results),
+        "unexpected_count": sum(x["unexpected_count"] for x in results)
+    }
+    if all("missing_count" in x for x in results):
+        merged["missing_count"] = sum(x["missing_count"] for x in results)
+    for key in ["partial_unexpected_list", "partial_unexpected_index_list"]:
+        if all(key in x for x in results):
+            merged[key] = list(chain.from_iterable(x[key] for x in results))[:partial_unexpected_count]
+    for key in ["unexpected_list", "unexpected_index_list"]:
+        if all(key in x for x in results):
+            merged[key] = list(chain.from_iterable(x[key] for x in results))
+
+    return ExpectationValidationResult(
+        success=_is_successful(configuration, merged),
+        expectation_config=configuration,
+        result=merged,
+        exception_info=shard_results[0][1]
+    )
+
+
+# Compute the success of a column map expectation from its (merged) counts.
+def _is_successful(configuration: ExpectationConfiguration, result: Dict[str, Any]) -> bool:
+    expectation = get_expectation_impl(configuration.expectation_type)()
+    mostly: Optional[float] = expectation.get_success_kwargs(configuration).get("mostly")
+    # Missing values are not considered (unless the expectation checks for
+    # missing values, in which case no missing count is reported).
+    considered_count = result["element_count"] - result.get("missing_count", 0)
+    if considered_count == 0:
+        # Vacuously true
+        return True
+    if mostly is None:
+        return result["unexpected_count"] == 0
+    return (considered_count - result["unexpected_count"]) / considered_count >= mostly
+
+
+# Determine the types of the columns of the whole dataset from the types of
+# the shards (as if the whole file was loaded at once). Boolean columns with
+# missing values are not included since pandas keeps their values as booleans
+# (whereas forcing the object type would keep them as strings).
+def _unify_dtypes(summaries: List[ShardSummary]) -> Dict[str, str]:
+    dtypes: Dict[str, str] = {}
+    for column_name in summaries[0].columns:
+        column_summaries = [x.columns[column_name] for x in summaries]
+        has_missing_values = any(
+            x.non_null_count < y.row_count for x, y in zip(column_summaries, summaries)
+        )
+        # Shards without values don't determine the type.
+        candidates = {x.dtype for x in column_summaries if x.non_null_count > 0}
+        if not candidates:
+            dtypes[column_name] = column_summaries[0].dtype
+            continue
+
+        candidate_dtypes = [np.dtype(x) for x in candidates]
+        if len(candidates) == 1:
+            dtype = candidate_dtypes[0]
+        elif all(x.kind in "iuf" for x in candidate_dtypes):
+            dtype = np.result_type(*candidate_dtypes)
+        else:
+            dtype = np.dtype(object)
+
+        if has_missing_values and dtype.kind in "iu":
+            dtype = np.dtype(np.float64)
+        elif has_missing_values and dtype.kind == "b":
+            continue
+        dtypes[column_name] = dtype.str
+    return dtypes
+
+
+class ShardedDetector(ConfigurableDetector):
+    """
+    Detects data smells in a CSV file which is split into row shards. This
+    helps for tall tables with few columns where checking the columns in
+    parallel does not help. The shards are checked by worker processes in
+    three steps:
+
+    1. Each worker loads its shard, infers the column types and computes
+       mergeable summaries of the columns (moments, sign summaries and the
+       distinct values, see :mod:`.summaries`). Shards whose column types
+       differ from the types of the whole file are summarized again.
+    2. The summaries are merged. The expectation suite is built from the
+       merged column types.
+    3. Each worker validates the suite for its shard. Data smells which depend
+       on all values of a column use the merged summaries (see
+       :meth:`.ColumnArtifactCache.pin`). The validation results of the shards
+       are merged.
+
+    If the dataset is already loaded and the shards are checked by a pool of
+    worker processes, the columns are placed in shared memory (see
+    :meth:`.DatasetWrapper.share`) and each worker attaches to its range of
+    rows instead of parsing its part of the CSV file again.
+
+    The results are equal to the results of the
+    :class:`.GreatExpectationsDetector` for all data smells except the Extreme
+    Value Smell whose mean and standard deviation may differ by rounding
+    errors. Time and memory budgets are not supported.
+    """
+
+    row_local_data_smell_types: FrozenSet[DataSmellType] = frozenset([
+        DataSmellType.MISSING_VALUE_SMELL,
+        DataSmellType.INTEGER_AS_FLOATING_POINT_NUMBER_SMELL,
+        DataSmellType.INTEGER_AS_STRING_SMELL,
+        DataSmellType.FLOATING_POINT_NUMBER_AS_STRING_SMELL,
+        DataSmellType.LONG_DATA_VALUE_SMELL,
+        DataSmellType.CASING_SMELL
+    ])
+    """
+    The data smell types whose result for a value does not depend on other
+    values. Other data smell types are only supported if they can be merged
+    using summaries. A :class:`ShardingError` is raised for unsupported data
+    smell types.
+    """  # pylint: disable=W0105
+
+    def __init__(
+            self,
+            dataset: DatasetWrapper,
+            configuration: Optional[Configuration] = None,
+            registry: Optional[DataSmellRegistry] = None,
+            converter: Optional[DetectionResultConverter] = None,
+            shard_count: Optional[int] = None,
+            processes: Optional[int] = None,
+            executor: Optional[Any] = None):
+        """
+        :param dataset: The dataset to check. The path of its CSV file must be
+            known (e.g. a lazily loaded dataset, see
+            :meth:`.FileBasedDatasetManager.get_dataset`).
+        :param configuration: The configuration to use.
+        :param registry: The data smell registry to use (the default registry
+            if None).
+        :param converter: The converter for validation results (a
+            :class:`.StandardResultConverter` if None).
+        :param shard_count: The number of row shards (the number of CPUs if
+            None).
+        :param processes: The number of worker processes (the number of
+            shards if None). If 1, the shards are checked in the calling
+            process. Ignored if `executor` is given.
+        :param executor: An object whose `map(function, arguments)` method
+            applies a function to each argument and returns the results in
+            order, e.g. a :class:`multiprocessing.pool.Pool` or a
+            :class:`.ClusterExecutor` which dispatches the shards to other
+            hosts. The functions and arguments are picklable. If None, a pool
+            of `processes` worker processes is used.
+        """
+        super(ShardedDetector, self).__init__(configuration)
+        assert dataset.get_path() is not None, "The path of the dataset must be known."
+        self.dataset = dataset
+        self.registry = registry if registry is not None else default_registry
+        self.converter = converter if converter is not None else StandardResultConverter(registry=self.registry)
+        self.shard_count = shard_count if shard_count is not None else (os.cpu_count() or 1)
+        self.processes = processes if processes is not None else self.shard_count
+        self.executor = executor
+
+    def detect(self) -> Iterable[ExtendedDetectionResult]:
+        return list(self.detect_iter())
+
+    def detect_iter(self) -> Iterator[ExtendedDetectionResult]:
+        with default_tracer.span("sharded_detector.detect", shard_count=self.shard_count):
+            pool = multiprocessing.Pool(self.processes) \
+                if self.executor is None and self.processes > 1 else None
+            shared_frame: Optional[SharedFrame] = None
+            try:
+                if self.executor is not None:
+                    map_ = self.executor.map
+                elif pool is not None:
+                    map_ = pool.map
+                else:
+                    map_ = (lambda f, x: list(map(f, x)))
+                # Executors might dispatch the shards to other hosts, so only
+                # the workers of the pool attach to a shared frame.
+                if pool is not None and self.dataset.is_loaded():
+                    shared_frame = self.dataset.share(self._get_column_names())
+                configurations, shard_results = self._detect_shards(map_, shared_frame)
+            finally:
+                if pool is not None:
+                    pool.close()
+                    pool.join()
+                if shared_frame is not None:
+                    shared_frame.close()
+
+            partial_unexpected_count: int = get_result_format(self.configuration)["partial_unexpected_count"]
+            validation_results = [
+                merge_shard_results(configuration, [x[index] for x in shard_results], partial_unexpected_count)
+                for index, configuration in enumerate(configurations)
+            ]
+        yield from self.converter.convert_validation_results(validation_results)
+
+    def get_supported_data_smell_types(self) -> Set[DataSmellType]:
+        supported = self.row_local_data_smell_types | frozenset(_SUMMARY_KINDS)
+        return set(self.registry.snapshot().get_registered_data_smells()) & supported
+
+    # Summarize and validate the shards. The expectation configurations and
+    # the results of each shard are returned. If a shared frame is given, the
+    # shards are row ranges of the frame.
+    def _detect_shards(
+            self,
+            map_: Callable[[Callable, List[Any]], List[Any]],
+            shared_frame: Optional[SharedFrame] = None
+    ) -> Tuple[List[ExpectationConfiguration], List[List[_ShardResult]]]:
+        path: str = self.dataset.get_path()
+        if shared_frame is None:
+            tasks = [
+                _ShardTask(path, x, self._get_column_names(), self.dataset.get_reader_options())
+                for x in split_csv(path, self.shard_count)
+            ]
+        else:
+            tasks = [
+                _ShardTask(path, None, None, {}, frame=shared_frame.handle, rows=x)
+                for x in split_rows(shared_frame.handle.row_count, self.shard_count)
+            ]
+        summary_kinds = self._get_summary_kinds()
+
+        # Step 1: Summarize the shards with the inferred column types.
+        with default_tracer.span("sharded_detector.summarize", shard_count=len(tasks)):
+            summaries: List[ShardSummary] = map_(_summarize_shard, [(x, summary_kinds) for x in tasks])
+            dtypes = _unify_dtypes(summaries)
+            resummarized = [
+                index for index, summary in enumerate(summaries)
+                if any(summary.columns[x].dtype != y for x, y in dtypes.items())
+            ]
+            for task in tasks:
+                task.dtypes = dtypes
+            for index, summary in zip(
+                    resummarized,
+                    map_(_summarize_shard, [(tasks[x], summary_kinds) for x in resummarized])):
+                summaries[index] = summary
+
+        # Step 2: Merge the summaries and build the suite.
+        row_offset = 0
+        for task, summary in zip(tasks, summaries):
+            task.row_offset = row_offset
+            row_offset += summary.row_count
+        column_types = self._unify_column_types(summaries)
+        suite: ExpectationSuite = DataSmellAwareProfiler.build_expectation_suite(
+            column_types,
+            self.registry,
+            self._get_data_smell_configuration()
+        )
+        self._check_supported(suite)
+        pins = self._merge_summaries(summaries) if len(summaries) > 1 else {}
+        self.converter.meta = {
+            "column_types": suite.meta["columns"]
+        }
+
+        # Step 3: Validate the shards.
+        runtime_configuration: Dict[str, Any] = {
+            "catch_exceptions": True,
+            "result_format": get_result_format(self.configuration)
+        }
+        configurations: List[ExpectationConfiguration] = list(suite.expectations)
+        with default_tracer.span("sharded_detector.validate", shard_count=len(tasks)):
+            shard_results: List[List[_ShardResult]] = map_(
+                _validate_shard,
+                [(x, configurations, pins, runtime_configuration) for x in tasks]
+            )
+        return configurations, shard_results
+
+    # Return the configured columns in the order of the file (None for all
+    # columns).
+    def _get_column_names(self) -> Optional[List[str]]:
+        if self.configuration is not None and isinstance(self.configuration.column_names, set):
+            return [x for x in self.dataset.get_ordered_column_names()
+                    if x in self.configuration.column_names]
+        return None
+
+    # Return the summaries which the configured data smells need for each
+    # column type.
+    def _get_summary_kinds(self) -> Dict[ProfilerDataType, FrozenSet[str]]:
+        registry = self.registry.snapshot()
+        data_smell_configuration = self._get_data_smell_configuration()
+        summary_kinds: Dict[ProfilerDataType, FrozenSet[str]] = {}
+        for column_type in ProfilerDataType:
+            summary_kinds[column_type] = frozenset(
+                _SUMMARY_KINDS[x] for x in registry.get_smell_dict_for_profiler_data_type(column_type)
+                if x in _SUMMARY_KINDS and (data_smell_configuration is None or x in data_smell_configuration)
+            )
+        return summary_kinds
+
+    def _get_data_smell_configuration(self) -> Optional[Dict[DataSmellType, Dict[str, Any]]]:
+        if isinstance(self.configuration, DataSmellAwareConfiguration):
+            return self.configuration.data_smell_configuration
+        return None
+
+    # Determine the column types of the whole dataset. Shards without values
+    # in a column don't determine its type.
+    @staticmethod
+    def _unify_column_types(summaries: List[ShardSummary]) -> List[Tuple[str, ProfilerDataType]]:
+        column_types: List[Tuple[str, ProfilerDataType]] = []
+        for column_name in summaries[0].columns:
+            column_summaries = [x.columns[column_name] for x in summaries]
+            candidates = {x.column_type for x in column_summaries if x.non_null_count > 0}
+            if len(candidates) > 1:
+                raise ShardingError(
+                    f"The shards of column {column_name} have different column types: "
+                    f"{', '.join(sorted(str(x) for x in candidates))}."
+                )
+            column_types.append((column_name, candidates.pop() if candidates else column_summaries[0].column_type))
+        return column_types
+
+    def _check_supported(self, suite: ExpectationSuite):
+        expectation_type_dict = self.registry.snapshot().get_expectation_type_to_data_smell_type_dict()
+        supported = self.row_local_data_smell_types | frozenset(_SUMMARY_KINDS)
+        for configuration in suite.expectations:
+            data_smell_type = expectation_type_dict.get(configuration.expectation_type)
+            if data_smell_type not in supported:
+                raise ShardingError(f"{data_smell_type} cannot be detected in row shards.")
+
+    # Merge the summaries of the shards and return the artifacts to pin for
+    # each column.
+    @staticmethod
+    def _merge_summaries(summaries: List[ShardSummary]) -> Dict[Tuple[str, str], Any]:
+        pins: Dict[Tuple[str, str], Any] = {}
+        for column_name in summaries[0].columns:
+            column_summaries = [x.columns[column_name] for x in summaries]
+
+            moments = [x.moments for x in column_summaries if x.moments is not None]
+            if moments:
+                pins[(column_name, "mean_and_standard_deviation")] = \
+                    reduce(Moments.merge, moments).get_mean_and_standard_deviation()
+
+            sign_summaries = [x.sign_summary for x in column_summaries if x.sign_summary is not None]
+            if sign_summaries:
+                pins[(column_name, "sign_summary")] = reduce(SignSummary.merge, sign_summaries)
+
+            duplicate_summaries = [x.duplicate_summary for x in column_summaries if x.duplicate_summary is not None]
+            if duplicate_summaries:
+                pins[(column_name, "duplicated_values")] = \
+                    reduce(DuplicateSummary.merge, duplicate_summaries).duplicated_values
+        return pins
@@ -0,0 +1,238 @@
+import math
+from dataclasses import dataclass, field
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class Moments:
+    """
+    The count, mean and summed squared deviations of the values of a column
+    part. Moments of different parts are merged using the parallel algorithm
+    of Chan et al., so the mean and the standard deviation of a column can be
+    computed from its parts. Note that the result may differ from the
+    statistics of the whole column by rounding errors.
+    """
+
+    count: int = 0
+    """The number of values."""  # pylint: disable=W0105
+
+    mean: float = 0.0
+    """The mean of the values (0 if there are no values)."""  # pylint: disable=W0105
+
+    m2: float = 0.0
+    """The sum of the squared deviations from the mean."""  # pylint: disable=W0105
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "Moments":
+        """
+        :param values: Numeric values without missing values.
+        :return: The moments of the values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return cls()
+        mean = float(values.mean())
+        return cls(count=len(values), mean=mean, m2=float(np.sum((values - mean) ** 2)))
+
+    def merge(self, other: "Moments") -> "Moments":
+        """
+        :param other: The moments of another part.
+        :return: The moments of both parts.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return Moments(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta ** 2 * self.count * other.count / count
+        )
+
+    def get_mean_and_standard_deviation(self) -> Tuple[float, float]:
+        """
+        :return: The mean (NaN if there are no values) and the sample standard
+            deviation (NaN if there are less than two values) like
+            :meth:`pandas.Series.mean` and :meth:`pandas.Series.std`.
+        """
+        mean = self.mean if self.count > 0 else math.nan
+        standard_deviation = math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else math.nan
+        return mean, standard_deviation
+
+
+@dataclass
+class SignSummary:
+    """
+    Counts the negative and positive values of a column part and keeps the
+    values closest to zero. This is sufficient to decide exactly whether a
+    quantile of the whole column is non-negative or non-positive (as done by
+    the Suspect Sign Smell) without collecting the values. Summaries of
+    different parts are merged using :meth:`merge`.
+    """
+
+    count: int = 0
+    """The number of values."""  # pylint: disable=W0105
+
+    negative_count: int = 0
+    """The number of values below zero."""  # pylint: disable=W0105
+
+    positive_count: int = 0
+    """The number of values above zero."""  # pylint: disable=W0105
+
+    max_negative: float = -math.inf
+    """The largest value below zero."""  # pylint: disable=W0105
+
+    min_non_negative: float = math.inf
+    """The smallest value which is not below zero."""  # pylint: disable=W0105
+
+    max_non_positive: float = -math.inf
+    """The largest value which is not above zero."""  # pylint: disable=W0105
+
+    min_positive: float = math.inf
+    """The smallest value above zero."""  # pylint: disable=W0105
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "SignSummary":
+        """
+        :param values: Numeric values without missing values.
+        :return: The summary of the values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        negative = values < 0
+        positive = values > 0
+
+        # Return the extreme of the selected values (the default if none is
+        # selected).
+        def get_extreme(function, selection: np.ndarray, default: float) -> float:
+            return float(function(values[selection])) if selection.any() else default
+
+        return cls(
+            count=len(values),
+            negative_count=int(negative.sum()),
+            positive_count=int(positive.sum()),
+            max_negative=get_extreme(np.max, negative, -math.inf),
+            min_non_negative=get_extreme(np.min, ~negative, math.inf),
+            max_non_positive=get_extreme(np.max, ~positive, -math.inf),
+            min_positive=get_extreme(np.min, positive, math.inf)
+        )
+
+    def merge(self, other: "SignSummary") -> "SignSummary":
+        """
+        :param other: The summary of another part.
+        :return: The summary of both parts.
+        """
+        return SignSummary(
+            count=self.count + other.count,
+            negative_count=self.negative_count + other.negative_count,
+            positive_count=self.positive_count + other.positive_count,
+            max_negative=max(self.max_negative, other.max_negative),
+            min_non_negative=min(self.min_non_negative, other.min_non_negative),
+            max_non_positive=max(self.max_non_positive, other.max_non_positive),
+            min_positive=min(self.min_positive, other.min_positive)
+        )
+
+    def get_majority_sign(self, percentile_threshold: float) -> int:
+        """
+        :param percentile_threshold: The percentile threshold of the Suspect
+            Sign Smell.
+        :return: 1 if the `percentile_threshold` quantile is non-negative
+            (negative values are suspect), -1 if the `1 - percentile_threshold`
+            quantile is non-positive (positive values are suspect) and 0
+            otherwise. The quantiles are interpolated linearly like
+            :meth:`pandas.Series.quantile`.
+        """
+        if self.count == 0:
+            return 0
+        if self._is_quantile_non_negative(percentile_threshold):
+            return 1
+        if self._is_quantile_non_positive(1 - percentile_threshold):
+            return -1
+        return 0
+
+    # Return the positions of the values which are interpolated for a
+    # quantile and the weight of the upper value (like numpy's percentile).
+    def _get_quantile_position(self, q: float) -> Tuple[int, int, float]:
+        index = np.float64(q) * 100 / 100 * (self.count - 1)
+        below = int(np.floor(index))
+        above = min(below + 1, self.count - 1)
+        return below, above, index - below
+
+    def _is_quantile_non_negative(self, q: float) -> bool:
+        below, above, weight = self._get_quantile_position(q)
+        if self.negative_count <= below:
+            # Both interpolated values are non-negative.
+            return True
+        if self.negative_count > above:
+            # Both interpolated values are negative.
+            return False
+        # The values around zero are interpolated.
+        return _interpolate(self.max_negative, self.min_non_negative, weight) >= 0
+
+    def _is_quantile_non_positive(self, q: float) -> bool:
+        below, above, weight = self._get_quantile_position(q)
+        non_positive_count = self.count - self.positive_count
+        if above < non_positive_count:
+            # Both interpolated values are non-positive.
+            return True
+        if below >= non_positive_count:
+            # Both interpolated values are positive.
+            return False
+        # The values around zero are interpolated.
+        return _interpolate(self.max_non_positive, self.min_positive, weight) <= 0
+
+
+# Interpolate linearly between two values like numpy's percentile.
+def _interpolate(below: float, above: float, weight: float) -> float:
+    return np.float64(below) * (1 - weight) + np.float64(above) * weight
+
+
+@dataclass
+class DuplicateSummary:
+    """
+    The distinct values of a column part and the values which occur more than
+    once in it. Merging the summaries of all parts of a column yields the
+    values which occur more than once in the whole column, so duplicated
+    values can be detected exactly in each part (see
+    :func:`.get_duplicated_mask`). Values are compared like
+    :meth:`pandas.Series.duplicated` compares them.
+    """
+
+    distinct_values: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    """The distinct values."""  # pylint: disable=W0105
+
+    duplicated_values: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    """The values which occur more than once."""  # pylint: disable=W0105
+
+    @classmethod
+    def from_values(cls, values: pd.Series) -> "DuplicateSummary":
+        """
+        :param values: Values without missing values.
+        :return: The summary of the values.
+        """
+        codes, uniques = pd.factorize(values)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        uniques = np.asarray(uniques)
+        return cls(distinct_values=uniques, duplicated_values=uniques[counts > 1])
+
+    def merge(self, other: "DuplicateSummary") -> "DuplicateSummary":
+        """
+        :param other: The summary of another part.
+        :return: The summary of both parts.
+        """
+        values = pd.Series(np.concatenate([self.distinct_values, other.distinct_values]))
+        # Values are distinct within each part => values which occur twice
+        # occur in both parts.
+        in_both_parts = values[values.duplicated()].to_numpy()
+        return DuplicateSummary(
+            distinct_values=pd.unique(values),
+            duplicated_values=pd.unique(np.concatenate([
+                self.duplicated_values,
+                other.duplicated_values,
+                in_both_parts
+            ]))
+        )
@@ -0,0 +1,307 @@
+import json
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Iterator
+
+
+@dataclass
+class Span:
+    """A timed operation (e.g. profiling a dataset) of a trace."""
+
+    name: str
+    """The name of the operation."""  # pylint: disable=W0105
+
+    trace_id: str
+    """The identifier of the trace which the span belongs to."""  # pylint: disable=W0105
+
+    span_id: str
+    """The identifier of the span."""  # pylint: disable=W0105
+
+    parent_id: Optional[str] = None
+    """The identifier of the parent span (None for root spans)."""  # pylint: disable=W0105
+
+    start_time: float = 0.0
+    """The start time as seconds since the epoch."""  # pylint: disable=W0105
+
+    duration: float = 0.0
+    """The elapsed wall clock time in seconds."""  # pylint: disable=W0105
+
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    """Additional information about the operation (e.g. a column name)."""  # pylint: disable=W0105
+
+    error: Optional[str] = None
+    """The exception which was raised by the operation (if any)."""  # pylint: disable=W0105
+
+    def set_attribute(self, key: str, value: Any):
+        """
+        :param key: The name of the attribute.
+        :param value: The value of the attribute.
+        """
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: A JSON serializable representation of the span (apart from
+            the attribute values).
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "attributes": dict(self.attributes),
+            "error": self.error
+        }
+
+
+class SpanExporter(ABC):
+    """Base class for classes which receive finished spans."""
+
+    @abstractmethod
+    def export(self, span: Span):
+        """
+        Handle a finished span. This method may be called from multiple
+        threads concurrently.
+
+        :param span: The finished span.
+        """
+        pass
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """A span exporter which appends each span as a JSON line to a file."""
+
+    def __init__(self, path: str):
+        """
+        :param path: The file to append the spans to. The file is created if
+            it does not exist.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        # Values which are not JSON serializable (e.g. data smell types) are
+        # stored as strings.
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+
+
+class InMemorySpanExporter(SpanExporter):
+    """A span exporter which collects the spans in a list."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+
+    @property
+    def spans(self) -> List[Span]:
+        """The exported spans in the order in which they finished."""
+        with self._lock:
+            return list(self._spans)
+
+    def export(self, span: Span):
+        with self._lock:
+            self._spans.append(span)
+
+    def clear(self):
+        """Remove all collected spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class PausableSpan:
+    """
+    A span which is only active while it is resumed (see
+    :meth:`.Tracer.start_span`). Its duration is the summed time in which it
+    was resumed and only spans which are created in this time become its
+    children. This allows to trace the work of a generator but not the work
+    of its consumer between the yielded values.
+    """
+
+    def __init__(self, tracer: "Tracer", span: Optional[Span]):
+        """
+        :param tracer: The tracer which created the span.
+        :param span: The span (None if tracing is disabled).
+        """
+        self.span = span
+        self._tracer = tracer
+        # The span stack of the thread which resumed the span (None while
+        # the span is paused).
+        self._stack: Optional[List[Span]] = None
+        self._resume_time = 0.0
+
+    def resume(self):
+        """Make the span the active span of the calling thread."""
+        if self.span is None or self._stack is not None:
+            return
+        self._stack = self._tracer._get_stack()
+        self._stack.append(self.span)
+        self._resume_time = time.perf_counter()
+
+    def pause(self):
+        """Deactivate the span until it is resumed again."""
+        if self._stack is None:
+            return
+        self.span.duration += time.perf_counter() - self._resume_time
+        _remove_span(self._stack, self.span)
+        self._stack = None
+
+    def finish(self, error: Optional[BaseException] = None):
+        """
+        Pause the span and pass it to the exporter of the tracer.
+
+        :param error: The exception which was raised by the operation (if
+            any).
+        """
+        span = self.span
+        exporter = self._tracer.exporter
+        if span is None:
+            return
+        self.pause()
+        self.span = None
+        if error is not None:
+            span.error = repr(error)
+        if exporter is not None:
+            exporter.export(span)
+
+
+class Tracer:
+    """
+    Creates spans and passes finished spans to an exporter. Spans which are
+    created while another span of the same thread is active become its
+    children. If no exporter is set, tracing is disabled and creating spans
+    has almost no overhead.
+    """
+
+    default_trace_file = "datasmelldetection-traces.jsonl"
+    """The file which is used if tracing is enabled without an exporter."""  # pylint: disable=W0105
+
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        """
+        :param exporter: The exporter to pass finished spans to (None to
+            disable tracing).
+        """
+        self.exporter = exporter
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are exported."""
+        return self.exporter is not None
+
+    def enable(self, exporter: Optional[SpanExporter] = None, path: Optional[str] = None):
+        """
+        Enable tracing.
+
+        :param exporter: The exporter to use. If None, the spans are written to
+            a JSON lines file.
+        :param path: The JSON lines file to use if no exporter is given
+            (:attr:`default_trace_file` if None).
+        """
+        if exporter is None:
+            exporter = JsonLinesSpanExporter(path if path is not None else self.default_trace_file)
+        self.exporter = exporter
+
+    def disable(self):
+        """Disable tracing."""
+        self.exporter = None
+
+    def current_span(self) -> Optional[Span]:
+        """
+        :return: The innermost active span of the calling thread (None if no
+            span is active).
+        """
+        stack = self._get_stack()
+        return stack[-1] if stack else None
+
+    def start_span(self, name: str, **attributes: Any) -> PausableSpan:
+        """
+        Create a span which is paused until :meth:`.PausableSpan.resume` is
+        called. The parent of the span is the active span of the calling
+        thread.
+
+        :param name: The name of the operation.
+        :param attributes: Additional information about the operation.
+        :return: The span. It must be finished using
+            :meth:`.PausableSpan.finish`.
+        """
+        if self.exporter is None:
+            return PausableSpan(self, None)
+        return PausableSpan(self, self._create_span(name, attributes))
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        Trace the enclosed block.
+
+        :param name: The name of the operation.
+        :param attributes: Additional information about the operation.
+        :return: A context manager which yields the active span (None if
+            tracing is disabled).
+        """
+        exporter = self.exporter
+        if exporter is None:
+            yield None
+            return
+
+        stack = self._get_stack()
+        span = self._create_span(name, attributes)
+        stack.append(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except GeneratorExit:
+            # A generator which holds the span was closed (e.g. a consumer
+            # stopped iterating), which is not an error.
+            raise
+        except BaseException as e:
+            span.error = repr(e)
+            raise
+        finally:
+            span.duration = time.perf_counter() - start
+            _remove_span(stack, span)
+            exporter.export(span)
+
+    # Create a span whose parent is the active span of the calling thread.
+    def _create_span(self, name: str, attributes: Dict[str, Any]) -> Span:
+        stack = self._get_stack()
+        parent = stack[-1] if stack else None
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent is not None else None,
+            start_time=time.time(),
+            attributes=dict(attributes)
+        )
+
+    def _get_stack(self) -> List[Span]:
+        stack: Optional[List[Span]] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+
+# Remove a finished span from a span stack. Spans held by generators might
+# not be finished in stack order.
+def _remove_span(stack: List[Span], span: Span):
+    if stack and stack[-1] is span:
+        stack.pop()
+    elif span in stack:
+        stack.remove(span)
+
+
+default_tracer = Tracer()
+"""
+The tracer which is used by the detector, profiler, converter and dataset
+manager. Tracing is disabled until :meth:`.Tracer.enable` is called.
+"""  # pylint: disable=W0105
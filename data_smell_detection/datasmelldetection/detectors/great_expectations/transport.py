@@ -0,0 +1,376 @@
+import os
+import pickle
+import shutil
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover (requires Python >= 3.8)
+    shared_memory = None  # type: ignore
+
+# The range of rows [start, stop) of a shared frame
+RowRange = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    """
+    Identifies an array which was placed in shared memory or in a memory
+    mapped file. Handles are small and cheap to pickle.
+    """
+
+    name: str
+    """The name of the shared memory block or the path of the file."""  # pylint: disable=W0105
+
+    dtype: str
+    """The data type of the array (see :attr:`numpy.dtype.str`)."""  # pylint: disable=W0105
+
+    shape: Tuple[int, ...]
+    """The shape of the array."""  # pylint: disable=W0105
+
+    is_file: bool = False
+    """Whether the array is stored in a memory mapped file."""  # pylint: disable=W0105
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the array in bytes."""
+        return int(np.prod(self.shape, dtype=np.int64)) * np.dtype(self.dtype).itemsize
+
+
+@dataclass
+class SharedColumnHandle:
+    """
+    Identifies a column of a :class:`SharedFrame`. Numeric columns are shared
+    as they are. String columns are dictionary encoded: the codes of the
+    values and the UTF-8 encoded distinct values are shared. Other columns
+    (e.g. columns of mixed types) are pickled into the handle.
+    """
+
+    name: Hashable
+    """The name of the column."""  # pylint: disable=W0105
+
+    values: Optional[SharedArrayHandle] = None
+    """The values of a numeric column or the codes of a string column (-1 for missing values)."""  # pylint: disable=W0105
+
+    dictionary_data: Optional[SharedArrayHandle] = None
+    """The concatenated UTF-8 encoded distinct values of a string column."""  # pylint: disable=W0105
+
+    dictionary_offsets: Optional[SharedArrayHandle] = None
+    """The start of each distinct value in :attr:`dictionary_data` and its total length."""  # pylint: disable=W0105
+
+    pickled: Optional[bytes] = None
+    """The pickled column if it cannot be shared."""  # pylint: disable=W0105
+
+    @property
+    def is_encoded(self) -> bool:
+        """Whether the column is a dictionary encoded string column."""
+        return self.dictionary_offsets is not None
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the shared data of the column in bytes."""
+        arrays = [self.values, self.dictionary_data, self.dictionary_offsets]
+        return sum(x.nbytes for x in arrays if x is not None)
+
+
+@dataclass
+class SharedFrameHandle:
+    """
+    Identifies a :class:`SharedFrame`. The handle is passed to worker
+    processes which attach to the frame using :class:`AttachedFrame`.
+    """
+
+    row_count: int
+    """The number of rows."""  # pylint: disable=W0105
+
+    columns: List[SharedColumnHandle] = field(default_factory=list)
+    """The columns in order."""  # pylint: disable=W0105
+
+    @property
+    def column_names(self) -> List[Hashable]:
+        """The names of the columns in order."""
+        return [x.name for x in self.columns]
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the shared data in bytes."""
+        return sum(x.nbytes for x in self.columns)
+
+    def get_column(self, column_name: Hashable) -> SharedColumnHandle:
+        """
+        :param column_name: The name of the column.
+        :return: The handle of the column.
+        """
+        for column in self.columns:
+            if column.name == column_name:
+                return column
+        raise KeyError(column_name)
+
+
+def is_shared_memory_available() -> bool:
+    """
+    :return: True if :mod:`multiprocessing.shared_memory` is available
+        (Python >= 3.8). Otherwise, memory mapped files are used.
+    """
+    return shared_memory is not None
+
+
+class SharedFrame:
+    """
+    Places the columns of a DataFrame in shared memory (or in memory mapped
+    temporary files) so that worker processes can access them without
+    pickling and copying the whole DataFrame. Workers receive the small
+    :attr:`handle` and attach to the frame using :class:`AttachedFrame`.
+
+    The creating process owns the shared data. It must call :meth:`close`
+    (or use the frame as context manager) after the workers are done.
+    """
+
+    def __init__(
+            self,
+            data_frame: pd.DataFrame,
+            use_shared_memory: Optional[bool] = None,
+            directory: Optional[str] = None):
+        """
+        :param data_frame: The DataFrame to share. The index is not shared,
+            attached frames use a :class:`pandas.RangeIndex`.
+        :param use_shared_memory: If True, :mod:`multiprocessing.shared_memory`
+            is used. If False, the columns are written to memory mapped
+            files. If None, shared memory is used if it is available.
+        :param directory: The directory for the memory mapped files (a
+            temporary directory is created if None).
+        """
+        if use_shared_memory is None:
+            use_shared_memory = is_shared_memory_available()
+        assert not use_shared_memory or is_shared_memory_available(), \
+            "multiprocessing.shared_memory is not available."
+        self._use_shared_memory = use_shared_memory
+        self._directory: Optional[str] = None
+        self._owns_directory = False
+        if not use_shared_memory:
+            self._owns_directory = directory is None
+            self._directory = tempfile.mkdtemp(prefix="datasmelldetection-") \
+                if directory is None else directory
+        # Shared memory blocks and file paths which are released by close()
+        self._blocks: List[Any] = []
+        self._paths: List[str] = []
+        self._handle = SharedFrameHandle(row_count=len(data_frame))
+        try:
+            for column_name in data_frame.columns:
+                self._handle.columns.append(self._share_column(column_name, data_frame[column_name]))
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def handle(self) -> SharedFrameHandle:
+        """The handle which is passed to worker processes."""
+        return self._handle
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the shared data in bytes."""
+        return self._handle.nbytes
+
+    def close(self):
+        """Release the shared data. Attached frames must not be used afterwards."""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+        for path in self._paths:
+            if os.path.exists(path):
+                os.remove(path)
+        self._paths = []
+        if self._owns_directory and self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Place a column in shared memory.
+    def _share_column(self, column_name: Hashable, series: pd.Series) -> SharedColumnHandle:
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            return SharedColumnHandle(name=column_name, values=self._share_array(series.to_numpy()))
+
+        if isinstance(dtype, np.dtype) and dtype.kind == "O":
+            codes, uniques = pd.factorize(series)
+            if all(isinstance(x, str) for x in uniques):
+                encoded: List[bytes] = [x.encode("utf-8", "surrogatepass") for x in uniques]
+                offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+                offsets[1:] = np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)))
+                return SharedColumnHandle(
+                    name=column_name,
+                    values=self._share_array(codes.astype(np.int32 if len(uniques) < 2 ** 31 else np.int64)),
+                    dictionary_data=self._share_array(np.frombuffer(b"".join(encoded), dtype=np.uint8)),
+                    dictionary_offsets=self._share_array(offsets)
+                )
+
+        # Extension types and mixed types are not shared.
+        return SharedColumnHandle(
+            name=column_name,
+            pickled=pickle.dumps(series.reset_index(drop=True), protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+    # Copy an array into a new shared memory block or file.
+    def _share_array(self, array: np.ndarray) -> SharedArrayHandle:
+        array = np.ascontiguousarray(array)
+        if array.size == 0:
+            # Empty blocks and files cannot be mapped.
+            return SharedArrayHandle(name="", dtype=array.dtype.str, shape=array.shape)
+
+        if self._use_shared_memory:
+            block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+            self._blocks.append(block)
+            target = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            target[...] = array
+            del target
+            return SharedArrayHandle(name=block.name, dtype=array.dtype.str, shape=array.shape)
+
+        path = os.path.join(self._directory, f"{uuid.uuid4().hex}.bin")
+        self._paths.append(path)
+        target = np.memmap(path, dtype=array.dtype, mode="w+", shape=array.shape)
+        target[...] = array
+        target.flush()
+        del target
+        return SharedArrayHandle(name=path, dtype=array.dtype.str, shape=array.shape, is_file=True)
+
+
+class AttachedFrame:
+    """
+    Gives a worker process access to a :class:`SharedFrame`. Numeric columns
+    are read-only views of the shared data (no copy is made). The distinct
+    values of string columns are decoded once per column on first access.
+    """
+
+    def __init__(self, handle: SharedFrameHandle):
+        """
+        :param handle: The handle of the shared frame.
+        """
+        self._handle = handle
+        # Shared memory blocks which were attached to (by name)
+        self._blocks: Dict[str, Any] = {}
+        # The decoded distinct values of each string column (by name)
+        self._dictionaries: Dict[Hashable, np.ndarray] = {}
+
+    @property
+    def handle(self) -> SharedFrameHandle:
+        """The handle of the shared frame."""
+        return self._handle
+
+    def __len__(self) -> int:
+        return self._handle.row_count
+
+    def get_column(self, column_name: Hashable, rows: Optional[RowRange] = None) -> pd.Series:
+        """
+        :param column_name: The name of the column.
+        :param rows: The range of rows to return (all rows if None).
+        :return: The column. The index is the position of each row in the
+            shared frame.
+        """
+        column = self._handle.get_column(column_name)
+        start, stop = rows if rows is not None else (0, self._handle.row_count)
+        index = pd.RangeIndex(start, stop)
+
+        if column.pickled is not None:
+            series: pd.Series = pickle.loads(column.pickled).iloc[start:stop]
+            series.index = index
+            return series
+
+        values = self._attach_array(column.values)[start:stop]
+        if not column.is_encoded:
+            return pd.Series(values, index=index, name=column_name, copy=False)
+
+        return pd.Series(self._get_dictionary(column)[values], index=index, name=column_name)
+
+    def to_data_frame(
+            self,
+            column_names: Optional[List[Hashable]] = None,
+            rows: Optional[RowRange] = None
+    ) -> pd.DataFrame:
+        """
+        :param column_names: The columns to return (all columns if None).
+        :param rows: The range of rows to return (all rows if None).
+        :return: The columns as DataFrame. Note that pandas may copy numeric
+            columns when the DataFrame is constructed. Use :meth:`get_column`
+            to access single columns without copying.
+        """
+        if column_names is None:
+            column_names = self._handle.column_names
+        columns = [self.get_column(x, rows) for x in column_names]
+        start, stop = rows if rows is not None else (0, self._handle.row_count)
+        data_frame = pd.DataFrame(
+            dict(zip(range(len(columns)), columns)),
+            index=pd.RangeIndex(start, stop)
+        )
+        data_frame.columns = list(column_names)
+        return data_frame
+
+    def iter_columns(self, rows: Optional[RowRange] = None) -> Iterator[pd.Series]:
+        """
+        :param rows: The range of rows to return (all rows if None).
+        :return: The columns in order.
+        """
+        for column_name in self._handle.column_names:
+            yield self.get_column(column_name, rows)
+
+    def close(self):
+        """
+        Detach from the shared data. Columns which were returned must not be
+        used afterwards.
+        """
+        for block in self._blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                # Views of the block are still referenced. The block is
+                # unmapped when they are garbage collected.
+                pass
+        self._blocks = {}
+        self._dictionaries = {}
+
+    def __enter__(self) -> "AttachedFrame":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Return the decoded distinct values of a string column. The last element
+    # is used for missing values (code -1).
+    def _get_dictionary(self, column: SharedColumnHandle) -> np.ndarray:
+        dictionary = self._dictionaries.get(column.name)
+        if dictionary is None:
+            data = self._attach_array(column.dictionary_data)
+            offsets = self._attach_array(column.dictionary_offsets)
+            dictionary = np.empty(len(offsets), dtype=object)
+            for x in range(len(offsets) - 1):
+                dictionary[x] = data[offsets[x]:offsets[x + 1]].tobytes().decode("utf-8", "surrogatepass")
+            dictionary[-1] = np.nan
+            self._dictionaries[column.name] = dictionary
+        return dictionary
+
+    # Return a read-only view of a shared array.
+    def _attach_array(self, handle: SharedArrayHandle) -> np.ndarray:
+        if handle.name == "":
+            array = np.empty(handle.shape, dtype=handle.dtype)
+        elif handle.is_file:
+            array = np.memmap(handle.name, dtype=handle.dtype, mode="r", shape=handle.shape)
+        else:
+            block = self._blocks.get(handle.name)
+            if block is None:
+                block = shared_memory.SharedMemory(name=handle.name)
+                self._blocks[handle.name] = block
+            array = np.ndarray(handle.shape, dtype=handle.dtype, buffer=block.buf)
+        array.flags.writeable = False
+        return array
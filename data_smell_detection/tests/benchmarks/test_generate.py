@@ -0,0 +1,85 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.detector import (
+    DataSmellAwareConfiguration,
+    DetectorBuilder
+)
+
+from benchmarks.generate import DATA_SMELL_CONFIGURATION, INJECTORS, generate_dataset
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+
+
+class TestGenerateDataset:
+    def test_manifest(self, tmp_path):
+        path = str(tmp_path / "dataset.csv")
+        manifest = generate_dataset(path, rows=5000, chunk_size=700, seed=1)
+        with open(path + ".manifest.json", encoding="utf-8") as file:
+            assert json.load(file) == manifest
+
+        df = pd.read_csv(path)
+        assert len(df) == 5000
+        assert len(manifest["columns"]) == len(INJECTORS)
+        assert manifest["data_smell_configuration"] == {x.value: {"mostly": 1} for x in INJECTORS.keys()}
+        for column in manifest["columns"]:
+            assert column["injected_count"] > 0
+            assert column["faulty_count"] >= column["injected_count"]
+            assert column["first_injected_rows"] == sorted(column["first_injected_rows"])
+
+        missing_column = next(
+            x for x in manifest["columns"]
+            if x["data_smell_type"] == DataSmellType.MISSING_VALUE_SMELL.value
+        )
+        assert df[missing_column["name"]].isnull().sum() == missing_column["faulty_count"]
+
+    def test_chunk_size_independence(self, tmp_path):
+        path1 = str(tmp_path / "dataset1.csv")
+        path2 = str(tmp_path / "dataset2.csv")
+        manifest1 = generate_dataset(path1, rows=3000, columns=18, chunk_size=3000)
+        manifest2 = generate_dataset(path2, rows=3000, columns=18, chunk_size=250)
+        assert manifest1["columns"] == manifest2["columns"]
+        assert pd.read_csv(path1).equals(pd.read_csv(path2))
+
+    def test_rate_too_high(self, tmp_path):
+        with pytest.raises(ValueError):
+            generate_dataset(
+                str(tmp_path / "dataset.csv"),
+                rows=1000,
+                smell_rates={DataSmellType.EXTREME_VALUE_SMELL: 0.5}
+            )
+
+    def test_detection_matches_manifest(self, tmp_path):
+        manifest = generate_dataset(str(tmp_path / "dataset.csv"), rows=5000, chunk_size=1000)
+        context = GreatExpectationsContextBuilder(
+            _test_great_expectations_directory,
+            str(tmp_path)
+        ).build()
+        dataset = FileBasedDatasetManager(context).get_dataset("dataset.csv")
+        # The faulty counts of the manifest assume that mostly=1 is used.
+        configuration = DataSmellAwareConfiguration(
+            column_names=None,
+            data_smell_configuration=DATA_SMELL_CONFIGURATION
+        )
+        detection_results = DetectorBuilder(context=context, dataset=dataset).\
+            set_configuration(configuration).\
+            build().\
+            detect()
+
+        expected = {(x["name"], DataSmellType(x["data_smell_type"])): x["faulty_count"] for x in manifest["columns"]}
+        checked = 0
+        for result in detection_results:
+            key = (result.column_name, result.data_smell_type)
+            # Only the injected data smell may be present in a column.
+            assert result.statistics.faulty_element_count == expected.get(key, 0), key
+            checked += int(key in expected)
+        assert checked == len(expected)
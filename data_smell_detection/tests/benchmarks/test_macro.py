@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from benchmarks.macro import run_benchmark
+from benchmarks.plot import get_scaling_exponents, write_html_report
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+
+
+class TestPlot:
+    def test_get_scaling_exponents(self):
+        linear = [(10, 1.0), (100, 10.0), (1000, 100.0)]
+        assert get_scaling_exponents(linear) == pytest.approx([1.0, 1.0])
+        quadratic = [(10, 1.0), (100, 100.0)]
+        assert get_scaling_exponents(quadratic) == pytest.approx([2.0])
+        # Points without a positive time are skipped.
+        assert get_scaling_exponents([(10, 0.0), (100, 1.0)]) == []
+
+    def test_write_html_report(self, tmp_path):
+        path = str(tmp_path / "report.html")
+        series = {"total": [(10, 1.0), (100, 100.0)], "validation": [(10, 0.5), (100, 5.0)]}
+        write_html_report(path, "Report", [("Scaling", "rows", "seconds", series)])
+        with open(path, encoding="utf-8") as file:
+            content = file.read()
+        assert "<svg" in content
+        assert "validation" in content
+        # The quadratic curve is highlighted.
+        assert "2.00" in content and "red" in content
+
+
+class TestMacroBenchmark:
+    def test_run_benchmark(self, tmp_path):
+        results = run_benchmark(
+            [(1000, 9), (2000, 9)],
+            str(tmp_path),
+            _test_great_expectations_directory
+        )
+        assert [(x["rows"], x["columns"]) for x in results] == [(1000, 9), (2000, 9)]
+        for result in results:
+            assert result["verified"]
+            assert result["wall_time"] > 0
+            assert {"dataset_import", "profiling", "validation", "conversion"} <= set(result["stages"].keys())
@@ -0,0 +1,47 @@
+import pytest
+
+from datasmelldetection.core.datasmells import DataSmellType
+
+from benchmarks.columns import COLUMN_GENERATORS, generate_column
+from benchmarks.common import compare_results
+from benchmarks.micro import run_case
+
+
+class TestColumnGenerators:
+    @pytest.mark.parametrize("data_smell_type", list(COLUMN_GENERATORS.keys()))
+    def test_generate_column(self, data_smell_type):
+        column, mask = generate_column(data_smell_type, rows=10000, smell_rate=0.1, cardinality=100)
+        assert len(column) == len(mask) == 10000
+        assert 0 < mask.sum() < 10000
+
+        # The same seed must produce the same column.
+        column2, mask2 = generate_column(data_smell_type, rows=10000, smell_rate=0.1, cardinality=100)
+        assert column.equals(column2)
+        assert (mask == mask2).all()
+
+    def test_smell_rate(self):
+        _, mask = generate_column(DataSmellType.CASING_SMELL, rows=100000, smell_rate=0.05, cardinality=10)
+        assert mask.mean() == pytest.approx(0.05, abs=0.005)
+
+
+class TestMicroBenchmark:
+    @pytest.mark.parametrize("data_smell_type", list(COLUMN_GENERATORS.keys()))
+    def test_run_case(self, data_smell_type):
+        result = run_case(data_smell_type, rows=1000, smell_rate=0.01, cardinality=100, repeat=1)
+        assert result["rows"] == 1000
+        assert result["rows_per_second"] > 0
+        assert result["peak_memory"] > 0
+        # The injected faulty values must be detected.
+        assert result["unexpected_count"] == result["injected_faulty_count"]
+
+    def test_compare_results(self):
+        key_fields = ("data_smell_type", "rows")
+        baseline = [
+            {"data_smell_type": "Casing Smell", "rows": 1000, "rows_per_second": 100.0},
+            {"data_smell_type": "Casing Smell", "rows": 2000, "rows_per_second": 100.0}
+        ]
+        results = [{"data_smell_type": "Casing Smell", "rows": 1000, "rows_per_second": 50.0}]
+        comparisons = compare_results(results, baseline, key_fields, "rows_per_second")
+        assert len(comparisons) == 1
+        assert comparisons[0].key == ("Casing Smell", 1000)
+        assert comparisons[0].ratio == pytest.approx(0.5)
@@ -0,0 +1,27 @@
+import sys
+
+import pytest
+
+from benchmarks.startup import measure_import, parse_import_times, summarize_by_package
+
+
+class TestStartupBenchmark:
+    def test_parse_import_times(self):
+        stderr = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       150 |        150 |   numpy.core",
+            "import time:      1000 |       1150 | numpy",
+            "unrelated output"
+        ])
+        modules = parse_import_times(stderr)
+        assert modules == [
+            {"module": "numpy.core", "self": pytest.approx(150e-6), "cumulative": pytest.approx(150e-6)},
+            {"module": "numpy", "self": pytest.approx(1000e-6), "cumulative": pytest.approx(1150e-6)}
+        ]
+        assert summarize_by_package(modules) == {"numpy": pytest.approx(1150e-6)}
+
+    def test_measure_import(self):
+        result = measure_import("json")
+        assert result["wall_time"] >= 0
+        if sys.version_info >= (3, 7):
+            assert any(x["module"] == "json" for x in result["modules"])
@@ -6,6 +6,16 @@ from copy import deepcopy
 from datasmelldetection.core import DataSmellType
 from datasmelldetection.detectors.great_expectations.datasmell import DataSmellRegistry, \
     DataSmellMetadata
+from datasmelldetection.detectors.great_expectations.expectations import (
+    ExpectColumnValuesToNotContainExtremeValueSmell,
+    ExpectColumnValuesToNotContainSuspectSignSmell,
+    ExpectColumnValuesToNotContainIntegerAsFloatingPointNumberSmell,
+    ExpectColumnValuesToNotContainLongDataValueSmell,
+    ExpectColumnValuesToNotContainIntegerAsStringSmell,
+    ExpectColumnValuesToNotContainFloatingPointNumberAsStringSmell,
+    ExpectColumnValuesToNotContainCasingSmell,
+    ExpectColumnValuesToNotContainDuplicatedValueSmell
+)
 from great_expectations.profile.base import ProfilerDataType
 
 from .helper_dataclasses import DataSmellInformation
@@ -157,3 +167,19 @@ def data_smell_registry_with_data_smell2_custom_kwargs(
         )
 
     return registry
+
+
+# A data smell registry which contains the data smells of the data smell
+# testset.
+@pytest.fixture
+def data_smell_registry_testset() -> DataSmellRegistry:
+    registry = DataSmellRegistry()
+    ExpectColumnValuesToNotContainExtremeValueSmell().register_data_smell(registry=registry)
+    ExpectColumnValuesToNotContainSuspectSignSmell().register_data_smell(registry=registry)
+    ExpectColumnValuesToNotContainIntegerAsFloatingPointNumberSmell().register_data_smell(registry=registry)
+    ExpectColumnValuesToNotContainLongDataValueSmell().register_data_smell(registry=registry)
+    ExpectColumnValuesToNotContainIntegerAsStringSmell().register_data_smell(registry=registry)
+    ExpectColumnValuesToNotContainFloatingPointNumberAsStringSmell().register_data_smell(registry=registry)
+    ExpectColumnValuesToNotContainCasingSmell().register_data_smell(registry=registry)
+    ExpectColumnValuesToNotContainDuplicatedValueSmell().register_data_smell(registry=registry)
+    return registry
@@ -0,0 +1,203 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from datasmelldetection.detectors.great_expectations.artifacts import (
+    ColumnArtifactCache,
+    get_active_cache,
+    get_distance_to_nearest_integer,
+    get_duplicated_mask,
+    get_mean_and_standard_deviation,
+    get_non_integer_mask,
+    get_numeric_scan,
+    get_sign_summary,
+    get_sorted_view,
+    get_tokenization,
+    get_unique_codes
+)
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.detector import DetectorBuilder
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_data_directory = os.path.join(cwd, "tests/test_sets")
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+context = GreatExpectationsContextBuilder(
+    _test_great_expectations_directory,
+    _test_data_directory
+).build()
+dataset_manager = FileBasedDatasetManager(context=context)
+
+
+class TestColumnArtifactCache:
+    def test_get_or_compute(self):
+        cache = ColumnArtifactCache()
+        column = pd.Series([1.0, 2.5, None], name="a")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return np.zeros(3)
+
+        first = cache.get_or_compute(column, "zeros", compute)
+        second = cache.get_or_compute(column, "zeros", compute)
+        assert first is second
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.size == first.nbytes
+
+        # Parameters and other columns are part of the key.
+        cache.get_or_compute(column, "zeros", compute, parameters=(1,))
+        cache.get_or_compute(pd.Series([1.0], name="a"), "zeros", compute)
+        assert len(calls) == 3
+        assert len(cache) == 3
+
+        cache.clear()
+        assert len(cache) == 0 and cache.size == 0
+
+    def test_eviction(self):
+        cache = ColumnArtifactCache(max_bytes=2 * 800)
+        columns = [pd.Series(np.arange(100), name=str(x)) for x in range(3)]
+        for column in columns:
+            cache.get_or_compute(column, "copy", lambda: np.arange(100, dtype=np.int64))
+        assert cache.size <= cache.max_bytes
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        # The least recently used artifact was evicted.
+        cache.get_or_compute(columns[0], "copy", lambda: np.arange(100, dtype=np.int64))
+        assert cache.misses == 4
+
+        # Artifacts which exceed the limit are not cached.
+        cache.get_or_compute(columns[0], "large", lambda: np.arange(1000, dtype=np.int64))
+        assert cache.size <= cache.max_bytes
+
+    def test_activate(self):
+        cache = ColumnArtifactCache()
+        assert get_active_cache() is None
+        with cache.activate():
+            assert get_active_cache() is cache
+            other_thread_caches = []
+            thread = threading.Thread(target=lambda: other_thread_caches.append(get_active_cache()))
+            thread.start()
+            thread.join()
+            # The cache is only active in the calling thread.
+            assert other_thread_caches == [None]
+
+            column = pd.Series(["a", "bcd", "a", None], name="strings")
+            assert get_duplicated_mask(column).tolist() == [True, False, True, False]
+            codes, uniques = get_unique_codes(column)
+            assert codes.tolist() == [0, 1, 0, -1]
+            assert list(uniques) == ["a", "bcd"]
+        assert get_active_cache() is None
+        assert len(cache) == 2
+
+    def test_activate_for_other_data(self):
+        cache = ColumnArtifactCache()
+        first = pd.DataFrame({"a": ["x", "x", "y"]})
+        second = pd.DataFrame({"a": ["x", "y", "z"]})
+        with cache.activate(first):
+            assert get_duplicated_mask(first["a"]).tolist() == [True, True, False]
+        with cache.activate(first):
+            get_duplicated_mask(first["a"])
+        assert cache.hits == 1
+
+        # The columns have the same name and length, but the artifacts of the
+        # first data frame must not be used.
+        with cache.activate(second):
+            assert get_duplicated_mask(second["a"]).tolist() == [False, False, False]
+        assert cache.hits == 1
+        assert len(cache) == 2
+
+    def test_distance_to_nearest_integer(self):
+        column = pd.Series([1.0, 2.25, -3.75])
+        assert get_distance_to_nearest_integer(column).tolist() == [0.0, 0.25, 0.25]
+
+    def test_numeric_artifacts(self):
+        cache = ColumnArtifactCache()
+        column = pd.Series([1.0, 2.25, -3.75, 4.0], name="numbers")
+        with cache.activate():
+            scan = get_numeric_scan(column)
+            assert get_non_integer_mask(column, 0.1).tolist() == [False, True, True, False]
+            assert get_non_integer_mask(column, 0.3).tolist() == [False, False, False, False]
+            assert get_sign_summary(column) is scan.sign_summary
+            mean, standard_deviation = get_mean_and_standard_deviation(column)
+        # The scan only holds summaries and no per-value arrays.
+        assert scan.non_integer_mask is None and scan.z_score_below_mask is None
+        assert cache.size < 10000
+        # The mean and the standard deviation are computed like pandas (and
+        # Great Expectations) unless they are pinned.
+        assert (mean, standard_deviation) == (column.mean(), column.std())
+
+        cache.pin("numbers", "mean_and_standard_deviation", (0.0, 1.0))
+        with cache.activate():
+            assert get_mean_and_standard_deviation(column) == (0.0, 1.0)
+
+
+class TestSortedView:
+    def test_quantiles(self):
+        column = pd.Series([3.5, -1.0, 7.0, 2.0, -4.25, 2.0, 10.0])
+        view = get_sorted_view(column)
+        assert view.values.tolist() == sorted(column.tolist())
+        for q in [0.0, 0.05, 0.25, 0.5, 0.9, 1.0]:
+            assert view.quantile(q) == column.quantile(q)
+        assert view.median() == column.median()
+        assert view.median_absolute_deviation() == (column - column.median()).abs().median()
+        assert np.isnan(get_sorted_view(pd.Series([], dtype=float)).quantile(0.5))
+
+    def test_counts_and_masks(self):
+        column = pd.Series([3, -1, 0, 2, -4, 0, 10])
+        view = get_sorted_view(column)
+        assert (view.count_below(0), view.count_below(0, inclusive=True)) == (2, 4)
+        assert (view.count_above(0), view.count_above(0, inclusive=True)) == (3, 5)
+        assert view.find_first(lambda x: x > 2) == 5
+        assert view.find_first(lambda x: x > 100) == len(column)
+        # Masks are in column order.
+        assert view.get_mask(head=view.count_below(0)).tolist() == (column < 0).tolist()
+        assert view.get_mask(tail=2).tolist() == [True, False, False, False, False, False, True]
+        assert not view.get_mask().any()
+
+
+class TestTokenization:
+    def test_tokenization(self):
+        column = pd.Series(["a bc", "", "  d  ", "a bc", "ef gh ij"])
+        tokenization = get_tokenization(column)
+        # Only distinct values are tokenized.
+        assert len(tokenization) == 4
+        assert tokenization.tokens.tolist() == ["a", "bc", "d", "ef", "gh", "ij"]
+        assert tokenization.offsets.tolist() == [0, 2, 2, 3, 6]
+        assert tokenization.get_token_counts().tolist() == [2, 0, 1, 3]
+
+        token_flags = tokenization.map_tokens(lambda x: len(x) > 1)
+        assert token_flags.tolist() == [False, True, False, True, True, True]
+        assert tokenization.count_per_value(token_flags).tolist() == [1, 0, 0, 3]
+        assert tokenization.any_per_value(token_flags).tolist() == [True, False, False, True]
+        assert tokenization.all_per_value(token_flags).tolist() == [False, True, False, True]
+
+        words = get_tokenization(column, r"[a-c]+")
+        assert words.tokens.tolist() == ["a", "bc"]
+
+    def test_cached(self):
+        cache = ColumnArtifactCache()
+        column = pd.Series(["some Text", "aLongWordWhichIsLong"], name="text")
+        with cache.activate():
+            assert get_tokenization(column) is get_tokenization(column)
+        assert cache.hits == 1
+
+
+class TestDetectorArtifacts:
+    def test_artifacts_are_shared(self):
+        dataset = dataset_manager.get_dataset("data_smell_testset.csv")
+        detector = DetectorBuilder(context=context, dataset=dataset).build()
+        detection_results = detector.detect()
+        cache = dataset.artifact_cache
+        assert len(cache) > 0
+        misses = cache.misses
+
+        # Artifacts are reused by subsequent runs on the same dataset.
+        assert detector.detect() == detection_results
+        assert cache.misses == misses
+        assert cache.hits > 0
@@ -0,0 +1,73 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from datasmelldetection.detectors.great_expectations.bitmaps import RowBitmap
+
+
+def _create_indices() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    # A sparse chunk, a dense chunk, an empty chunk and a sparse chunk
+    return np.concatenate([
+        rng.choice(2 ** 16, size=100, replace=False),
+        2 ** 16 + rng.choice(2 ** 16, size=10000, replace=False),
+        3 * 2 ** 16 + np.arange(5)
+    ])
+
+
+class TestRowBitmap:
+    @pytest.mark.parametrize("indices", [
+        [],
+        [0],
+        [3, 1, 2, 1],
+        [2 ** 16 - 1, 2 ** 16, 2 ** 40],
+        _create_indices()
+    ])
+    def test_round_trip(self, indices):
+        bitmap = RowBitmap.from_indices(indices)
+        expected = np.unique(np.asarray(indices, dtype=np.int64))
+        np.testing.assert_array_equal(bitmap.to_indices(), expected)
+        assert len(bitmap) == len(expected)
+        assert list(bitmap) == expected.tolist()
+
+    def test_contains(self):
+        indices = _create_indices()
+        bitmap = RowBitmap.from_indices(indices)
+        index_set = set(indices.tolist())
+        for row in range(0, 4 * 2 ** 16, 97):
+            assert (row in bitmap) == (row in index_set)
+        assert all(x in bitmap for x in indices[::50])
+        assert -1 not in bitmap
+        assert "1" not in bitmap
+
+    def test_mask(self):
+        mask = np.random.default_rng(0).random(200000) < 0.3
+        bitmap = RowBitmap.from_mask(mask)
+        np.testing.assert_array_equal(bitmap.to_mask(len(mask)), mask)
+        np.testing.assert_array_equal(RowBitmap.from_mask(mask[:10], offset=5).to_indices(), np.flatnonzero(mask[:10]) + 5)
+
+    def test_set_operations(self):
+        first = RowBitmap.from_indices(range(0, 100000, 2))
+        second = RowBitmap.from_indices(range(0, 100000, 3))
+        assert (first | second).to_indices().tolist() == \
+            sorted(set(range(0, 100000, 2)) | set(range(0, 100000, 3)))
+        assert (first & second).to_indices().tolist() == list(range(0, 100000, 6))
+        assert RowBitmap.union([]) == RowBitmap.from_indices([])
+        assert RowBitmap.union([first, second]) == first | second
+
+    def test_equality(self):
+        assert RowBitmap.from_indices([1, 2]) == RowBitmap.from_indices([2, 1])
+        assert RowBitmap.from_indices([1, 2]) != RowBitmap.from_indices([1, 3])
+        assert RowBitmap.from_indices([1]) != [1]
+
+    def test_size(self):
+        indices = _create_indices()
+        bitmap = RowBitmap.from_indices(indices)
+        # The dense chunk is stored as a bitset of 8 KiB.
+        assert bitmap.nbytes < 2 * len(indices)
+        assert bitmap.nbytes < np.asarray(indices, dtype=np.int64).nbytes / 4
+
+    def test_pickle(self):
+        bitmap = RowBitmap.from_indices(_create_indices())
+        assert pickle.loads(pickle.dumps(bitmap)) == bitmap
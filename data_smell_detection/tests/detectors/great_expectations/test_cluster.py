@@ -0,0 +1,145 @@
+import os
+import time
+
+import pytest
+
+from datasmelldetection.detectors.great_expectations.cluster import (
+    ClusterError,
+    LocalCluster
+)
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.datasmell import DataSmellType
+from datasmelldetection.detectors.great_expectations.detector import (
+    DataSmellAwareConfiguration,
+    ResultDetail
+)
+from datasmelldetection.detectors.great_expectations.sharding import ShardedDetector
+from .fixtures import data_smell_registry_testset
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_data_directory = os.path.join(cwd, "tests/test_sets")
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+context = GreatExpectationsContextBuilder(
+    _test_great_expectations_directory,
+    _test_data_directory
+).build()
+dataset_manager = FileBasedDatasetManager(context=context)
+
+
+# The following functions are executed by the workers.
+
+def _square(value: int) -> int:
+    if value < 0:
+        raise ValueError("Negative value")
+    return value * value
+
+
+# Terminate the worker unless the marker file exists (which is created
+# first).
+def _exit_once(path: str) -> str:
+    if not os.path.exists(path):
+        open(path, "w").close()
+        os._exit(1)
+    return path
+
+
+# Fail on the worker which executes the job first (whose process id is
+# written to the file) and return the process id on any other worker.
+def _fail_on_first_worker(path: str) -> int:
+    if not os.path.exists(path):
+        with open(path, "w") as file:
+            file.write(str(os.getpid()))
+    with open(path) as file:
+        if int(file.read()) == os.getpid():
+            raise ValueError("First worker")
+    return os.getpid()
+
+
+def _sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+class TestClusterExecutor:
+    def test_map(self):
+        with LocalCluster(2, heartbeat_interval=0.1) as cluster:
+            assert cluster.get_executor().map(_square, range(10)) == [x * x for x in range(10)]
+            assert cluster.get_executor().map(_square, []) == []
+
+    def test_failed_job(self):
+        with LocalCluster(2, heartbeat_interval=0.1) as cluster:
+            with pytest.raises(ClusterError, match="Negative value"):
+                cluster.get_executor(max_attempts=2).map(_square, [1, -1])
+
+    def test_lost_worker_is_retried(self, tmp_path):
+        marker_path = str(tmp_path / "marker")
+        with LocalCluster(2, heartbeat_interval=0.1) as cluster:
+            assert cluster.get_executor().map(_exit_once, [marker_path]) == [marker_path]
+
+    def test_failed_job_is_retried_on_another_worker(self, tmp_path):
+        path = str(tmp_path / "first_worker")
+        with LocalCluster(2, heartbeat_interval=0.1) as cluster:
+            result = cluster.get_executor(max_attempts=2).map(_fail_on_first_worker, [path])
+        with open(path) as file:
+            assert result != [int(file.read())]
+
+        # A single worker retries the jobs it failed.
+        with LocalCluster(1, heartbeat_interval=0.1) as cluster:
+            with pytest.raises(ClusterError, match="First worker"):
+                cluster.get_executor(max_attempts=2).map(_fail_on_first_worker, [str(tmp_path / "single")])
+
+    def test_heartbeats(self):
+        with LocalCluster(1, heartbeat_interval=0.1) as cluster:
+            # Jobs may take longer than the timeout as long as heartbeats are
+            # sent.
+            assert cluster.get_executor(heartbeat_timeout=0.5).map(_sleep, [1.0]) == [1.0]
+
+        with LocalCluster(2, heartbeat_interval=5.0) as cluster:
+            with pytest.raises(ClusterError, match="lost"):
+                cluster.get_executor(heartbeat_timeout=0.3, max_attempts=2).map(_sleep, [1.0])
+
+    def test_unreachable_worker(self):
+        with LocalCluster(2) as cluster:
+            cluster.terminate_worker(0)
+            assert cluster.get_executor().map(_square, range(5)) == [x * x for x in range(5)]
+            cluster.terminate_worker(1)
+            with pytest.raises(ClusterError):
+                cluster.get_executor().map(_square, range(5))
+
+    def test_wrong_authkey(self):
+        with LocalCluster(1) as cluster:
+            executor = cluster.get_executor()
+            executor.authkey = b"wrong"
+            with pytest.raises(ClusterError):
+                executor.map(_square, [1])
+
+    def test_sharded_detector(self, data_smell_registry_testset):
+        configuration = DataSmellAwareConfiguration(
+            column_names=None,
+            data_smell_configuration={
+                DataSmellType.SUSPECT_SIGN_SMELL: {"mostly": 1, "percentile_threshold": 0.25},
+                DataSmellType.INTEGER_AS_STRING_SMELL: {"mostly": 0.2},
+                DataSmellType.DUPLICATED_VALUE_SMELL: {"mostly": 1}
+            },
+            result_detail=ResultDetail.COMPLETE
+        )
+        dataset = dataset_manager.get_dataset("data_smell_testset.csv", lazy=True)
+        expected = ShardedDetector(
+            dataset,
+            configuration=configuration,
+            registry=data_smell_registry_testset,
+            shard_count=3,
+            processes=1
+        ).detect()
+        with LocalCluster(2) as cluster:
+            actual = ShardedDetector(
+                dataset,
+                configuration=configuration,
+                registry=data_smell_registry_testset,
+                shard_count=3,
+                executor=cluster.get_executor()
+            ).detect()
+        assert actual == expected
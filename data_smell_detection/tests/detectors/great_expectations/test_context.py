@@ -0,0 +1,81 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread, current_thread
+
+from great_expectations import DataContext
+
+from datasmelldetection.detectors.great_expectations.context import (
+    GreatExpectationsContextBuilder,
+    GreatExpectationsContextPool
+)
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_data_directory = os.path.join(cwd, "tests/test_sets")
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+
+
+class TestGreatExpectationsContextPool:
+    def test_get_context(self):
+        pool = GreatExpectationsContextPool()
+        context1 = pool.get_context(_test_great_expectations_directory, _test_data_directory)
+        assert isinstance(context1, DataContext)
+
+        # The same instance must be returned for the same directories.
+        context2 = pool.get_context(_test_great_expectations_directory, _test_data_directory)
+        assert context1 is context2
+        assert len(pool) == 1
+
+    def test_different_data_directories(self):
+        pool = GreatExpectationsContextPool()
+        context1 = pool.get_context(_test_great_expectations_directory, _test_data_directory)
+        context2 = pool.get_context(_test_great_expectations_directory, cwd)
+        assert context1 is not context2
+        assert len(pool) == 2
+
+    def test_concurrent_access(self):
+        pool = GreatExpectationsContextPool()
+
+        def get_context(_):
+            return current_thread().ident, pool.get_context(_test_great_expectations_directory, _test_data_directory)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contexts = list(executor.map(get_context, range(16)))
+
+        # Each thread uses its own context.
+        context_by_thread = dict(contexts)
+        assert all(context is context_by_thread[thread] for thread, context in contexts)
+        assert len({id(x) for x in context_by_thread.values()}) == len(context_by_thread)
+
+    def test_contexts_of_terminated_threads_are_reused(self):
+        pool = GreatExpectationsContextPool()
+        contexts = []
+
+        def get_context():
+            contexts.append(pool.get_context(_test_great_expectations_directory, _test_data_directory))
+
+        for _ in range(2):
+            thread = Thread(target=get_context)
+            thread.start()
+            thread.join()
+        assert contexts[0] is contexts[1]
+        assert len(pool) == 0
+
+    def test_clear(self):
+        pool = GreatExpectationsContextPool()
+        context1 = pool.get_context(_test_great_expectations_directory, _test_data_directory)
+        pool.clear()
+        assert len(pool) == 0
+        context2 = pool.get_context(_test_great_expectations_directory, _test_data_directory)
+        assert context1 is not context2
+
+    def test_builder_build_cached(self):
+        pool = GreatExpectationsContextPool()
+        builder = GreatExpectationsContextBuilder(
+            _test_great_expectations_directory,
+            _test_data_directory
+        )
+        assert builder.build_cached(pool) is builder.build_cached(pool)
+        assert builder.build_cached(pool) is \
+            pool.get_context(_test_great_expectations_directory, _test_data_directory)
@@ -1,9 +1,15 @@
 import os
 import great_expectations
+import pandas as pd
 from great_expectations.core.batch import BatchRequest
 
 from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
-from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.memory import MemoryEstimate
+from datasmelldetection.detectors.great_expectations.transport import AttachedFrame
+from datasmelldetection.detectors.great_expectations.context import (
+    GreatExpectationsContextBuilder,
+    GreatExpectationsContextPool
+)
 from datasmelldetection.core import Dataset
 
 cwd = os.getcwd()
@@ -37,6 +43,20 @@ class TestFileBasedDatasetManager:
         dataset = manager.get_dataset("data_smell_testset.csv")
         assert isinstance(dataset, Dataset)
 
+    def test_files_added_to_cached_context(self, tmp_path):
+        pd.DataFrame({"a": [1, 2]}).to_csv(tmp_path / "first.csv", index=False)
+        builder = GreatExpectationsContextBuilder(_test_great_expectations_directory, str(tmp_path))
+        pool = GreatExpectationsContextPool()
+        assert FileBasedDatasetManager(context=builder.build_cached(pool)).get_dataset("first.csv") is not None
+
+        # The cached context must find files which were written afterwards.
+        pd.DataFrame({"b": [3, 4, 5]}).to_csv(tmp_path / "second.csv", index=False)
+        second_manager = FileBasedDatasetManager(context=builder.build_cached(pool))
+        assert second_manager.get_available_dataset_identifiers() == {"first.csv", "second.csv"}
+        dataset = second_manager.get_dataset("second.csv")
+        assert dataset.get_ordered_column_names() == ["b"]
+        assert len(dataset.get_great_expectations_dataset()) == 3
+
 
 class TestDatasetWrapper:
     def test_get_column_names(self):
@@ -62,6 +82,36 @@ class TestDatasetWrapper:
         ge_dataset = dataset.get_great_expectations_dataset()
         assert isinstance(ge_dataset, great_expectations.dataset.Dataset)
 
+    def test_lazy_loading(self):
+        dataset = manager.get_dataset("data_smell_testset.csv", lazy=True)
+        assert not dataset.is_loaded()
+        assert os.path.exists(dataset.get_path())
+
+        # Column names and estimates are available without loading.
+        assert dataset.get_ordered_column_names()[:2] == ["int1", "int2"]
+        assert dataset.get_column_names() == manager.get_dataset("data_smell_testset.csv").get_column_names()
+        estimate = dataset.estimate_memory_usage()
+        assert isinstance(estimate, MemoryEstimate)
+        assert estimate.is_exact
+        assert list(dataset.read_columns(["string1", "int1"]).columns) == ["int1", "string1"]
+        assert not dataset.is_loaded()
+
+        ge_dataset = dataset.get_great_expectations_dataset()
+        assert isinstance(ge_dataset, great_expectations.dataset.Dataset)
+        assert dataset.is_loaded()
+        assert estimate.row_count == len(ge_dataset)
+        assert dataset.estimate_memory_usage().column_bytes == estimate.column_bytes
+
+    def test_share(self):
+        dataset = manager.get_dataset("data_smell_testset.csv", lazy=True)
+        with dataset.share(["int1", "string1"]) as shared_frame:
+            with AttachedFrame(shared_frame.handle) as frame:
+                pd.testing.assert_frame_equal(
+                    frame.to_data_frame(),
+                    dataset.read_columns(["int1", "string1"])
+                )
+        assert not dataset.is_loaded()
+
     def test_get_batch_request(self):
         dataset = manager.get_dataset("data_smell_testset.csv")
 
@@ -1,6 +1,13 @@
+from copy import deepcopy
+import pickle
+
+import pytest
 from great_expectations.profile.base import ProfilerDataType
 
-from datasmelldetection.detectors.great_expectations.datasmell import DataSmellRegistry
+from datasmelldetection.detectors.great_expectations.datasmell import (
+    DataSmellRegistry,
+    DataSmellRegistrySnapshot
+)
 
 from .helper_functions import (
     check_data_smell_stored_in_registry,
@@ -150,6 +157,78 @@ class TestDataSmellRegistry:
         )
 
 
+class TestDataSmellRegistrySnapshot:
+    def test_snapshot_contents(
+            self,
+            data_smell_registry_with_data_smell2,
+            data_smell_information1,
+            data_smell_information2):
+        registry: DataSmellRegistry = data_smell_registry_with_data_smell2
+        snapshot = registry.snapshot()
+        assert isinstance(snapshot, DataSmellRegistrySnapshot)
+
+        # The lookups of the snapshot must match the lookups of the registry.
+        for data_type in ProfilerDataType:
+            assert dict(snapshot.get_smell_dict_for_profiler_data_type(data_type)) == \
+                registry.get_smell_dict_for_profiler_data_type(data_type)
+        check_get_expectation_type_to_data_smell_type_dict(
+            returned_dict=dict(snapshot.get_expectation_type_to_data_smell_type_dict()),
+            data_smell_information=[data_smell_information1, data_smell_information2]
+        )
+        assert snapshot.get_registered_data_smells() == registry.get_registered_data_smells()
+
+    def test_snapshot_is_read_only(self, data_smell_registry_with_data_smell1):
+        snapshot = data_smell_registry_with_data_smell1.snapshot()
+        with pytest.raises(TypeError):
+            snapshot.get_expectation_type_to_data_smell_type_dict()["x"] = None
+        with pytest.raises(TypeError):
+            snapshot.get_smell_dict_for_profiler_data_type(ProfilerDataType.INT)["x"] = None
+
+    def test_snapshot_reuse_and_invalidation(
+            self,
+            data_smell_registry_with_data_smell1,
+            data_smell_information1,
+            data_smell_information2):
+        registry: DataSmellRegistry = deepcopy(data_smell_registry_with_data_smell1)
+        snapshot1 = registry.snapshot()
+        # The snapshot is only recomputed after a registration.
+        assert registry.snapshot() is snapshot1
+        assert snapshot1.snapshot() is snapshot1
+
+        registry.register(
+            metadata=data_smell_information2.metadata,
+            expectation_type=data_smell_information2.expectation_type
+        )
+        snapshot2 = registry.snapshot()
+        assert snapshot2 is not snapshot1
+        assert snapshot1 != snapshot2
+        # The old snapshot must not be affected by the registration.
+        check_get_registered_data_smells(
+            returned_set=set(snapshot1.get_registered_data_smells()),
+            data_smell_information=[data_smell_information1]
+        )
+        check_get_registered_data_smells(
+            returned_set=set(snapshot2.get_registered_data_smells()),
+            data_smell_information=[data_smell_information1, data_smell_information2]
+        )
+
+    def test_snapshot_hash(self, data_smell_registry_with_data_smell2):
+        # Registries with equal contents produce equal snapshots.
+        registry_copy = deepcopy(data_smell_registry_with_data_smell2)
+        snapshot1 = data_smell_registry_with_data_smell2.snapshot()
+        snapshot2 = registry_copy.snapshot()
+        assert snapshot1 is not snapshot2
+        assert snapshot1 == snapshot2
+        assert hash(snapshot1) == hash(snapshot2)
+        assert len({snapshot1, snapshot2}) == 1
+
+    def test_pickle(self, data_smell_registry_with_data_smell2):
+        registry = data_smell_registry_with_data_smell2
+        snapshot = registry.snapshot()
+        assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+        assert pickle.loads(pickle.dumps(registry)).snapshot() == snapshot
+
+
 class TestDataSmell:
     def test_is_abstract(self):
         # TODO
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import os
-from typing import List
+import sys
+import tracemalloc
+from typing import List, Iterator
 
 import pytest
 
@@ -9,7 +11,11 @@ from datasmelldetection.core.detector import (
     DetectionResult
 )
 from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
-from datasmelldetection.detectors.great_expectations.converter import StandardResultConverter
+from datasmelldetection.detectors.great_expectations.converter import (
+    CompactDetectionResult,
+    CompactResultConverter,
+    StandardResultConverter
+)
 from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
 from datasmelldetection.detectors.great_expectations.datasmell import (
     DataSmellRegistry,
@@ -17,8 +23,12 @@ from datasmelldetection.detectors.great_expectations.datasmell import (
 )
 from datasmelldetection.detectors.great_expectations.detector import (
     DetectorBuilder,
+    GreatExpectationsDetector,
     DataSmellAwareConfiguration,
+    ResultDetail
 )
+from datasmelldetection.detectors.great_expectations.memory import MemoryBudgetExceededError, get_peak_memory
+from datasmelldetection.detectors.great_expectations.profiling import ProfileCapture
 from datasmelldetection.detectors.great_expectations.expectations import (
     ExpectColumnValuesToNotContainExtremeValueSmell,
     ExpectColumnValuesToNotContainSuspectSignSmell,
@@ -241,3 +251,262 @@ class TestDetectorBuilder:
                 # Ensure a matching DetectionResult object was returned for second testcase
                 assert any(map(is_match_expected_detection_result, detection_results2)), \
                     testcase.title
+
+
+class TestGreatExpectationsDetector:
+    def test_detect_iter(self, registry):
+        configuration = testcases[0].configuration
+
+        def build_detector():
+            return DetectorBuilder(context=context, dataset=data_smell_testset).\
+                set_registry(registry).\
+                set_configuration(configuration).\
+                build()
+
+        detection_results = build_detector().detect()
+        iterator = build_detector().detect_iter()
+        # A generator must be returned to allow progressive processing.
+        assert isinstance(iterator, Iterator)
+        streamed_results = list(iterator)
+        assert streamed_results == detection_results
+
+        # Results are yielded column by column.
+        column_names = [x.column_name for x in streamed_results]
+        seen_columns: List[str] = []
+        for column_name in column_names:
+            if not seen_columns or seen_columns[-1] != column_name:
+                assert column_name not in seen_columns
+                seen_columns.append(column_name)
+
+    def test_detect_iter_abandon(self, registry):
+        configuration = testcases[0].configuration
+        iterator = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            set_configuration(configuration).\
+            build().\
+            detect_iter()
+
+        # Stop after the first result.
+        first_result = next(iterator)
+        assert isinstance(first_result, DetectionResult)
+        iterator.close()
+
+    def test_result_detail(self, registry):
+        configuration = testcases[0].configuration
+
+        def detect(result_detail: ResultDetail, sample_count: int = 20):
+            return DetectorBuilder(context=context, dataset=data_smell_testset).\
+                set_registry(registry).\
+                set_configuration(replace(
+                    configuration,
+                    result_detail=result_detail,
+                    sample_count=sample_count
+                )).\
+                build().\
+                detect()
+
+        samples_results = detect(ResultDetail.SAMPLES)
+        counts_results = detect(ResultDetail.COUNTS)
+        complete_results = detect(ResultDetail.COMPLETE)
+        limited_results = detect(ResultDetail.SAMPLES, sample_count=1)
+
+        # The detected data smells and statistics must not depend on the
+        # result detail.
+        for results in [counts_results, complete_results, limited_results]:
+            assert [(x.column_name, x.data_smell_type, x.statistics) for x in results] == \
+                [(x.column_name, x.data_smell_type, x.statistics) for x in samples_results]
+
+        assert all(len(x.faulty_elements) == 0 for x in counts_results)
+        assert all(len(x.faulty_elements) <= 1 for x in limited_results)
+        assert all(x.faulty_row_indices is None for x in samples_results)
+        for result in complete_results:
+            assert result.faulty_row_indices is not None
+            assert len(result.faulty_row_indices) == result.statistics.faulty_element_count
+
+    def test_compact_results(self, registry):
+        configuration = replace(testcases[0].configuration, result_detail=ResultDetail.COMPLETE)
+        expected_results = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            set_configuration(configuration).\
+            build().\
+            detect()
+        compact_results = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            set_configuration(configuration).\
+            set_converter(CompactResultConverter(registry=registry)).\
+            build().\
+            detect()
+
+        assert all(isinstance(x, CompactDetectionResult) for x in compact_results)
+        assert not any(hasattr(x, "__dict__") for x in compact_results)
+        assert [x.to_detection_result() for x in compact_results] == expected_results
+        for result in compact_results:
+            assert len(result.faulty_rows) == result.faulty_element_count
+            mask = result.faulty_rows.to_mask(len(data_smell_testset.get_great_expectations_dataset()))
+            assert mask.sum() == result.faulty_element_count
+
+    def test_collect_evaluation_timings(self, registry):
+        configuration = testcases[0].configuration
+        detector = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            set_configuration(replace(configuration, collect_evaluation_timings=True)).\
+            build()
+        assert detector.run_report is None
+
+        detection_results = detector.detect()
+        assert len(detection_results) == len(testcases[0].expected_detection_results)
+
+        run_report = detector.run_report
+        assert run_report is not None
+        assert run_report.row_count == 10
+        # 2 int columns * 3 smells + 2 float columns * 3 smells +
+        # 3 string columns * 5 smells
+        assert len(run_report.evaluations) == 27
+        for evaluation in run_report.evaluations:
+            assert evaluation.data_smell_type in registry.get_registered_data_smells()
+            assert evaluation.row_count == 10
+            assert evaluation.wall_time >= 0
+            assert evaluation.cpu_time >= 0
+            assert evaluation.rows_per_second >= 0
+
+        assert sum(run_report.get_wall_time_by_column().values()) == \
+            pytest.approx(sum(x.wall_time for x in run_report.evaluations))
+        assert set(run_report.get_wall_time_by_data_smell_type().keys()) == \
+            registry.get_registered_data_smells()
+
+        # Timings are only collected on request.
+        detector.configuration = configuration
+        detector.detect()
+        assert len(detector.run_report.evaluations) == 0
+
+    def test_collect_memory_usage(self, registry):
+        configuration = testcases[0].configuration
+        detector = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            set_configuration(replace(
+                configuration,
+                collect_evaluation_timings=True,
+                collect_memory_usage=True
+            )).\
+            build()
+        was_tracing = tracemalloc.is_tracing()
+        detector.detect()
+        # Tracing is only stopped if it was started by the detector.
+        assert tracemalloc.is_tracing() == was_tracing
+
+        run_report = detector.run_report
+        assert [x.name for x in run_report.stages] == \
+            ["dataset_load", "profiling", "validation", "conversion"]
+        for stage in run_report.stages:
+            assert stage.wall_time >= 0
+            assert stage.peak_memory is not None and stage.peak_memory >= 0
+            assert stage.memory_increment is not None
+        assert run_report.get_stage("validation").peak_memory > 0
+        if sys.platform != "win32":
+            assert run_report.peak_rss > 0
+        for evaluation in run_report.evaluations:
+            assert evaluation.peak_memory is not None and evaluation.peak_memory >= 0
+
+        # Stages are timed, but memory is only collected on request.
+        detector.configuration = configuration
+        detector.detect()
+        assert len(detector.run_report.stages) == 4
+        assert all(x.peak_memory is None for x in detector.run_report.stages)
+        assert detector.run_report.peak_rss is None
+
+    def test_profile_capture(self, registry, tmp_path):
+        configuration = testcases[0].configuration
+        detector = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            set_configuration(configuration).\
+            set_profile_capture(ProfileCapture(str(tmp_path))).\
+            build()
+        detection_results = detector.detect()
+        assert len(detection_results) == len(testcases[0].expected_detection_results)
+        profile_path = detector.run_report.profile_path
+        assert profile_path is not None and os.path.exists(profile_path)
+
+        # Runs below the threshold are not written.
+        detector.profile_capture = ProfileCapture(str(tmp_path / "slow"), threshold=3600.0)
+        detector.detect()
+        assert detector.run_report.profile_path is None
+        assert not os.path.exists(str(tmp_path / "slow"))
+
+    def test_max_memory(self, registry):
+        configuration = testcases[0].configuration
+        expected = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            set_configuration(configuration).\
+            build().\
+            detect()
+
+        # A budget which fits the largest column but not all columns
+        dataset = dataset_manager.get_dataset("data_smell_testset.csv", lazy=True)
+        column_bytes = dataset.estimate_memory_usage().column_bytes
+        factor = GreatExpectationsDetector.working_memory_factor
+        max_memory = max(get_peak_memory({x: y}, factor) for x, y in column_bytes.items())
+        assert get_peak_memory(column_bytes, factor) > max_memory
+
+        detector = DetectorBuilder(context=context, dataset=dataset).\
+            set_registry(registry).\
+            set_configuration(replace(configuration, max_memory=max_memory)).\
+            build()
+        detection_results = detector.detect()
+        assert detector.run_report.column_batch_count > 1
+        assert detector.run_report.estimated_peak_memory > max_memory
+        # The whole dataset is never loaded.
+        assert not dataset.is_loaded()
+
+        def to_comparable(results):
+            return sorted(
+                (x.column_name, x.data_smell_type.value, x.statistics, str(x.faulty_elements))
+                for x in results
+            )
+        assert to_comparable(detection_results) == to_comparable(expected)
+
+        # A sufficient budget processes all columns at once.
+        detector.configuration = replace(configuration, max_memory=2 ** 40)
+        detector.detect()
+        assert detector.run_report.column_batch_count == 1
+
+    def test_max_memory_exceeded(self, registry):
+        dataset = dataset_manager.get_dataset("data_smell_testset.csv", lazy=True)
+        detector = DetectorBuilder(context=context, dataset=dataset).\
+            set_registry(registry).\
+            set_configuration(replace(testcases[0].configuration, max_memory=1)).\
+            build()
+        with pytest.raises(MemoryBudgetExceededError):
+            detector.detect()
+        # The error is raised before loading.
+        assert not dataset.is_loaded()
+
+    def test_time_budget(self, registry):
+        configuration = testcases[0].configuration
+        detector = DetectorBuilder(context=context, dataset=data_smell_testset).\
+            set_registry(registry).\
+            set_configuration(configuration).\
+            build()
+        expected = detector.detect()
+
+        detector.configuration = replace(configuration, time_budget=3600.0)
+        detection_results = detector.detect()
+        assert len(detection_results) == len(expected)
+        assert all(x in expected for x in detection_results)
+        assert detector.run_report.is_complete
+
+        # Cheap evaluations are started first.
+        data_smell_types = [x.data_smell_type for x in detection_results]
+        assert len(data_smell_types) - data_smell_types[::-1].index(
+            DataSmellType.INTEGER_AS_FLOATING_POINT_NUMBER_SMELL
+        ) <= data_smell_types.index(DataSmellType.CASING_SMELL)
+
+        # No evaluation is started if the budget is exhausted.
+        detector.configuration = replace(configuration, time_budget=0.0)
+        assert len(detector.detect()) == 0
+        run_report = detector.run_report
+        assert not run_report.is_complete
+        # Evaluations without faulty elements are skipped as well.
+        assert len(run_report.skipped_evaluations) >= len(expected)
+        assert all(x.expectation_type is not None for x in run_report.skipped_evaluations)
+        skipped = {(x.column_name, x.data_smell_type) for x in run_report.skipped_evaluations}
+        assert all((x.column_name, x.data_smell_type) in skipped for x in expected)
@@ -1,7 +1,15 @@
 # Check whether the expectations which implement data smell detection work as intended.
 # "Examples" are executed to test the behaviour.
 from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation import Expectation
+from great_expectations.validator.validator import Validator
 
 from datasmelldetection.detectors.great_expectations.expectations import (
     ExpectColumnValuesToNotContainSuspectSignSmell,
@@ -29,3 +37,33 @@ class TestExpectations:
         for expectation in self.expectations_to_test:
             print(f"Executing tests for {expectation.expectation_type}")
             check_expectation_examples(expectation)
+
+
+class TestExtremeValueSmell:
+    @pytest.mark.parametrize("double_sided", [True, False])
+    def test_same_result_as_z_score_metric(self, double_sided):
+        rng = np.random.default_rng(0)
+        column = pd.Series(np.append(rng.normal(0.1, 3.0, size=997), [17.3, -16.9, 0.7]))
+        # The largest value is exactly at the threshold.
+        threshold = float((column.max() - column.mean()) / column.std())
+        kwargs = {"column": "values", "threshold": threshold, "double_sided": double_sided}
+        validation_results = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=pd.DataFrame({"values": column}))]
+        ).graph_validate(
+            configurations=[
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_not_contain_extreme_value_smell",
+                    kwargs=kwargs
+                ),
+                # Uses the "column_values.z_score.under_threshold" metric.
+                ExpectationConfiguration(
+                    expectation_type="expect_column_value_z_scores_to_be_less_than",
+                    kwargs=kwargs
+                )
+            ],
+            runtime_configuration={"result_format": {"result_format": "COMPLETE"}}
+        )
+        actual, expected = [x.result["unexpected_index_list"] for x in validation_results]
+        assert int(column.idxmax()) in expected
+        assert actual == expected
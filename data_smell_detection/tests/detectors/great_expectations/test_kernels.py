@@ -0,0 +1,179 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datasmelldetection.detectors.great_expectations.artifacts import get_distance_to_nearest_integer
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.detector import (
+    DataSmellAwareConfiguration,
+    DetectorBuilder
+)
+from datasmelldetection.detectors.great_expectations.kernels import (
+    BlockExecutor,
+    apply_elementwise,
+    distance_to_nearest_integer,
+    get_active_executor,
+    is_jit_available,
+    scan_numeric,
+    z_score_below
+)
+from datasmelldetection.detectors.great_expectations.summaries import Moments, SignSummary
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_data_directory = os.path.join(cwd, "tests/test_sets")
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+context = GreatExpectationsContextBuilder(
+    _test_great_expectations_directory,
+    _test_data_directory
+).build()
+dataset_manager = FileBasedDatasetManager(context=context)
+
+
+class TestBlockExecutor:
+    @pytest.mark.parametrize("length", [0, 1, 9, 10, 11, 100])
+    def test_get_blocks(self, length):
+        executor = BlockExecutor(thread_count=4, min_block_size=10)
+        blocks = executor.get_blocks(length)
+        assert 1 <= len(blocks) <= 4
+        assert blocks[0][0] == 0
+        assert blocks[-1][1] == length
+        assert all(x[1] == y[0] for x, y in zip(blocks, blocks[1:]))
+        assert len(blocks) == 1 or all(y - x >= 10 for x, y in blocks)
+
+    def test_map_blocks(self):
+        thread_names = set()
+
+        def function(start, stop):
+            thread_names.add(threading.current_thread().name)
+            return start, stop
+
+        with BlockExecutor(thread_count=3, min_block_size=1) as executor:
+            assert executor.map_blocks(function, 9) == [(0, 3), (3, 6), (6, 9)]
+        assert threading.current_thread().name not in thread_names
+
+    def test_activate(self):
+        executor = BlockExecutor(thread_count=2)
+        assert get_active_executor() is None
+        with executor.activate():
+            assert get_active_executor() is executor
+        assert get_active_executor() is None
+
+
+class TestKernels:
+    def test_results_equal_unblocked_results(self):
+        values = np.random.default_rng(0).normal(0, 10, size=1001)
+        values[::7] = np.nan
+        expected_distances = distance_to_nearest_integer(values)
+        expected_z_scores = z_score_below(values, 1.5, 10.0, 2.0, double_sided=True)
+
+        with BlockExecutor(thread_count=4, min_block_size=100) as executor, executor.activate():
+            np.testing.assert_array_equal(distance_to_nearest_integer(values), expected_distances)
+            np.testing.assert_array_equal(z_score_below(values, 1.5, 10.0, 2.0, double_sided=True), expected_z_scores)
+            np.testing.assert_array_equal(
+                apply_elementwise(np.isnan, values, bool),
+                np.isnan(values)
+            )
+
+    def test_degenerated_z_scores(self):
+        values = np.array([1.0, 1.0, 2.0])
+        # Like pandas: NaN z-scores are not below the threshold.
+        assert not z_score_below(values, 1.0, 0.0, 3.0, double_sided=True).any()
+        assert z_score_below(values, 1.0, 0.0, 3.0, double_sided=False).tolist() == [False, False, False]
+
+    def test_artifacts(self):
+        column = pd.Series(np.arange(1000) / 4)
+        column[::3] = np.nan
+        with BlockExecutor(thread_count=4, min_block_size=10) as executor, executor.activate():
+            distances = get_distance_to_nearest_integer(column)
+        np.testing.assert_array_equal(distances, get_distance_to_nearest_integer(column))
+
+
+def _create_values() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    values = np.round(rng.normal(0, 10, size=1001), 1)
+    values[::7] = np.nan
+    values[::11] = 0.0
+    return values
+
+
+class TestScanNumeric:
+    @pytest.mark.parametrize("use_jit", [False, True] if is_jit_available() else [False])
+    @pytest.mark.parametrize("thread_count", [None, 3])
+    def test_scan(self, use_jit, thread_count):
+        values = _create_values()
+        non_null_values = values[~np.isnan(values)]
+
+        def scan():
+            return scan_numeric(
+                values,
+                epsilon=0.15,
+                mean=1.5,
+                standard_deviation=10.0,
+                threshold=-2.0,
+                double_sided=True,
+                use_jit=use_jit
+            )
+
+        if thread_count is None:
+            result = scan()
+        else:
+            with BlockExecutor(thread_count=thread_count, min_block_size=100) as executor, executor.activate():
+                result = scan()
+
+        np.testing.assert_array_equal(result.non_integer_mask, distance_to_nearest_integer(values) > 0.15)
+        np.testing.assert_array_equal(
+            result.z_score_below_mask,
+            np.abs((values - 1.5) / 10.0) < 2.0
+        )
+        assert result.sign_summary == SignSummary.from_values(non_null_values)
+        expected_moments = Moments.from_values(non_null_values)
+        assert result.moments.count == expected_moments.count
+        assert result.moments.mean == pytest.approx(expected_moments.mean)
+        assert result.moments.m2 == pytest.approx(expected_moments.m2)
+
+    def test_requested_results_only(self):
+        result = scan_numeric(_create_values(), summarize=False)
+        assert result.moments is None
+        assert result.sign_summary is None
+        assert result.non_integer_mask is None
+        assert result.z_score_below_mask is None
+
+    @pytest.mark.skipif(not is_jit_available(), reason="numba is not installed")
+    def test_degenerated_z_scores(self):
+        values = np.array([1.0, 1.0, 2.0, np.nan])
+        for double_sided in [True, False]:
+            result = scan_numeric(
+                values,
+                mean=1.0,
+                standard_deviation=0.0,
+                threshold=3.0,
+                double_sided=double_sided,
+                summarize=False,
+                use_jit=True
+            )
+            assert not result.z_score_below_mask.any()
+
+
+class TestDetectorThreads:
+    def test_results_are_independent_of_thread_count(self):
+        dataset = dataset_manager.get_dataset("data_smell_testset.csv")
+        results = []
+        for thread_count in [1, 4]:
+            configuration = DataSmellAwareConfiguration(
+                column_names=None,
+                data_smell_configuration=None,
+                thread_count=thread_count
+            )
+            results.append(
+                DetectorBuilder(context=context, dataset=dataset).
+                set_configuration(configuration).
+                build().
+                detect()
+            )
+        assert results[0] == results[1]
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+from datasmelldetection.detectors.great_expectations.memory import (
+    MemoryBudgetExceededError,
+    estimate_memory_usage,
+    get_peak_memory,
+    plan_column_batches
+)
+
+
+def _write_csv(path, rows):
+    pd.DataFrame({
+        "integers": range(rows),
+        "strings": [f"value {x}" for x in range(rows)]
+    }).to_csv(path, index=False)
+
+
+class TestEstimateMemoryUsage:
+    def test_small_file_is_exact(self, tmp_path):
+        path = str(tmp_path / "small.csv")
+        _write_csv(path, 100)
+        estimate = estimate_memory_usage(path, sample_row_count=1000)
+        assert estimate.is_exact
+        assert estimate.row_count == 100
+        actual = pd.read_csv(path).memory_usage(deep=True, index=False)
+        assert estimate.column_bytes == {x: int(actual[x]) for x in ["integers", "strings"]}
+        assert estimate.total_bytes == int(actual.sum())
+
+    def test_large_file_is_extrapolated(self, tmp_path):
+        path = str(tmp_path / "large.csv")
+        _write_csv(path, 20000)
+        estimate = estimate_memory_usage(path, sample_row_count=500)
+        assert not estimate.is_exact
+        assert estimate.row_count == pytest.approx(20000, rel=0.2)
+        actual = pd.read_csv(path).memory_usage(deep=True, index=False)
+        for column in ["integers", "strings"]:
+            assert estimate.column_bytes[column] == pytest.approx(actual[column], rel=0.2)
+
+
+class TestPlanColumnBatches:
+    def test_get_peak_memory(self):
+        assert get_peak_memory({}, 3.0) == 0
+        assert get_peak_memory({"a": 10, "b": 20}, 3.0) == 90
+
+    def test_single_batch(self):
+        assert plan_column_batches({"a": 10, "b": 20}, 90, 3.0) == [["a", "b"]]
+
+    def test_batches_preserve_order(self):
+        column_bytes = {"a": 10, "b": 10, "c": 10, "d": 10}
+        batches = plan_column_batches(column_bytes, 50, 3.0)
+        assert batches == [["a", "b"], ["c", "d"]]
+        batches = plan_column_batches(column_bytes, 50, 1.0)
+        assert batches == [["a", "b", "c", "d"]]
+        batches = plan_column_batches(column_bytes, 40, 1.0)
+        assert batches == [["a", "b", "c"], ["d"]]
+
+    def test_column_too_large(self):
+        with pytest.raises(MemoryBudgetExceededError):
+            plan_column_batches({"a": 10, "b": 100}, 100, 3.0)
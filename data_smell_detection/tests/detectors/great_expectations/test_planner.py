@@ -0,0 +1,117 @@
+import os
+
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.profile.base import ProfilerDataType
+
+from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.detector import DetectorBuilder
+from datasmelldetection.detectors.great_expectations.planner import (
+    CostModel,
+    ExecutionPlan,
+    PlannedEvaluation,
+    build_plan,
+    get_column_statistics
+)
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_data_directory = os.path.join(cwd, "tests/test_sets")
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+context = GreatExpectationsContextBuilder(
+    _test_great_expectations_directory,
+    _test_data_directory
+).build()
+dataset_manager = FileBasedDatasetManager(context=context)
+
+
+def _create_evaluation(column_name: str, cost: float) -> PlannedEvaluation:
+    return PlannedEvaluation(
+        column_name=column_name,
+        configuration=ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": column_name}
+        ),
+        data_smell_type=DataSmellType.MISSING_VALUE_SMELL,
+        estimated_cost=cost
+    )
+
+
+class TestCostModel:
+    def test_column_statistics(self):
+        statistics = get_column_statistics(pd.Series(["ab", "abcd", None, "ab"]))
+        assert statistics.mean_length == 8 / 3
+        assert statistics.distinct_ratio == 2 / 3
+        assert get_column_statistics(pd.Series([1, 2, 3])).mean_length == 0
+
+    def test_estimate(self):
+        cost_model = CostModel()
+        short_text = get_column_statistics(pd.Series(["a b"] * 10))
+        long_text = get_column_statistics(pd.Series(["lorem ipsum dolor sit amet " * 4] * 10))
+
+        missing = cost_model.estimate(DataSmellType.MISSING_VALUE_SMELL, 1000, long_text)
+        casing_short = cost_model.estimate(DataSmellType.CASING_SMELL, 1000, short_text)
+        casing_long = cost_model.estimate(DataSmellType.CASING_SMELL, 1000, long_text)
+        assert missing < casing_short < casing_long
+        # Costs grow linearly with the row count.
+        assert cost_model.estimate(DataSmellType.CASING_SMELL, 2000, long_text) == 2 * casing_long
+
+    def test_column_type(self):
+        suite = ExpectationSuite(
+            expectation_suite_name="suite",
+            expectations=[
+                ExpectationConfiguration(expectation_type="expect_column_values_to_not_be_null", kwargs={"column": x})
+                for x in ["int_col", "string_col"]
+            ],
+            meta={"columns": {
+                "int_col": {"type": str(ProfilerDataType.INT)},
+                "string_col": {"type": str(ProfilerDataType.STRING)}
+            }}
+        )
+        data_asset = pd.DataFrame({"int_col": [1, 2], "string_col": ["a", "b"]})
+        plan = build_plan(
+            suite,
+            data_asset,
+            {"expect_column_values_to_not_be_null": DataSmellType.MISSING_VALUE_SMELL},
+            CostModel()
+        )
+        # Checking strings is more expensive than checking integers.
+        assert [x.estimated_cost for x in plan.evaluations] == [2.0, 4.0]
+
+
+class TestExecutionPlan:
+    def test_get_batches(self):
+        plan = ExecutionPlan(row_count=10, evaluations=[
+            _create_evaluation("a", 1.0),
+            _create_evaluation("a", 2.0),
+            _create_evaluation("b", 3.0)
+        ])
+        assert [(x, len(y)) for x, y in plan.get_batches()] == [("a", 2), ("b", 1)]
+        assert [(x, len(y)) for x, y in plan.get_batches(split=True)] == [("a", 1), ("a", 1), ("b", 1)]
+        assert [x.estimated_cost for x in plan.sort_by_cost().evaluations] == [1.0, 2.0, 3.0]
+
+    def test_explain(self):
+        plan = ExecutionPlan(row_count=10, evaluations=[
+            _create_evaluation("a", 1.0),
+            _create_evaluation("b", 3.0)
+        ])
+        lines = plan.explain().splitlines()
+        assert len(lines) == 4
+        assert "2 evaluations" in lines[0]
+        assert DataSmellType.MISSING_VALUE_SMELL.value in lines[2]
+        assert "75.0%" in lines[3]
+
+
+class TestDetectorPlan:
+    def test_plan(self):
+        dataset = dataset_manager.get_dataset("data_smell_testset.csv")
+        detector = DetectorBuilder(context=context, dataset=dataset).build()
+        plan = detector.plan()
+        assert plan.row_count == len(dataset.get_great_expectations_dataset())
+        assert len(plan.evaluations) > 0
+        assert all(x.estimated_cost > 0 for x in plan.evaluations)
+        assert {x.column_name for x in plan.evaluations} <= dataset.get_column_names()
+        assert plan.explain().startswith("Execution plan")
@@ -9,6 +9,7 @@ from great_expectations.data_asset import DataAsset
 from great_expectations.dataset.pandas_dataset import PandasDataset
 from great_expectations.profile.base import ProfilerDataType
 
+from datasmelldetection.detectors.great_expectations.cache import LRUCache
 from datasmelldetection.detectors.great_expectations.profiler import DataSmellAwareProfiler
 # Register expectations for data smell detection
 import datasmelldetection.detectors.great_expectations.expectations
@@ -528,3 +529,66 @@ class TestDataSmellAwareProfiler:
                 process_testcase(testcase)
             except AssertionError as e:
                 raise AssertionError(f"During execution of testcase {testcase.title}: {e}")
+
+    def test_suite_cache(
+            self,
+            pandas_dataset1,
+            data_smell_registry_with_data_smell2_custom_kwargs,
+            data_smell_registry_with_data_smell2):
+        cache = LRUCache(maxsize=2)
+        original_cache = DataSmellAwareProfiler.suite_cache
+        DataSmellAwareProfiler.suite_cache = cache
+
+        def profile(registry, data_smell_configuration) -> ExpectationSuite:
+            suite, _ = DataSmellAwareProfiler().profile(
+                data_asset=pandas_dataset1,
+                profiler_configuration={
+                    "registry": registry,
+                    "data_smell_configuration": data_smell_configuration
+                }
+            )
+            return suite
+
+        try:
+            data_smell_configuration = {DataSmellType.EXTREME_VALUE_SMELL: {"threshold": 3}}
+            suite1 = profile(data_smell_registry_with_data_smell2_custom_kwargs,
+                             data_smell_configuration)
+            assert cache.misses == 1 and len(cache) == 1
+
+            # Same dataset, registry and configuration => cache hit
+            suite2 = profile(data_smell_registry_with_data_smell2_custom_kwargs,
+                             deepcopy(data_smell_configuration))
+            assert cache.hits == 1 and len(cache) == 1
+            assert suite1.expectations == suite2.expectations
+            assert suite1.meta["columns"] == suite2.meta["columns"]
+            # The meta information must not be shared.
+            assert suite1.meta["columns"] is not suite2.meta["columns"]
+
+            # Different kwargs => separate cache entry
+            suite3 = profile(data_smell_registry_with_data_smell2_custom_kwargs,
+                             {DataSmellType.EXTREME_VALUE_SMELL: {"threshold": 4}})
+            assert len(cache) == 2
+            assert all(x.kwargs["threshold"] == 4 for x in suite3.expectations)
+
+            # Different registry contents => separate cache entry. The oldest
+            # entry is evicted.
+            profile(data_smell_registry_with_data_smell2, None)
+            assert len(cache) == 2
+            profile(data_smell_registry_with_data_smell2_custom_kwargs,
+                    data_smell_configuration)
+            assert cache.misses == 4
+        finally:
+            DataSmellAwareProfiler.suite_cache = original_cache
+
+    def test_duplicated_domains_are_replaced(self, data_smell_registry_with_data_smell2):
+        column_types = [("float_col", ProfilerDataType.FLOAT)]
+        suite = DataSmellAwareProfiler.build_expectation_suite(
+            column_types * 2,
+            data_smell_registry_with_data_smell2
+        )
+        expected_suite = DataSmellAwareProfiler.build_expectation_suite(
+            column_types,
+            data_smell_registry_with_data_smell2
+        )
+        assert len(suite.expectations) == 2
+        assert suite.expectations == expected_suite.expectations
@@ -0,0 +1,59 @@
+import json
+import os
+import pstats
+import time
+
+import pytest
+
+from datasmelldetection.detectors.great_expectations.profiling import ProfileCapture
+
+
+def _busy_wait(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestProfileCapture:
+    def test_invalid_mode(self, tmp_path):
+        with pytest.raises(AssertionError):
+            ProfileCapture(str(tmp_path), mode="unknown")
+
+    def test_cprofile(self, tmp_path):
+        profile = ProfileCapture(str(tmp_path / "profiles")).start()
+        profile.resume()
+        _busy_wait(0.01)
+        profile.pause()
+        # Paused time is not profiled.
+        time.sleep(0.05)
+        path = profile.finish()
+
+        assert path is not None and path.endswith(".prof")
+        assert os.path.dirname(path) == str(tmp_path / "profiles")
+        assert 0.01 <= profile.wall_time < 0.05
+        stats = pstats.Stats(path)
+        assert any(x[2] == "_busy_wait" for x in stats.stats.keys())
+
+    def test_sampling(self, tmp_path):
+        profile = ProfileCapture(str(tmp_path), mode="sampling", sampling_interval=0.001).start()
+        profile.resume()
+        _busy_wait(0.1)
+        path = profile.finish()
+
+        assert path is not None and path.endswith(".speedscope.json")
+        with open(path, encoding="utf-8") as file:
+            content = json.load(file)
+        frames = content["shared"]["frames"]
+        samples = content["profiles"][0]["samples"]
+        assert len(samples) > 0
+        assert len(samples) == len(content["profiles"][0]["weights"])
+        assert any(frames[sample[-1]]["name"] == "_busy_wait" for sample in samples)
+
+    @pytest.mark.parametrize("mode", ProfileCapture.modes)
+    def test_threshold(self, tmp_path, mode):
+        profile = ProfileCapture(str(tmp_path), mode=mode, threshold=10.0).start()
+        profile.resume()
+        _busy_wait(0.01)
+        # Fast runs are discarded.
+        assert profile.finish() is None
+        assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,189 @@
+import os
+from functools import reduce
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datasmelldetection.detectors.great_expectations.artifacts import get_sorted_view
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.datasmell import (
+    DataSmellType
+)
+from datasmelldetection.detectors.great_expectations.detector import (
+    DetectorBuilder,
+    DataSmellAwareConfiguration,
+    ResultDetail
+)
+from datasmelldetection.detectors.great_expectations.sharding import (
+    ShardedDetector,
+    read_csv_shard,
+    split_csv,
+    split_rows
+)
+from datasmelldetection.detectors.great_expectations.summaries import (
+    DuplicateSummary,
+    Moments,
+    SignSummary
+)
+from .fixtures import data_smell_registry_testset
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_data_directory = os.path.join(cwd, "tests/test_sets")
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+_test_path = os.path.join(_test_data_directory, "data_smell_testset.csv")
+context_builder = GreatExpectationsContextBuilder(
+    _test_great_expectations_directory,
+    _test_data_directory
+)
+context = context_builder.build()
+dataset_manager = FileBasedDatasetManager(context=context)
+
+
+# Split random values into parts of random size.
+def _split(values: np.ndarray, rng: np.random.Generator, part_count: int = 4) -> List[np.ndarray]:
+    boundaries = np.sort(rng.integers(0, len(values) + 1, size=part_count - 1))
+    return np.split(values, boundaries)
+
+
+class TestSplitCsv:
+    @pytest.mark.parametrize("shard_count", [1, 2, 3, 5, 100])
+    def test_ranges(self, shard_count):
+        ranges = split_csv(_test_path, shard_count)
+        with open(_test_path, "rb") as file:
+            content = file.read()
+        header_length = content.index(b"\n") + 1
+
+        assert 1 <= len(ranges) <= shard_count
+        assert ranges[0].start == header_length
+        assert ranges[-1].stop == len(content)
+        for first, second in zip(ranges, ranges[1:]):
+            assert first.stop == second.start
+            assert content[first.stop - 1:first.stop] == b"\n"
+
+        # The shards contain all rows in order.
+        data_frame = pd.read_csv(_test_path)
+        shards = []
+        row_offset = 0
+        for byte_range in ranges:
+            shard = read_csv_shard(_test_path, byte_range, dtypes=data_frame.dtypes.to_dict(), row_offset=row_offset)
+            row_offset += len(shard)
+            shards.append(shard)
+        pd.testing.assert_frame_equal(pd.concat(shards), data_frame)
+
+
+class TestSplitRows:
+    @pytest.mark.parametrize("row_count,shard_count", [(10, 1), (10, 3), (2, 5), (0, 2)])
+    def test_ranges(self, row_count, shard_count):
+        ranges = split_rows(row_count, shard_count)
+        assert 1 <= len(ranges) <= shard_count
+        assert ranges[0][0] == 0 and ranges[-1][1] == row_count
+        # The ranges are contiguous and not empty (unless there are no rows).
+        assert all(x[1] == y[0] for x, y in zip(ranges, ranges[1:]))
+        assert all(x[0] < x[1] for x in ranges) or row_count == 0
+
+
+class TestSummaries:
+    def test_moments(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(5, 3, size=1000)
+        parts = _split(values, rng)
+        moments = reduce(Moments.merge, [Moments.from_values(x) for x in parts])
+        mean, standard_deviation = moments.get_mean_and_standard_deviation()
+        assert moments.count == len(values)
+        assert mean == pytest.approx(pd.Series(values).mean())
+        assert standard_deviation == pytest.approx(pd.Series(values).std())
+        assert np.isnan(Moments().get_mean_and_standard_deviation()[0])
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_sign_summary(self, seed):
+        rng = np.random.default_rng(seed)
+        values = rng.integers(-5, 5, size=rng.integers(1, 30)) * rng.choice([0.5, 1.0])
+        values = values + rng.choice([0, 3, -3])
+        percentile_threshold = rng.choice([0.1, 0.25, 0.4])
+        summary = reduce(SignSummary.merge, [SignSummary.from_values(x) for x in _split(values, rng)])
+
+        q0, q1 = get_sorted_view(pd.Series(values)).quantiles([percentile_threshold, 1 - percentile_threshold])
+        expected = 1 if q0 >= 0 else -1 if q1 <= 0 else 0
+        assert summary.get_majority_sign(percentile_threshold) == expected
+
+    def test_duplicate_summary(self):
+        rng = np.random.default_rng(0)
+        values = pd.Series(rng.choice(["a", "b", "c", "d", "e", 1, 2.5], size=40))
+        parts = _split(values.to_numpy(), rng)
+        summary = reduce(DuplicateSummary.merge, [DuplicateSummary.from_values(pd.Series(x)) for x in parts])
+        assert set(summary.distinct_values) == set(values)
+        assert set(summary.duplicated_values) == set(values[values.duplicated(keep=False)])
+
+
+class TestShardedDetector:
+    _configuration = DataSmellAwareConfiguration(
+        column_names=None,
+        data_smell_configuration={
+            DataSmellType.EXTREME_VALUE_SMELL: {"mostly": 1, "threshold": 2},
+            DataSmellType.SUSPECT_SIGN_SMELL: {"mostly": 1, "percentile_threshold": 0.25},
+            DataSmellType.INTEGER_AS_FLOATING_POINT_NUMBER_SMELL: {"mostly": 0.6, "epsilon": 0.15},
+            DataSmellType.LONG_DATA_VALUE_SMELL: {"mostly": 1, "length_threshold": 30},
+            DataSmellType.INTEGER_AS_STRING_SMELL: {"mostly": 0.2},
+            DataSmellType.FLOATING_POINT_NUMBER_AS_STRING_SMELL: {"mostly": 0.2},
+            DataSmellType.CASING_SMELL: {"mostly": 1, "same_case_wordcount_threshold": 2},
+            DataSmellType.DUPLICATED_VALUE_SMELL: {"mostly": 1}
+        },
+        result_detail=ResultDetail.COMPLETE
+    )
+
+    @pytest.mark.parametrize("processes", [1, 2])
+    @pytest.mark.parametrize("shard_count", [1, 3])
+    def test_results_equal_single_process_results(self, data_smell_registry_testset, processes, shard_count):
+        dataset = dataset_manager.get_dataset("data_smell_testset.csv", lazy=True)
+        expected = DetectorBuilder(context=context, dataset=dataset_manager.get_dataset("data_smell_testset.csv")).\
+            set_registry(data_smell_registry_testset).\
+            set_configuration(self._configuration).\
+            build().\
+            detect()
+        actual = ShardedDetector(
+            dataset,
+            configuration=self._configuration,
+            registry=data_smell_registry_testset,
+            shard_count=shard_count,
+            processes=processes
+        ).detect()
+
+        def is_exact(result) -> bool:
+            return result.data_smell_type != DataSmellType.EXTREME_VALUE_SMELL
+
+        # The mean and the standard deviation of the Extreme Value Smell may
+        # differ by rounding errors.
+        assert [x for x in actual if is_exact(x)] == [x for x in expected if is_exact(x)]
+        assert [x.column_name for x in actual if not is_exact(x)] == \
+            [x.column_name for x in expected if not is_exact(x)]
+
+    def test_loaded_dataset_is_shared(self, data_smell_registry_testset):
+        dataset = dataset_manager.get_dataset("data_smell_testset.csv")
+        assert dataset.is_loaded()
+        expected = DetectorBuilder(context=context, dataset=dataset).\
+            set_registry(data_smell_registry_testset).\
+            set_configuration(self._configuration).\
+            build().\
+            detect()
+        # The workers attach to the columns of the loaded dataset.
+        actual = ShardedDetector(
+            dataset,
+            configuration=self._configuration,
+            registry=data_smell_registry_testset,
+            shard_count=3,
+            processes=2
+        ).detect()
+        assert [x.column_name for x in actual] == [x.column_name for x in expected]
+        assert [x.data_smell_type for x in actual] == [x.data_smell_type for x in expected]
+        assert [x.faulty_elements for x in actual if x.data_smell_type != DataSmellType.EXTREME_VALUE_SMELL] == \
+            [x.faulty_elements for x in expected if x.data_smell_type != DataSmellType.EXTREME_VALUE_SMELL]
+
+    def test_supported_data_smell_types(self, data_smell_registry_testset):
+        dataset = dataset_manager.get_dataset("data_smell_testset.csv", lazy=True)
+        detector = ShardedDetector(dataset, configuration=self._configuration, registry=data_smell_registry_testset)
+        assert detector.get_supported_data_smell_types() == data_smell_registry_testset.get_registered_data_smells()
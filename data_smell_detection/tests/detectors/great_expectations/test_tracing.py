@@ -0,0 +1,172 @@
+import json
+import os
+
+import pytest
+
+from datasmelldetection.detectors.great_expectations.context import GreatExpectationsContextBuilder
+from datasmelldetection.detectors.great_expectations.dataset import FileBasedDatasetManager
+from datasmelldetection.detectors.great_expectations.detector import DetectorBuilder
+from datasmelldetection.detectors.great_expectations.tracing import (
+    Tracer,
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    default_tracer
+)
+
+cwd = os.getcwd()
+
+# NOTE: From view of root directory of package
+_test_data_directory = os.path.join(cwd, "tests/test_sets")
+_test_great_expectations_directory = os.path.join(cwd, "../great_expectations")
+
+
+class TestTracer:
+    def test_disabled(self):
+        tracer = Tracer()
+        assert not tracer.enabled
+        with tracer.span("operation") as span:
+            assert span is None
+            assert tracer.current_span() is None
+
+    def test_nested_spans(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter=exporter)
+        with tracer.span("parent", key="value") as parent:
+            assert tracer.current_span() is parent
+            with tracer.span("child") as child:
+                assert tracer.current_span() is child
+        assert tracer.current_span() is None
+        with tracer.span("other"):
+            pass
+
+        child, parent, other = exporter.spans
+        assert parent.name == "parent"
+        assert parent.attributes == {"key": "value"}
+        assert parent.parent_id is None
+        assert child.parent_id == parent.span_id
+        assert child.trace_id == parent.trace_id
+        assert parent.duration >= child.duration >= 0
+        # A new trace is started for each root span.
+        assert other.trace_id != parent.trace_id
+
+    def test_error(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter=exporter)
+        with pytest.raises(ValueError):
+            with tracer.span("operation"):
+                raise ValueError("test")
+        assert "ValueError" in exporter.spans[0].error
+        assert tracer.current_span() is None
+
+    def test_generator_exit(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter=exporter)
+
+        def generate():
+            with tracer.span("generator"):
+                yield 1
+                yield 2
+
+        iterator = generate()
+        next(iterator)
+        iterator.close()
+        assert exporter.spans[0].error is None
+
+    def test_pausable_span(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter=exporter)
+        span = tracer.start_span("operation", key="value")
+        assert tracer.current_span() is None
+        span.resume()
+        with tracer.span("child"):
+            pass
+        span.pause()
+        with tracer.span("other"):
+            pass
+        span.resume()
+        span.finish(ValueError("test"))
+        assert tracer.current_span() is None
+
+        child, other, operation = exporter.spans
+        assert operation.attributes == {"key": "value"}
+        assert "ValueError" in operation.error
+        assert child.parent_id == operation.span_id
+        assert other.parent_id is None
+        # Finishing twice exports the span once.
+        span.finish()
+        assert len(exporter.spans) == 3
+
+    def test_json_lines_exporter(self, tmp_path):
+        path = str(tmp_path / "traces.jsonl")
+        tracer = Tracer()
+        tracer.enable(path=path)
+        assert isinstance(tracer.exporter, JsonLinesSpanExporter)
+        with tracer.span("parent"):
+            with tracer.span("child", column_name="int1"):
+                pass
+        tracer.disable()
+        with tracer.span("ignored"):
+            pass
+
+        with open(path, encoding="utf-8") as file:
+            lines = [json.loads(line) for line in file]
+        assert [x["name"] for x in lines] == ["child", "parent"]
+        assert lines[0]["attributes"] == {"column_name": "int1"}
+        assert lines[0]["parent_id"] == lines[1]["span_id"]
+
+
+class TestDetectionTracing:
+    def test_detection_spans(self):
+        context = GreatExpectationsContextBuilder(
+            _test_great_expectations_directory,
+            _test_data_directory
+        ).build()
+        exporter = InMemorySpanExporter()
+        default_tracer.enable(exporter=exporter)
+        try:
+            dataset = FileBasedDatasetManager(context).get_dataset("data_smell_testset.csv")
+            DetectorBuilder(context=context, dataset=dataset).build().detect()
+        finally:
+            default_tracer.disable()
+
+        spans = {}
+        for span in exporter.spans:
+            spans.setdefault(span.name, []).append(span)
+        assert {
+            "dataset_manager.get_dataset",
+            "detector.detect",
+            "profiler.profile",
+            "detector.load_dataset",
+            "detector.validate",
+            "converter.convert"
+        } <= set(spans.keys())
+
+        detect_span = spans["detector.detect"][0]
+        for name in ["profiler.profile", "detector.load_dataset", "detector.validate", "converter.convert"]:
+            for span in spans[name]:
+                assert span.parent_id == detect_span.span_id
+        # One validation span per column
+        column_names = [x.attributes["column_name"] for x in spans["detector.validate"]]
+        assert len(column_names) == len(set(column_names)) == len(dataset.get_column_names())
+
+    def test_consumer_is_not_traced(self):
+        context = GreatExpectationsContextBuilder(
+            _test_great_expectations_directory,
+            _test_data_directory
+        ).build()
+        exporter = InMemorySpanExporter()
+        default_tracer.enable(exporter=exporter)
+        try:
+            dataset = FileBasedDatasetManager(context).get_dataset("data_smell_testset.csv")
+            iterator = DetectorBuilder(context=context, dataset=dataset).build().detect_iter()
+            next(iterator)
+            with default_tracer.span("consumer"):
+                pass
+            # Abandon the remaining results.
+            iterator.close()
+        finally:
+            default_tracer.disable()
+
+        spans = {x.name: x for x in exporter.spans}
+        assert spans["consumer"].parent_id is None
+        assert spans["detector.detect"].error is None
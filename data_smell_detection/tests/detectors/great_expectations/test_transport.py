@@ -0,0 +1,75 @@
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datasmelldetection.detectors.great_expectations.transport import (
+    AttachedFrame,
+    SharedFrame,
+    SharedFrameHandle,
+    is_shared_memory_available
+)
+
+_use_shared_memory_values = [False, True] if is_shared_memory_available() else [False]
+
+
+def _create_data_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "integers": [1, -2, 3, 4],
+        "floats": [1.5, np.nan, -3.25, 0.0],
+        "booleans": [True, False, False, True],
+        "strings": ["a", np.nan, "äöü", "a"],
+        "mixed": ["a", 1, 2.5, None],
+        "empty_strings": pd.Series([np.nan] * 4, dtype=object)
+    })
+
+
+# Executed in a worker process
+def _sum_column(handle: SharedFrameHandle, column_name: str) -> float:
+    with AttachedFrame(handle) as frame:
+        return float(frame.get_column(column_name).sum())
+
+
+@pytest.mark.parametrize("use_shared_memory", _use_shared_memory_values)
+class TestSharedFrame:
+    def test_round_trip(self, use_shared_memory):
+        data_frame = _create_data_frame()
+        with SharedFrame(data_frame, use_shared_memory=use_shared_memory) as shared_frame:
+            handle = shared_frame.handle
+            assert handle.column_names == list(data_frame.columns)
+            assert handle.get_column("strings").is_encoded
+            assert handle.get_column("mixed").pickled is not None
+            assert shared_frame.nbytes > 0
+
+            with AttachedFrame(handle) as frame:
+                assert len(frame) == 4
+                pd.testing.assert_frame_equal(frame.to_data_frame(), data_frame)
+                pd.testing.assert_frame_equal(
+                    frame.to_data_frame(["strings", "floats"], rows=(1, 3)),
+                    data_frame[["strings", "floats"]].iloc[1:3]
+                )
+
+    def test_numeric_columns_are_not_copied(self, use_shared_memory):
+        data_frame = pd.DataFrame({"values": np.arange(1000, dtype=np.float64)})
+        with SharedFrame(data_frame, use_shared_memory=use_shared_memory) as shared_frame:
+            with AttachedFrame(shared_frame.handle) as frame:
+                first = frame.get_column("values")
+                second = frame.get_column("values", rows=(10, 20))
+                assert np.shares_memory(first.to_numpy(), second.to_numpy())
+                assert not first.to_numpy().flags.writeable
+                assert second.index.tolist() == list(range(10, 20))
+                del first, second
+
+    def test_empty_frame(self, use_shared_memory):
+        data_frame = pd.DataFrame({"integers": pd.Series([], dtype=np.int64)})
+        with SharedFrame(data_frame, use_shared_memory=use_shared_memory) as shared_frame:
+            with AttachedFrame(shared_frame.handle) as frame:
+                assert len(frame.get_column("integers")) == 0
+
+    def test_worker_process(self, use_shared_memory):
+        data_frame = pd.DataFrame({"values": np.arange(100, dtype=np.int64)})
+        with SharedFrame(data_frame, use_shared_memory=use_shared_memory) as shared_frame:
+            with multiprocessing.Pool(2) as pool:
+                result = pool.apply(_sum_column, (shared_frame.handle, "values"))
+        assert result == float(data_frame["values"].sum())
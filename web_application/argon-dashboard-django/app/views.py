@@ -14,7 +14,7 @@ import sys
 import time
 from app.models import File, Column, DetectedSmell, SmellType, Parameter
 from app import forms
-from core.settings import SMELL_FOLDER, BASE_DIR, CORE_DIR, LIBRARY_DIR
+from core.settings import SMELL_FOLDER, BASE_DIR, CORE_DIR, LIBRARY_DIR, TRACE_FILE, PROFILE_DIRECTORY, PROFILE_THRESHOLD, PROFILE_MODE, DETECTION_MAX_MEMORY, DETECTION_TIME_BUDGET
 from django.contrib.auth.models import User
 import json
 cwd = os.getcwd()
@@ -27,9 +27,16 @@ from datasmelldetection.detectors.great_expectations.profiler import DataSmellAw
 from datasmelldetection.detectors.great_expectations.detector import DataSmellAwareConfiguration
 from datasmelldetection.core.detector import DetectionStatistics, DetectionResult
 from datasmelldetection.core.datasmells import DataSmellType
+from datasmelldetection.detectors.great_expectations.tracing import default_tracer
+from datasmelldetection.detectors.great_expectations.profiling import ProfileCapture
+from datasmelldetection.detectors.great_expectations.memory import MemoryBudgetExceededError
 from django.contrib import messages 
 
 
+# Trace data smell detection if a trace file is configured
+if TRACE_FILE:
+    default_tracer.enable(path=TRACE_FILE)
+
 # Different smells by its category
 with open(SMELL_FOLDER+'smells.json') as json_file:
     data = json.load(json_file)
@@ -85,7 +92,7 @@ def upload(request):
         os.path.join(outer, "../great_expectations"),
         os.path.join(cwd, "core/media")
     )
-    con = context_builder.build()
+    con = context_builder.build_cached()
     manager = FileBasedDatasetManager(context=con)
     context = {}
 
@@ -102,7 +109,7 @@ def upload(request):
             file1 = File(file_name=file_name, user=request.user) if request.user.is_authenticated else File(file_name=file_name, user=dummy_user)
             file1.save()
             
-            dataset = manager.get_dataset(file_name)
+            dataset = manager.get_dataset(file_name, lazy=True)
             detector = DetectorBuilder(context=con, dataset=dataset).build()
             supported_smells = detector.get_supported_data_smell_types()
             
@@ -301,7 +308,7 @@ def result(request):
         os.path.join(outer, "../great_expectations"),
         os.path.join(cwd, "core/media")
     )
-    con = context_builder.build()
+    con = context_builder.build_cached()
     manager = FileBasedDatasetManager(context=con)
     
     if request.user.is_authenticated:
@@ -312,7 +319,7 @@ def result(request):
     # Get file for detection
     try:
         file1 = File.objects.filter(user_id=current_user_id).latest("uploaded_time")
-        dataset = manager.get_dataset(file1.file_name)
+        dataset = manager.get_dataset(file1.file_name, lazy=True)
         column_names = [c.column_name for c in list(Column.objects.all().filter(belonging_file=file1))]
         smells = list(SmellType.objects.all().filter(belonging_file=file1))
         
@@ -329,12 +336,27 @@ def result(request):
 
         conf = DataSmellAwareConfiguration(
             column_names=column_names,
-            data_smell_configuration=ds_config
+            data_smell_configuration=ds_config,
+            max_memory=DETECTION_MAX_MEMORY or None,
+            time_budget=DETECTION_TIME_BUDGET or None
         )
-        detector = DetectorBuilder(context=con, dataset=dataset).set_configuration(conf).build() 
-
-        # Detect smells and sort result
-        detected_smells = detector.detect()
+        builder = DetectorBuilder(context=con, dataset=dataset).set_configuration(conf)
+        # Capture profiles of slow detection runs if a profile directory is configured
+        if PROFILE_DIRECTORY:
+            builder.set_profile_capture(ProfileCapture(PROFILE_DIRECTORY, mode=PROFILE_MODE, threshold=PROFILE_THRESHOLD))
+        detector = builder.build()
+
+        # Detect smells and save each detected smell to database as soon as it is available
+        detected_smells = []
+        with default_tracer.span("web.result", path=request.path, file_name=file1.file_name):
+            for v in detector.detect_iter():
+                if v.column_name in column_names:
+                    column1 = Column.objects.get(column_name=v.column_name, belonging_file=file1)
+                    data_smell_t = SmellType.objects.get(smell_type=v.data_smell_type.value)
+                    DetectedSmell.objects.create(data_smell_type=data_smell_t, total_element_count=v.statistics.total_element_count, faulty_element_count=v.statistics.faulty_element_count, faulty_list=v.faulty_elements, belonging_column=column1)
+                detected_smells.append(v)
+
+        # Sort result
         sorted_results = {}
         for c in column_names:
             if c in [i.column_name for i in detected_smells]:
@@ -343,22 +365,19 @@ def result(request):
                     if s.column_name == c:
                         sorted_results[c].append(s)
 
-        # Save detected smell to database
-        for key, value in sorted_results.items():
-            column1 = Column.objects.get(column_name=key, belonging_file=file1)
-            for v in value:
-                data_smell_t = SmellType.objects.get(smell_type=v.data_smell_type.value)
-                DetectedSmell.objects.create(data_smell_type=data_smell_t, total_element_count=v.statistics.total_element_count, faulty_element_count=v.statistics.faulty_element_count, faulty_list=v.faulty_elements, belonging_column=column1)
-        
         context['column_names'] = column_names
         context['results'] = sorted_results
         context['file'] = file1.file_name
+        # Checks which were skipped to meet the time budget
+        context['skipped_count'] = len(detector.run_report.skipped_evaluations)
 
         # Delete file and detection result if button submit
         if request.method == 'POST':
             File.objects.get(file_name=file1.file_name).delete()
             context['delete_message'] = 'Result deleted and not viewable in Saved Results.'
 
+    except MemoryBudgetExceededError:
+        context['no_result'] = 'The file is too large to be checked within the available memory.'
     except:
         context['no_result'] = 'No detection result for this user available.'
 
@@ -383,7 +402,7 @@ def saved(request):
         os.path.join(outer, "../great_expectations"),
         os.path.join(cwd, "core/media")
     )
-    con = context_builder.build()
+    con = context_builder.build_cached()
     manager = FileBasedDatasetManager(context=con)
 
     current_user_id = request.user.id if request.user.is_authenticated else dummy_user.id
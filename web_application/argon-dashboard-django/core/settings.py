@@ -22,6 +22,23 @@ SECRET_KEY = config('SECRET_KEY', default='S#perS3crEt_1122')
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = config('DEBUG', default=True, cast=bool)
 
+# Append tracing spans of data smell detection to this JSON lines file (disabled if empty)
+TRACE_FILE = config('TRACE_FILE', default='')
+
+# Write profiles of detection runs to this directory (disabled if empty). Only runs which take at least
+# PROFILE_THRESHOLD seconds are written. PROFILE_MODE is either "cprofile" (pstats) or "sampling" (speedscope).
+PROFILE_DIRECTORY = config('PROFILE_DIRECTORY', default='')
+PROFILE_THRESHOLD = config('PROFILE_THRESHOLD', default=10.0, cast=float)
+PROFILE_MODE = config('PROFILE_MODE', default='sampling')
+
+# Memory budget in bytes for data smell detection (disabled if 0). Files whose estimated footprint exceeds the
+# budget are loaded and checked in column batches.
+DETECTION_MAX_MEMORY = config('DETECTION_MAX_MEMORY', default=0, cast=int)
+
+# Time budget in seconds for data smell detection (disabled if 0). Cheap checks are run first and the remaining checks
+# are skipped once the budget is used up, so that partial results are shown instead of waiting for all checks.
+DETECTION_TIME_BUDGET = config('DETECTION_TIME_BUDGET', default=0, cast=float)
+
 # load production server from .env
 ALLOWED_HOSTS = ['localhost', '127.0.0.1', config('SERVER', default='127.0.0.1')]
 